@@ -0,0 +1,22 @@
+"""
+    Name: Benchmarks Package Init file
+    Description: Make Benchmarks directory a package, so benchmarks can be run from the project
+                 directory with "python -m Benchmarks.<benchmark>"
+
+    Date Created: 10/18/2026
+    Revisions:
+        - None
+
+    Preconditions:
+        - Benchmarks are run from the project directory (where main.py is)
+    Postconditions:
+        - None
+    Errors/Exceptions:
+        - None
+    Side Effects:
+        - None
+    Invariants:
+        - Benchmarks never touch busybee.db, they use temporary databases
+    Known Faults:
+        - None
+"""
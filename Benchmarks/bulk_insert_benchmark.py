@@ -0,0 +1,135 @@
+"""
+    Name: Bulk Insert Benchmark
+    Description: Counts the SQL statements and time of writing a 1,000-occurrence weekly task series (with two
+                 categories) four ways: one ORM task per occurrence flushed one at a time (how series were saved
+                 before they were stored once), the same with a single flush, bulk.insert_items(), and the series
+                 itself (one task and its recurrence, how it's saved now)
+
+    Date Created: 10/18/2026
+    Revisions:
+        - None
+
+    Usage:
+        python -m Benchmarks.bulk_insert_benchmark [--occurrences 1000]
+
+    Preconditions:
+        - SQLAlchemy must be installed and configured in the environment
+    Postconditions:
+        - Prints the statements and time of each strategy
+    Errors/Exceptions:
+        - Exits with status 1 if the bulk insert runs more than 4 statements, or writes different tasks than the ORM
+    Side Effects:
+        - Creates (and deletes) temporary databases
+    Invariants:
+        - busybee.db isn't touched
+    Known Faults:
+        - None
+"""
+
+
+# Imports
+import argparse
+import os
+import sys
+import tempfile
+from datetime import datetime, timedelta
+from time import perf_counter
+from sqlalchemy import select
+from Models import Task, Category
+from Models.databaseEnums import Frequency, Priority
+from occurrences import update_series
+from bulk import insert_items
+from Benchmarks.todo_query_count import StatementCounter
+import database
+
+
+START = datetime(2026, 1, 5, 9)
+
+
+def occurrence(i:int) -> dict:
+    """Column values of the i-th weekly occurrence"""
+    return {"name": "Lab report", "notes": "Weekly", "due_date": START + timedelta(weeks=i), "priority": Priority.HIGH}
+
+
+def orm_one_at_a_time(session, categories, occurrences:int):
+    """One task per occurrence, added and flushed one at a time"""
+    for i in range(occurrences):
+        task = Task(**occurrence(i))
+        task.categories = list(categories)
+        session.add(task)
+        session.flush()
+    session.commit()
+
+
+def orm_one_flush(session, categories, occurrences:int):
+    """One task per occurrence, all flushed at once"""
+    for i in range(occurrences):
+        task = Task(**occurrence(i))
+        task.categories = list(categories)
+        session.add(task)
+    session.commit()
+
+
+def bulk(session, categories, occurrences:int):
+    """One task per occurrence, with bulk.insert_items()"""
+    category_ids = [category.id for category in categories]
+    insert_items(session, Task, [occurrence(i) for i in range(occurrences)], [category_ids] * occurrences)
+    session.commit()
+
+
+def series(session, categories, occurrences:int):
+    """The series, stored once (AddTaskModal.save_task())"""
+    task = Task(**occurrence(0))
+    task.categories = list(categories)
+    session.add(task)
+    update_series(session, task, Frequency.WEEKLY, occurrences)
+    session.commit()
+
+
+def written(session) -> list[tuple]:
+    """The tasks in the database and their category names, to compare strategies"""
+    tasks = session.scalars(select(Task).order_by(Task.due_date)).all()
+    return [(task.name, task.notes, task.due_date, task.priority, task.complete, sorted(c.name for c in task.categories)) for task in tasks]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Count the statements of writing a series one task per occurrence")
+    parser.add_argument("--occurrences", type=int, default=1000, help="number of occurrences in the series")
+    args = parser.parse_args()
+
+    failed = False
+    results = {}
+    print(f"{'strategy':18} {'statements':>10} {'time':>10}")
+    for name, write in (("ORM, flush each", orm_one_at_a_time), ("ORM, one flush", orm_one_flush),
+                        ("bulk insert", bulk), ("series (stored)", series)):
+        with tempfile.TemporaryDirectory() as directory:
+            db = database.Database(os.path.join(directory, "bulk_insert.db"))
+            with db.get_session() as session:
+                categories = [Category(name="School", color_hex="#FF0000"), Category(name="Lab", color_hex="#00FF00")]
+                session.add_all(categories)
+                session.commit()
+                [category.id for category in categories] # reload them after the commit, before counting
+
+                with StatementCounter(db.engine) as counter:
+                    start = perf_counter()
+                    write(session, categories, args.occurrences)
+                    ms = (perf_counter() - start) * 1000
+
+            with db.get_session() as session:
+                results[name] = written(session)
+            db.dispose()
+
+        print(f"{name:18} {counter.count:10} {ms:8.1f}ms")
+        if name == "bulk insert" and counter.count > 4:
+            failed = True
+            print("    expected at most 4 statements")
+
+    if results["bulk insert"] != results["ORM, one flush"]:
+        failed = True
+        print("    the bulk insert wrote different tasks than the ORM")
+
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,181 @@
+"""
+    Name: Dataset
+    Description: Seeded generator of synthetic BusyBee databases for benchmarks. Fills a database with a given number
+                 of events and tasks spread over a date range, categories, items with several categories, recurring
+                 series, and deleted occurrences of series. The same DatasetSpec (and GENERATOR_VERSION) always
+                 writes the same rows, so timings on it can be compared across runs and commits
+
+    Date Created: 10/18/2026
+    Revisions:
+        - None
+
+    Usage:
+        python -m Benchmarks.dataset busybee-100k.db [--items 100000] [--seed 0] [--task-share 0.3]
+
+        spec = DatasetSpec(items=10000, seed=1)
+        summary = generate(database.Database("bench.db"), spec)
+
+    Preconditions:
+        - SQLAlchemy must be installed and configured in the environment
+        - The database must be empty (ids are allocated after the largest existing id)
+    Postconditions:
+        - The database has spec.items events and tasks, committed in batches
+    Errors/Exceptions:
+        - ValueError if a share in the spec isn't between 0 and 1
+    Side Effects:
+        - Writes to the given database
+    Invariants:
+        - Only the spec decides the rows, not the time or the machine
+    Known Faults:
+        - c_created/i_created and the other timestamp columns get the time they're inserted
+"""
+
+
+# Imports
+import argparse
+import os
+import random
+from datetime import datetime, timedelta
+from typing import NamedTuple
+import database
+from bulk import insert_exceptions, insert_items, insert_recurrences
+from Models import Category, Event_, Task
+from Models.databaseEnums import Frequency, Priority
+
+
+GENERATOR_VERSION = 1 # bumped whenever the same spec would generate different rows
+BATCH = 50000 # items generated and inserted at a time
+WORDS = ("lab lecture meeting review exam essay project standup dentist gym practice report reading seminar dinner "
+         "call groceries laundry interview quiz").split() # words the names are made of
+PLACES = ("Eaton Hall", "Learned Hall", "Malott Hall", "Anschutz Library", "Rec Center", "Online") # places of events
+SERIES = ( # frequency of a series, and the most times it repeats
+    (Frequency.DAILY, 30), (Frequency.WEEKLY, 52), (Frequency.MONTHLY, 24), (Frequency.YEARLY, 5),
+)
+
+
+class DatasetSpec(NamedTuple):
+    """What generate() writes, see the module description"""
+    items: int # events and tasks
+    seed: int = 0 # seed of the random numbers, same spec, same rows
+    task_share: float = 0.3 # share of the items that are tasks, the rest are events
+    categories: int = 20 # categories the items are in
+    max_categories: int = 3 # most categories of an item (0 to max, so some items have several)
+    recurring_share: float = 0.02 # share of the items that are recurring series
+    deleted_share: float = 0.2 # share of the series with a deleted occurrence
+    start: datetime = datetime(2026, 1, 1) # first day items are on
+    days: int = 730 # days the items are spread over
+
+    def name(self) -> str:
+        """A file name for the database of this spec, e.g. dataset-10000-seed0-v1.db"""
+        return f"dataset-{self.items}-seed{self.seed}-v{GENERATOR_VERSION}.db"
+
+
+class DatasetSummary(NamedTuple):
+    """What generate() wrote"""
+    events: int
+    tasks: int
+    categories: int
+    category_links: int # item -> category links
+    series: int # recurring events and tasks
+    deleted_occurrences: int
+
+
+def generate(db:database.Database, spec:DatasetSpec) -> DatasetSummary:
+    """
+    Fills an empty database with the spec's items (see the module description)
+
+    Parameters:
+        db (Database): database to fill
+        spec (DatasetSpec): what to generate
+
+    Returns:
+        DatasetSummary: what was written
+
+    Raises:
+        ValueError: if task_share, recurring_share or deleted_share isn't between 0 and 1
+    """
+    for share in ("task_share", "recurring_share", "deleted_share"):
+        if not 0 <= getattr(spec, share) <= 1:
+            raise ValueError(f"Invalid {share}: {getattr(spec, share)}, expected a number between 0 and 1")
+
+    rng = random.Random(spec.seed)
+    minutes = spec.days * 24 * 60
+    counts = {"events": 0, "tasks": 0, "links": 0, "series": 0, "deleted": 0}
+
+    with db.get_session() as session:
+        categories = [Category(name=f"{WORDS[i % len(WORDS)].title()} {i}", color_hex=f"{rng.randrange(0x1000000):06X}")
+                      for i in range(spec.categories)]
+        session.add_all(categories)
+        session.commit()
+        category_ids = [category.id for category in categories]
+
+        for first in range(0, spec.items, BATCH):
+            rows = {Event_: [], Task: []}
+            links = {Event_: [], Task: []}
+            series = [] # (model, index in rows, frequency, times, first time)
+            for i in range(first, min(first + BATCH, spec.items)):
+                model = Task if rng.random() < spec.task_share else Event_
+                time = spec.start + timedelta(minutes=rng.randrange(minutes))
+                name = f"{rng.choice(WORDS).title()} {rng.choice(WORDS)} {i}"
+                if model is Event_:
+                    row = {"name": name, "notes": f"Notes about {name}", "place": rng.choice(PLACES), "start_time": time,
+                           "recurrence_id": None}
+                else:
+                    row = {"name": name, "notes": "", "due_date": time if rng.random() < 0.9 else None,
+                           "priority": rng.choice((None, Priority.LOW, Priority.MEDIUM, Priority.HIGH)),
+                           "complete": rng.random() < 0.2, "recurrence_id": None}
+
+                if rng.random() < spec.recurring_share and (model is Event_ or row["due_date"] is not None):
+                    frequency, most = rng.choice(SERIES)
+                    series.append((model, len(rows[model]), frequency, rng.randint(2, most), time))
+
+                rows[model].append(row)
+                links[model].append(rng.sample(category_ids, rng.randint(0, min(spec.max_categories, len(category_ids)))))
+
+            # recurrences first, the items' recurrence_id points to them
+            recurrence_ids = insert_recurrences(session, [{"frequency": frequency, "times": times}
+                                                          for model, index, frequency, times, time in series])
+            exceptions = []
+            for recurrence_id, (model, index, frequency, times, time) in zip(recurrence_ids, series):
+                rows[model][index]["recurrence_id"] = recurrence_id
+                if rng.random() < spec.deleted_share:
+                    exceptions.append({"recurrence_id": recurrence_id, "item_id": None,
+                                       "occurrence_time": frequency.nth_date(time, rng.randrange(1, times))})
+
+            for model in (Event_, Task):
+                insert_items(session, model, rows[model], links[model])
+            insert_exceptions(session, exceptions)
+            session.commit()
+
+            counts["events"] += len(rows[Event_])
+            counts["tasks"] += len(rows[Task])
+            counts["links"] += sum(len(ids) for model in (Event_, Task) for ids in links[model])
+            counts["series"] += len(series)
+            counts["deleted"] += len(exceptions)
+
+    return DatasetSummary(counts["events"], counts["tasks"], spec.categories, counts["links"], counts["series"], counts["deleted"])
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Write a seeded synthetic BusyBee database")
+    parser.add_argument("path", help="database file to write (must not exist)")
+    parser.add_argument("--items", type=int, default=10000, help="number of events and tasks")
+    parser.add_argument("--seed", type=int, default=0, help="seed of the random numbers")
+    parser.add_argument("--task-share", type=float, default=DatasetSpec._field_defaults["task_share"], help="share of the items that are tasks")
+    parser.add_argument("--recurring-share", type=float, default=DatasetSpec._field_defaults["recurring_share"], help="share of the items that repeat")
+    parser.add_argument("--categories", type=int, default=DatasetSpec._field_defaults["categories"], help="number of categories")
+    args = parser.parse_args()
+
+    if os.path.exists(args.path):
+        parser.error(f"{args.path} already exists")
+
+    spec = DatasetSpec(args.items, args.seed, args.task_share, args.categories, recurring_share=args.recurring_share)
+    db = database.Database(args.path)
+    summary = generate(db, spec)
+    db.dispose()
+    print(f"Wrote {summary.events} events and {summary.tasks} tasks ({summary.series} repeating, "
+          f"{summary.deleted_occurrences} deleted occurrences, {summary.category_links} category links) to {args.path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,146 @@
+"""
+    Name: Event Cache Benchmark
+    Description: Pages back and forth between months (and days) like CalendarView and DailyView do, counting the SQL
+                 statements and time of each visit. Then adds, moves, and deletes events like the event modals do, and
+                 checks that only the months they touched are loaded again
+
+    Date Created: 10/18/2026
+    Revisions:
+        - 10/18/2026
+            Checks that bulk inserts invalidate the months they touch
+
+    Usage:
+        python -m Benchmarks.event_cache_benchmark [--per-day 50] [--rounds 3]
+
+    Preconditions:
+        - SQLAlchemy must be installed and configured in the environment
+    Postconditions:
+        - Prints statements and time of the first and later visits, and the cache's hit and miss counters
+    Errors/Exceptions:
+        - Exits with status 1 if a revisited window runs SQL, a changed window isn't reloaded,
+          or an untouched window is reloaded
+    Side Effects:
+        - Creates (and deletes) a temporary database
+    Invariants:
+        - busybee.db isn't touched
+    Known Faults:
+        - None
+"""
+
+
+# Imports
+import argparse
+import os
+import sys
+import tempfile
+from datetime import datetime
+from time import perf_counter
+from Models import Event_
+from Models.databaseEnums import Frequency
+from eventcache import cached_event_occurrences, cached_month_summary
+from occurrences import delete_item, update_series
+from queries import day_bounds, month_bounds
+from Benchmarks.month_summary_benchmark import fill
+from Benchmarks.todo_query_count import StatementCounter
+from bulk import insert_items
+import database
+
+
+MONTHS = [(2026, month) for month in (2, 3, 4)]
+
+
+def visit(db, month:tuple[int, int]) -> tuple[int, float]:
+    """Load a month like CalendarView.populate() does, returns the statements it ran and its time in ms"""
+    with db.get_session() as session, StatementCounter(db.engine) as counter:
+        start = perf_counter()
+        cached_month_summary(session, *month_bounds(*month))
+        return counter.count, (perf_counter() - start) * 1000
+
+
+def reloaded(db) -> list[tuple[int, int]]:
+    """Months of MONTHS that aren't cached (visiting them runs SQL)"""
+    return [month for month in MONTHS if visit(db, month)[0] > 0]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Count the SQL run when paging between months with the event cache")
+    parser.add_argument("--per-day", type=int, default=50, help="number of events on each day of March")
+    parser.add_argument("--rounds", type=int, default=3, help="number of times to page back and forth")
+    args = parser.parse_args()
+
+    failed = False
+
+    def check(description:str, actual, expected):
+        nonlocal failed
+        status = "ok" if actual == expected else "FAILED"
+        print(f"{description:44} {str(actual):28} {status}")
+        if actual != expected:
+            failed = True
+
+    with tempfile.TemporaryDirectory() as directory:
+        db = database.Database(os.path.join(directory, "event_cache.db"))
+        with db.get_session() as session:
+            fill(session, args.per_day)
+
+        # page back and forth between three months
+        first, later = [], []
+        for round in range(args.rounds):
+            for month in MONTHS + MONTHS[-2::-1]:
+                count, ms = visit(db, month)
+                (first if count else later).append((count, ms))
+
+        print(f"{'first visits':14} {sum(c for c, _ in first) / len(first):6.1f} statements {sum(t for _, t in first) / len(first):8.2f} ms")
+        print(f"{'later visits':14} {sum(c for c, _ in later) / len(later):6.1f} statements {sum(t for _, t in later) / len(later):8.2f} ms")
+        print(db.event_cache.info())
+        check("months loaded once", len(first), len(MONTHS))
+
+        # a day is cached on its own
+        statements = []
+        for _ in range(2):
+            with db.get_session() as session, StatementCounter(db.engine) as counter:
+                cached_event_occurrences(session, *day_bounds(datetime(2026, 3, 15)))
+            statements.append(counter.count > 0)
+        check("day visits that ran SQL", statements, [True, False])
+
+        # AddEventModal: a one-off event in April
+        with db.get_session() as session, session.begin():
+            session.add(Event_(name="Added", start_time=datetime(2026, 4, 10, 9)))
+        check("add in April reloads", reloaded(db), [(2026, 4)])
+
+        # EditEventModal: move an event from April to February
+        with db.get_session() as session, session.begin():
+            event = session.query(Event_).filter_by(name="Added").first()
+            event.start_time = datetime(2026, 2, 10, 9)
+        check("move April -> February reloads", reloaded(db), [(2026, 2), (2026, 4)])
+
+        # delete: the moved event
+        with db.get_session() as session, session.begin():
+            delete_item(session, session.query(Event_).filter_by(name="Added").first())
+        check("delete in February reloads", reloaded(db), [(2026, 2)])
+
+        # a weekly series starting in March changes March onward
+        with db.get_session() as session, session.begin():
+            event = Event_(name="Weekly", start_time=datetime(2026, 3, 20, 9))
+            session.add(event)
+            update_series(session, event, Frequency.WEEKLY, 10)
+        check("series from March reloads", reloaded(db), [(2026, 3), (2026, 4)])
+
+        # bulk inserts (Core, no ORM flush) in February
+        with db.get_session() as session, session.begin():
+            insert_items(session, Event_, [{"name": "Imported", "start_time": datetime(2026, 2, day, 9)} for day in (3, 4)])
+        check("bulk insert in February reloads", reloaded(db), [(2026, 2)])
+
+        # a rolled back change reloads nothing
+        with db.get_session() as session:
+            session.add(Event_(name="Rolled back", start_time=datetime(2026, 2, 1, 9)))
+            session.flush()
+            session.rollback()
+        check("rollback reloads", reloaded(db), [])
+
+        db.dispose()
+
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
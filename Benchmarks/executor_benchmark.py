@@ -0,0 +1,95 @@
+"""
+    Name: Executor Benchmark
+    Description: Compares how long the UI thread is blocked loading a dense month, when it queries the database itself
+                 (what the calendar did before) and when it submits the query to the data executor. Also pages through
+                 months quickly, to check that only the last month's result is delivered
+
+    Date Created: 10/18/2026
+    Revisions:
+        - None
+
+    Usage:
+        python -m Benchmarks.executor_benchmark [--per-day 200] [--pages 12]
+
+    Preconditions:
+        - SQLAlchemy must be installed and configured in the environment
+    Postconditions:
+        - Prints the time the UI thread spent in each strategy
+    Errors/Exceptions:
+        - Exits with status 1 if a superseded month's result is delivered, or the last month's result isn't
+    Side Effects:
+        - Creates (and deletes) a temporary database
+    Invariants:
+        - busybee.db isn't touched, and Kivy isn't needed (results are delivered through a queue instead of Clock)
+    Known Faults:
+        - None
+"""
+
+
+# Imports
+import argparse
+import os
+import queue
+import sys
+import tempfile
+from time import perf_counter
+from occurrences import month_summary
+from queries import month_bounds
+from executor import DataExecutor
+from Benchmarks.month_summary_benchmark import fill
+import database
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Time the UI thread loading a month with and without the data executor")
+    parser.add_argument("--per-day", type=int, default=200, help="number of events on each day")
+    parser.add_argument("--pages", type=int, default=12, help="number of months paged through quickly")
+    args = parser.parse_args()
+
+    failed = False
+    with tempfile.TemporaryDirectory() as directory:
+        database.use_database(os.path.join(directory, "executor.db"))
+        db = database.get_database()
+        with db.get_session() as session:
+            fill(session, args.per_day)
+
+        # the UI thread queries the database itself
+        start = perf_counter()
+        with db.get_session() as session:
+            month_summary(session, *month_bounds(2026, 3))
+        blocking_ms = (perf_counter() - start) * 1000
+
+        # the UI thread submits the query, and runs the callbacks the worker thread hands it
+        callbacks = queue.Queue()
+        executor = DataExecutor(deliver=callbacks.put)
+        delivered = []
+
+        start = perf_counter()
+        for page in range(args.pages):
+            month = (2026, page % 12 + 1)
+            executor.submit(
+                lambda session, month=month: month_summary(session, *month_bounds(*month)),
+                lambda summaries, month=month: delivered.append(month),
+                key="calendar-month"
+            )
+        submit_ms = (perf_counter() - start) * 1000
+
+        executor.wait()
+        while not callbacks.empty():
+            callbacks.get()()
+
+        print(f"{'query on the UI thread':28} {blocking_ms:9.2f} ms")
+        print(f"{f'submit {args.pages} months':28} {submit_ms:9.2f} ms")
+        print(f"delivered: {delivered}")
+
+        last = (2026, (args.pages - 1) % 12 + 1)
+        if delivered != [last]:
+            failed = True
+            print(f"    expected only {last} to be delivered")
+        db.dispose()
+
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
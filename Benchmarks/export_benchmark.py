@@ -0,0 +1,136 @@
+"""
+    Name: Export Benchmark
+    Description: Times exporting a large database to .ics and CSV with export.py (rows streamed with yield_per and
+                 written as they're read), and measures the peak Python memory of each export with tracemalloc, next
+                 to reading the same rows all at once (the query's .all()) first. Streamed exports should use the same
+                 few MB whatever the size of the database
+
+    Date Created: 10/18/2026
+    Revisions:
+        - None
+
+    Usage:
+        python -m Benchmarks.export_benchmark [--items 200000] [--budget-mb 8]
+
+    Preconditions:
+        - SQLAlchemy must be installed and configured in the environment
+    Postconditions:
+        - Prints the time, rows per second, and peak memory of each export
+    Errors/Exceptions:
+        - Exits with status 1 if a streamed export's peak memory is over the budget, or it doesn't write every item
+    Side Effects:
+        - Creates (and deletes) a temporary database and exported files
+    Invariants:
+        - busybee.db isn't touched
+    Known Faults:
+        - tracemalloc only sees Python's memory, SQLite's page cache (bounded by the connection's cache_size) isn't
+          counted. Exports are timed first, then run again with tracing (it slows them down)
+"""
+
+
+# Imports
+import argparse
+import csv
+import os
+import sys
+import tempfile
+import tracemalloc
+from datetime import datetime, timedelta
+from time import perf_counter
+import database
+from bulk import insert_items, insert_recurrences
+from export import CSV_COLUMNS, ExportResult, csv_row, export_csv, export_ics, items
+from Models import Category, Event_, Task
+from Models.databaseEnums import Frequency, ItemType, Priority
+
+
+BATCH = 50000 # items inserted at a time while filling the database
+
+
+def fill(db, count:int):
+    """Bulk inserts count items, half events and half tasks, every 10th one weekly, each with a category"""
+    start = datetime(2026, 1, 5, 9)
+    with db.get_session() as session:
+        categories = [Category(name=name) for name in ("Work", "School", "Home")]
+        session.add_all(categories)
+        session.flush()
+
+        for first in range(0, count, BATCH):
+            numbers = range(first, min(first + BATCH, count))
+            recurring = [i for i in numbers if i % 10 == 0]
+            recurrence_ids = dict(zip(recurring, insert_recurrences(session, [{"frequency": Frequency.WEEKLY, "times": 10}] * len(recurring))))
+            events = [i for i in numbers if i % 2 == 0]
+            tasks = [i for i in numbers if i % 2 == 1]
+            insert_items(session, Event_, [
+                {"name": f"Event {i}", "notes": f"Notes about event {i}, with a comma", "place": f"Room {i % 50}",
+                 "start_time": start + timedelta(hours=i), "recurrence_id": recurrence_ids.get(i)}
+                for i in events
+            ], [[categories[i % 3].id] for i in events])
+            insert_items(session, Task, [
+                {"name": f"Task {i}", "notes": "", "due_date": start + timedelta(hours=i), "priority": Priority.MEDIUM,
+                 "recurrence_id": recurrence_ids.get(i)}
+                for i in tasks
+            ], [[categories[i % 3].id] for i in tasks])
+            session.commit()
+
+
+def buffered_csv(file, db) -> ExportResult:
+    """Reads every row first, then writes them (what exporting without yield_per would hold in memory)"""
+    rows = list(items(db))
+    writer = csv.writer(file)
+    writer.writerow(CSV_COLUMNS)
+    for row in rows:
+        writer.writerow(csv_row(row))
+
+    return ExportResult(sum(row.type == ItemType.EVENT for row in rows), sum(row.type == ItemType.TASK for row in rows))
+
+
+def measure(export, path:str, db) -> tuple[float, float, int]:
+    """Runs an export, then again with tracemalloc on, returns its seconds, its peak memory in MB, and the items written"""
+    start = perf_counter()
+    with open(path, "w", encoding="utf-8", newline="") as file:
+        result = export(file, db)
+    seconds = perf_counter() - start
+
+    tracemalloc.start()
+    with open(path, "w", encoding="utf-8", newline="") as file:
+        export(file, db)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    return seconds, peak / 1024 / 1024, result.events + result.tasks
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Time exporting a large database and measure its memory")
+    parser.add_argument("--items", type=int, default=200000, help="number of events and tasks in the database")
+    parser.add_argument("--budget-mb", type=float, default=8.0, help="largest peak memory of a streamed export")
+    args = parser.parse_args()
+
+    failed = False
+    with tempfile.TemporaryDirectory() as directory:
+        db = database.Database(os.path.join(directory, "export.db"))
+        start = perf_counter()
+        fill(db, args.items)
+        print(f"filled the database with {args.items} items in {perf_counter() - start:.1f}s\n")
+
+        print(f"{'export':14} {'time':>9} {'items/s':>9} {'peak memory':>12}")
+        for label, export, extension in (("ics, streamed", export_ics, "ics"), ("csv, streamed", export_csv, "csv"),
+                                         ("csv, buffered", buffered_csv, "csv")):
+            path = os.path.join(directory, f"export.{extension}")
+            seconds, peak_mb, written = measure(export, path, db)
+            print(f"{label:14} {seconds:8.2f}s {args.items / seconds:9.0f} {peak_mb:9.1f} MB")
+
+            if written != args.items:
+                failed = True
+                print(f"    wrote {written} items, expected {args.items}")
+            if export is not buffered_csv and peak_mb > args.budget_mb:
+                failed = True
+                print(f"    over the {args.budget_mb:g} MB budget")
+        db.dispose()
+
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,123 @@
+"""
+    Name: First Frame Benchmark
+    Description: Times how long the app takes from starting to its first frame with few and many tasks, with the
+                 screens built when they're first needed (BusyBeeApp.build) and with every screen built, and the to-do
+                 list populated, up front (how build() used to work). With lazy screens the first frame shouldn't
+                 depend on the number of tasks, the to-do list isn't built until it's shown
+
+    Date Created: 10/18/2026
+    Revisions:
+        - None
+
+    Usage:
+        python -m Benchmarks.first_frame_benchmark [--tasks 100 10000] [--max-ratio 1.5]
+
+    Preconditions:
+        - Kivy must be installed and able to open a window (e.g. run under xvfb-run without a display)
+        - SQLAlchemy must be installed and configured in the environment
+    Postconditions:
+        - Prints the build time and time to first frame of each number of tasks, lazy and eager
+    Errors/Exceptions:
+        - Exits with status 1 if the to-do list is built before the first frame, or the lazy first frame with the most
+          tasks takes more than max-ratio times the one with the fewest
+    Side Effects:
+        - Creates (and deletes) temporary databases, and opens a window for each run (each one in its own process)
+    Invariants:
+        - busybee.db isn't touched
+    Known Faults:
+        - None
+"""
+
+
+# Imports
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+from time import perf_counter
+
+
+def run(mode:str, count:int):
+    """Start the app on a database with count tasks in this process, then print its results as JSON"""
+    os.environ.setdefault("KIVY_NO_ARGS", "1")
+    os.environ.setdefault("KIVY_NO_CONSOLELOG", "1")
+
+    import database
+    from Benchmarks.todo_query_count import fill
+    from kivy.clock import Clock
+    from busybee import BusyBeeApp
+
+    results = {"mode": mode, "tasks": count}
+    with tempfile.TemporaryDirectory() as directory:
+        db = database.use_database(os.path.join(directory, "first_frame.db")) # the screens' sessions use it too
+        with db.get_session() as session:
+            fill(session, count)
+
+        class FirstFrameBenchmarkApp(BusyBeeApp):
+            """BusyBeeApp that stops after its first frame"""
+            screen_warm_up_delay = None # nothing is built after the first frame
+
+            def build(self):
+                start = perf_counter()
+                root = super().build()
+                if mode == "eager": # every screen built, and the to-do list populated, before the first frame
+                    for name in ("todo", "daily"):
+                        self.screen_manager.get_screen(name)
+                results["build_ms"] = (perf_counter() - start) * 1000
+
+                Clock.schedule_once(self.first_frame, 0)
+                return root
+
+            def first_frame(self, dt):
+                results["first_frame_ms"] = (perf_counter() - app_start) * 1000
+                results["todo_built"] = self.screen_manager.is_built("todo")
+                self.stop()
+
+        app_start = perf_counter()
+        FirstFrameBenchmarkApp().run()
+        db.dispose()
+
+    print(json.dumps(results))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Time the app's first frame with few and many tasks")
+    parser.add_argument("--tasks", type=int, nargs="+", default=[100, 10000], help="numbers of tasks to start with")
+    parser.add_argument("--max-ratio", type=float, default=1.5, help="largest lazy first frame slow down allowed")
+    parser.add_argument("--mode", choices=["lazy", "eager"], help="run one start up (used by the benchmark itself)")
+    args = parser.parse_args()
+
+    if args.mode:
+        run(args.mode, args.tasks[0])
+        return
+
+    failed = False
+    first_frames = {}
+    print(f"{'screens':8} {'tasks':>7} {'build':>10} {'first frame':>12}")
+    for mode in ("eager", "lazy"):
+        for count in args.tasks:
+            output = subprocess.run(
+                [sys.executable, "-m", "Benchmarks.first_frame_benchmark", "--mode", mode, "--tasks", str(count)],
+                capture_output=True, text=True, check=True
+            ).stdout
+            result = json.loads(output.strip().splitlines()[-1])
+            print(f"{mode:8} {count:7} {result['build_ms']:8.1f}ms {result['first_frame_ms']:10.1f}ms")
+
+            if mode == "lazy":
+                first_frames[count] = result["first_frame_ms"]
+                if result["todo_built"]:
+                    failed = True
+                    print("    the to-do list was built before the first frame")
+
+    fewest, most = first_frames[min(args.tasks)], first_frames[max(args.tasks)]
+    if most > fewest * args.max_ratio:
+        failed = True
+        print(f"    the first frame with {max(args.tasks)} tasks took {most / fewest:.2f}x as long as with {min(args.tasks)}")
+
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,156 @@
+"""
+    Name: iCalendar Import Benchmark
+    Description: Times importing generated .ics files with icsimport (streamed, chunked bulk transactions) and the old
+                 way, one event at a time through the ORM with a commit each (how AddEventModal saves an event), and
+                 times parsing several files in a pool of processes. Peak memory is measured for a small and a large
+                 file, a streamed import's shouldn't grow with the file
+
+    Date Created: 10/18/2026
+    Revisions:
+        - None
+
+    Usage:
+        python -m Benchmarks.ics_import_benchmark [--events 20000] [--files 4] [--processes 4] [--orm-events 2000]
+
+    Preconditions:
+        - SQLAlchemy must be installed and configured in the environment
+    Postconditions:
+        - Prints the time and events per second of each way, and the peak memory of each file size
+    Errors/Exceptions:
+        - Exits with status 1 if an import doesn't import every event, or its peak memory grows more than 2x for a
+          file 5x as large
+    Side Effects:
+        - Creates (and deletes) temporary .ics files and databases
+    Invariants:
+        - busybee.db isn't touched
+    Known Faults:
+        - Parsing in a pool only helps with more than one CPU (os.cpu_count() is printed)
+"""
+
+
+# Imports
+import argparse
+import os
+import sys
+import tempfile
+import tracemalloc
+from datetime import datetime, timedelta
+from time import perf_counter
+import database
+from icsimport import import_files, read_chunks
+from Models import Event_
+from occurrences import update_series
+
+
+START = datetime(2026, 1, 5, 9)
+
+
+def write_calendar(path:str, events:int, calendar:int=0):
+    """Writes an .ics file of events (every 5th one weekly, 10 times), each with 2 categories and an alarm"""
+    with open(path, "w", newline="") as file:
+        file.write("BEGIN:VCALENDAR\r\nVERSION:2.0\r\nPRODID:-//BusyBee//Benchmark//EN\r\n")
+        for i in range(events):
+            start = START + timedelta(hours=i * 7)
+            file.write(
+                f"BEGIN:VEVENT\r\nUID:{calendar}-{i}@busybee\r\nDTSTAMP:20261018T000000Z\r\n"
+                f"DTSTART:{start:%Y%m%dT%H%M%S}Z\r\nDTEND:{start + timedelta(hours=1):%Y%m%dT%H%M%S}Z\r\n"
+                f"SUMMARY:Event {i} of calendar {calendar}\r\n"
+                f"DESCRIPTION:Notes about event {i}\\, long enough to be folded like real calendars fold their \r\n"
+                f" descriptions\r\nLOCATION:Room {i % 50}\r\nCATEGORIES:Calendar {calendar},Work\r\n"
+            )
+            if i % 5 == 0:
+                file.write("RRULE:FREQ=WEEKLY;COUNT=10\r\n")
+            file.write("BEGIN:VALARM\r\nACTION:DISPLAY\r\nTRIGGER:-PT15M\r\nEND:VALARM\r\nEND:VEVENT\r\n")
+        file.write("END:VCALENDAR\r\n")
+
+
+def orm_one_at_a_time(db, path:str, limit:int) -> int:
+    """Saves the first limit events of a file the way AddEventModal does, returns how many were saved"""
+    saved = 0
+    with db.get_session() as session:
+        for chunk, bytes_read in read_chunks(path):
+            for event in chunk[:limit - saved]:
+                with session.begin():
+                    new_event = Event_(name=event.name, notes=event.notes, place=event.place, start_time=event.start_time)
+                    session.add(new_event)
+                    update_series(session, new_event, event.frequency, event.times)
+                saved += 1
+            if saved >= limit:
+                break
+
+    return saved
+
+
+def timed_import(directory:str, name:str, paths:list[str], **kwargs) -> tuple[int, float]:
+    """Imports the files into a new database, returns the events imported and the seconds it took"""
+    db = database.Database(os.path.join(directory, f"{name}.db"))
+    start = perf_counter()
+    result = import_files(paths, db, **kwargs)
+    seconds = perf_counter() - start
+    db.dispose()
+
+    return result.events, seconds
+
+
+def peak_memory(directory:str, name:str, path:str) -> float:
+    """Imports a file with tracemalloc on, returns the peak memory in MB"""
+    tracemalloc.start()
+    timed_import(directory, name, [path])
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    return peak / 1024 / 1024
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Time importing iCalendar files")
+    parser.add_argument("--events", type=int, default=20000, help="events per file")
+    parser.add_argument("--files", type=int, default=4, help="files imported at once with a pool")
+    parser.add_argument("--processes", type=int, default=4, help="processes parsing the files")
+    parser.add_argument("--orm-events", type=int, default=2000, help="events saved one at a time through the ORM")
+    args = parser.parse_args()
+
+    failed = False
+    with tempfile.TemporaryDirectory() as directory:
+        paths = [os.path.join(directory, f"calendar{i}.ics") for i in range(args.files)]
+        for i, path in enumerate(paths):
+            write_calendar(path, args.events, i)
+        print(f"{args.files} files of {args.events} events, {os.path.getsize(paths[0]) / 1e6:.1f} MB each, {os.cpu_count()} CPUs\n")
+
+        # one file: the old way (a sample, it's slow) and streamed
+        db = database.Database(os.path.join(directory, "orm.db"))
+        start = perf_counter()
+        saved = orm_one_at_a_time(db, paths[0], args.orm_events)
+        orm_seconds = perf_counter() - start
+        db.dispose()
+
+        print(f"{'import':34} {'events':>8} {'time':>9} {'events/s':>9}")
+        print(f"{'ORM, one at a time':34} {saved:8} {orm_seconds:8.2f}s {saved / orm_seconds:9.0f}")
+        imports = [
+            ("streamed, 1 file", paths[:1], {}),
+            (f"streamed, {args.files} files", paths, {}),
+            (f"streamed, {args.files} files, {args.processes} processes", paths, {"processes": args.processes}),
+        ]
+        for i, (label, files, kwargs) in enumerate(imports):
+            events, seconds = timed_import(directory, f"import{i}", files, **kwargs)
+            print(f"{label:34} {events:8} {seconds:8.2f}s {events / seconds:9.0f}")
+            if events != args.events * len(files):
+                failed = True
+                print(f"    imported {events} events, expected {args.events * len(files)}")
+
+        # peak memory of a file and one 5x as large
+        small_events = max(args.events // 10, 1)
+        small, large = os.path.join(directory, "small.ics"), os.path.join(directory, "large.ics")
+        write_calendar(small, small_events)
+        write_calendar(large, small_events * 5)
+        small_mb, large_mb = peak_memory(directory, "small", small), peak_memory(directory, "large", large)
+        print(f"\npeak memory: {small_mb:.1f} MB for {small_events} events, {large_mb:.1f} MB for {small_events * 5} events")
+        if large_mb > small_mb * 2:
+            failed = True
+            print("    the peak memory of an import grows with the file")
+
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
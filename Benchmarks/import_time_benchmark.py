@@ -0,0 +1,152 @@
+"""
+    Name: Import Time Benchmark
+    Description: Measures what importing the app costs before its first frame, by running
+                 python -X importtime -c "import busybee" in a fresh interpreter and parsing its report. Prints the
+                 total import time, the slowest modules, and what each modal costs when it's first opened (they're
+                 imported on first use), and checks startup against an import time budget
+
+    Date Created: 10/18/2026
+    Revisions:
+        - 10/18/2026
+            The search modal is a modal module too
+
+    Usage:
+        python -m Benchmarks.import_time_benchmark [--module busybee] [--budget-ms 1500] [--repeat 5]
+
+    Preconditions:
+        - Kivy and SQLAlchemy must be installed and configured in the environment (to import busybee)
+    Postconditions:
+        - Prints the median import time of the module, its slowest imports, and the import time of each modal
+    Errors/Exceptions:
+        - Exits with status 1 if the module can't be imported, imports a modal module, or its median import time is
+          over the budget
+    Side Effects:
+        - Runs the interpreter repeat + 1 times
+    Invariants:
+        - busybee.db isn't touched (importing the app doesn't connect to the database)
+    Known Faults:
+        - Times depend on the machine and on the file system cache (the first run is usually slower), set the budget
+          for the machine it runs on
+"""
+
+
+# Imports
+import argparse
+import os
+import subprocess
+import sys
+from statistics import median
+from typing import NamedTuple
+
+
+# Modules only the modals need, startup must not import them
+LAZY_MODULES = ("screens.addevent", "screens.addtask", "screens.editEvent", "screens.edittask", "screens.searchmodal",
+                "screens.usefulwidgets")
+BUDGET_MS = 1500.0 # default budget for importing the app
+TOP = 15 # number of slowest imports printed
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__))) # directory the app runs from
+
+
+class Import(NamedTuple):
+    """One line of the -X importtime report"""
+    module: str
+    depth: int # 0 for modules imported by the -c code itself
+    self_ms: float
+    cumulative_ms: float
+
+
+def parse_importtime(report:str) -> list[Import]:
+    """
+    Parses the -X importtime report, lines like "import time:       412 |       1350 |   sqlalchemy.engine"
+
+    Parameters:
+        report (str): what the interpreter wrote to stderr
+
+    Returns:
+        list[Import]: the imports in the order they finished (a module's imports come before it)
+    """
+    imports = []
+    for line in report.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        depth = (len(name) - len(name.lstrip()) - 1) // 2
+        imports.append(Import(name.strip(), depth, int(self_us) / 1000, int(cumulative_us) / 1000))
+
+    return imports
+
+
+def imported_by(imports:list[Import], module:str) -> list[Import]:
+    """The imports done by a top-level import of module (the ones reported after the previous top-level import)"""
+    start = 0
+    for i, entry in enumerate(imports):
+        if entry.depth == 0:
+            if entry.module == module:
+                return imports[start:i + 1]
+            start = i + 1
+
+    return []
+
+
+def run_importtime(modules:list[str]) -> list[Import]:
+    """
+    Imports the modules one after the other in a fresh interpreter with -X importtime
+
+    Returns:
+        list[Import]: the parsed report
+
+    Raises:
+        RuntimeError: if the interpreter fails (e.g. a module can't be imported)
+    """
+    env = dict(os.environ, KIVY_NO_ARGS="1", KIVY_NO_CONSOLELOG="1", PYTHONDONTWRITEBYTECODE="1")
+    code = "\n".join(f"import {module}" for module in modules)
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", code], cwd=ROOT, env=env, capture_output=True, text=True)
+    if result.returncode != 0:
+        errors = [line for line in result.stderr.splitlines() if not line.startswith("import time:")]
+        raise RuntimeError("\n".join(errors[-5:]))
+
+    return parse_importtime(result.stderr)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure the import time of the app before its first frame")
+    parser.add_argument("--module", default="busybee", help="module imported at startup")
+    parser.add_argument("--budget-ms", type=float, default=BUDGET_MS, help="maximum median import time of the module")
+    parser.add_argument("--repeat", type=int, default=5, help="number of cold interpreters to take the median of")
+    args = parser.parse_args()
+
+    failed = False
+    lazy = [module for module in LAZY_MODULES if module != args.module]
+    try:
+        run_importtime([args.module]) # warm up the file system cache
+        runs = [run_importtime([args.module, *lazy]) for _ in range(args.repeat)]
+    except RuntimeError as error:
+        print(f"Couldn't import {args.module}:\n{error}")
+        sys.exit(1)
+
+    startup = [imported_by(imports, args.module) for imports in runs]
+    total_ms = median(imports[-1].cumulative_ms for imports in startup)
+    print(f"import {args.module}: {total_ms:.1f} ms (median of {args.repeat}), {len(startup[0])} modules, budget {args.budget_ms:g} ms\n")
+
+    print(f"{'self':>9} {'cumulative':>11}  slowest imports")
+    for entry in sorted(startup[0], key=lambda entry: entry.self_ms, reverse=True)[:TOP]:
+        print(f"{entry.self_ms:7.1f}ms {entry.cumulative_ms:9.1f}ms  {entry.module}")
+
+    # what each modal adds when it's first opened (modules startup already imported aren't counted again)
+    print(f"\n{'first use':>11}  modal module")
+    for module in lazy:
+        print(f"{median(sum(entry.self_ms for entry in imported_by(imports, module)) for imports in runs):9.1f}ms  {module}")
+
+    eager = sorted({entry.module for entry in startup[0]} & set(LAZY_MODULES))
+    if eager:
+        failed = True
+        print(f"    startup imports modal modules: {', '.join(eager)}")
+    if total_ms > args.budget_ms:
+        failed = True
+        print(f"    startup import time is over the {args.budget_ms:g} ms budget")
+
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
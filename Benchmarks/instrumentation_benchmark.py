@@ -0,0 +1,135 @@
+"""
+    Name: Instrumentation Benchmark
+    Description: Times loading the calendar's month and the to-do list with SQL instrumentation off, on, and on
+                 counting rows returned, to show what leaving it on costs, then prints its report. The modes are
+                 timed in turns, several rounds, and compared by their median, so the machine getting busier
+                 during the run doesn't count against one mode. Also checks what it recorded: the number of
+                 statements, the rows returned, and the action work submitted to the data executor is counted for
+
+    Date Created: 10/18/2026
+    Revisions:
+        - None
+
+    Usage:
+        python -m Benchmarks.instrumentation_benchmark [--repeat 50] [--rounds 7]
+
+    Preconditions:
+        - SQLAlchemy must be installed and configured in the environment
+    Postconditions:
+        - Prints the median time of the workloads with instrumentation off, on, and counting rows, and its report
+    Errors/Exceptions:
+        - Exits with status 1 if the statements or rows recorded are wrong, executor work isn't counted for its action,
+          or instrumentation (without counting rows) slows the workloads down by more than MAX_OVERHEAD
+    Side Effects:
+        - Creates (and deletes) a temporary database
+    Invariants:
+        - busybee.db isn't touched
+    Known Faults:
+        - None
+"""
+
+
+# Imports
+import argparse
+import os
+import queue
+import sys
+import tempfile
+from statistics import median
+from time import perf_counter
+from sqlalchemy import select
+from Models import Event_
+from occurrences import month_summary
+from queries import month_bounds
+from executor import DataExecutor
+from instrumentation import action, get_instrumentation
+from Benchmarks.month_summary_benchmark import fill as fill_events
+from Benchmarks.todo_query_count import StatementCounter, batched_populate, fill as fill_tasks
+import database
+
+
+MAX_OVERHEAD = 0.10 # largest slow down allowed with instrumentation on (without counting rows)
+
+
+def time_workloads(db, repeat:int) -> float:
+    """Milliseconds to load March and the to-do list repeat times, each load in its own session and action"""
+    start = perf_counter()
+    for _ in range(repeat):
+        with action("CalendarView.populate"), db.get_session() as session:
+            month_summary(session, *month_bounds(2026, 3))
+        with action("ToDoListView.populate"), db.get_session() as session:
+            batched_populate(session)
+
+    return (perf_counter() - start) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Time SQL instrumentation and check what it records")
+    parser.add_argument("--repeat", type=int, default=50, help="number of times each workload runs in a round")
+    parser.add_argument("--rounds", type=int, default=7, help="number of rounds each mode is timed")
+    args = parser.parse_args()
+
+    failed = False
+    instrumentation = get_instrumentation()
+    with tempfile.TemporaryDirectory() as directory:
+        db = database.use_database(os.path.join(directory, "instrumentation.db")) # the executor's sessions use it too
+        with db.get_session() as session:
+            fill_events(session, 20)
+            fill_tasks(session, 200)
+
+        time_workloads(db, 1) # warm up
+        modes = {"off": None, "on": False, "counting rows": True} # mode -> count_rows, None if it's disabled
+        times = {mode: [] for mode in modes}
+        for _ in range(args.rounds):
+            for mode, count_rows in modes.items():
+                if count_rows is None:
+                    instrumentation.disable()
+                else:
+                    instrumentation.enable(count_rows=count_rows)
+                times[mode].append(time_workloads(db, args.repeat))
+
+        off_ms = median(times["off"])
+        for mode in modes:
+            ms = median(times[mode])
+            print(f"instrumentation {mode:13} {ms:8.1f} ms ({(ms / off_ms - 1) * 100:+.1f}%)")
+        overhead = median(times["on"]) / off_ms - 1
+        if overhead > MAX_OVERHEAD:
+            failed = True
+            print(f"    instrumentation slows the workloads down by {overhead * 100:.1f}%, more than {MAX_OVERHEAD * 100:g}%")
+        print()
+        instrumentation.print_report(limit=8)
+        print()
+
+        # the statements it recorded are the ones the engine ran, and SELECT rows are counted (when asked to)
+        instrumentation.enable(count_rows=True)
+        instrumentation.reset()
+        with db.get_session() as session, StatementCounter(db.engine) as counter, action("check"):
+            events = session.scalars(select(Event_).where(Event_.start_time < month_bounds(2026, 3)[0].replace(day=3))).all()
+        recorded = instrumentation.actions().get("check", (0, 0))[0]
+        rows = sum(stats.rows for stats in instrumentation.statements() if stats.action == "check")
+        print(f"check: {recorded} statements recorded ({counter.count} ran), {rows} rows recorded ({len(events)} returned)")
+        if recorded != counter.count or rows != len(events):
+            failed = True
+            print("    recorded statements or rows are wrong")
+
+        # work submitted to the data executor is counted for the action that submitted it, or where it's defined
+        callbacks = queue.Queue()
+        executor = DataExecutor(deliver=callbacks.put)
+        with action("DailyView.refresh_events"):
+            executor.submit(lambda session: session.scalars(select(Event_).limit(1)).all())
+        executor.submit(lambda session: session.scalars(select(Event_).limit(2)).all())
+        executor.wait()
+        actions = set(instrumentation.actions())
+        print(f"executor actions: {sorted(name for name in actions if name != 'check')}")
+        if not {"DailyView.refresh_events", "main"} <= actions:
+            failed = True
+            print("    executor work wasn't counted for its action")
+
+        instrumentation.disable()
+        db.dispose()
+
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+"""
+    Name: Month Summary Benchmark
+    Description: Compares loading every event of a dense month (what the calendar did before) with the month summary,
+                 which only loads the first two events of each day and the day's event count
+
+    Date Created: 10/18/2026
+    Revisions:
+        - 10/18/2026
+            Events are inserted with bulk.insert_items()
+
+    Usage:
+        python -m Benchmarks.month_summary_benchmark [--per-day 200] [--repeat 5]
+
+    Preconditions:
+        - SQLAlchemy must be installed and configured in the environment
+    Postconditions:
+        - Prints the rows loaded and average time of each strategy
+    Errors/Exceptions:
+        - Exits with status 1 if the summary doesn't match the full list of events
+    Side Effects:
+        - Creates (and deletes) a temporary database
+    Invariants:
+        - busybee.db isn't touched
+    Known Faults:
+        - None
+"""
+
+
+# Imports
+import argparse
+import os
+import sys
+import tempfile
+from collections import defaultdict
+from datetime import datetime, timedelta
+from time import perf_counter
+from Models import Event_
+from occurrences import event_occurrences, month_summary
+from queries import month_bounds
+from bulk import insert_items
+import database
+
+
+def fill(session, per_day:int):
+    """Insert per_day events on every day of March 2026, spread over the day"""
+    start = datetime(2026, 3, 1)
+    times = [start + timedelta(days=day, minutes=minute * 1440 // per_day) for day in range(31) for minute in range(per_day)]
+    insert_items(session, Event_, [{"name": f"Event {i}", "start_time": time} for i, time in enumerate(times, 1)])
+    session.commit()
+
+
+def time_call(function, repeat:int):
+    """Average time in milliseconds of a call, and what it returned"""
+    start = perf_counter()
+    for _ in range(repeat):
+        result = function()
+
+    return (perf_counter() - start) / repeat * 1000, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare loading a whole month with the month summary")
+    parser.add_argument("--per-day", type=int, default=200, help="number of events on each day")
+    parser.add_argument("--repeat", type=int, default=5, help="number of times each strategy is timed")
+    args = parser.parse_args()
+
+    failed = False
+    with tempfile.TemporaryDirectory() as directory:
+        db = database.Database(os.path.join(directory, "month_summary.db"))
+        with db.get_session() as session:
+            fill(session, args.per_day)
+            month = month_bounds(2026, 3)
+
+            full_ms, events = time_call(lambda: event_occurrences(session, *month), args.repeat)
+            summary_ms, summaries = time_call(lambda: month_summary(session, *month), args.repeat)
+
+            print(f"{'all events':14} {len(events):8} rows {full_ms:9.2f} ms")
+            print(f"{'month summary':14} {sum(len(summary.events) for summary in summaries.values()):8} rows {summary_ms:9.2f} ms")
+
+            # the summary must show what the calendar showed from the full list
+            events_by_day = defaultdict(list)
+            for event in events:
+                events_by_day[event.start_time.date()].append(event)
+
+            for day, day_events in events_by_day.items():
+                if summaries[day].count != len(day_events) or summaries[day].events != day_events[:2]:
+                    failed = True
+                    print(f"    summary differs on {day}")
+        db.dispose()
+
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
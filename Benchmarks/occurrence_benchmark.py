@@ -0,0 +1,98 @@
+"""
+    Name: Occurrence Benchmark
+    Description: Compares Frequency.occurrences(), which computes the dates of a series directly, with stepping through
+                 the series one get_next_date() call at a time, for long (10k occurrence) series. Times generating the
+                 whole series and generating only one month late in the series (what the calendar asks for)
+
+    Date Created: 10/18/2026
+    Revisions:
+        - None
+
+    Usage:
+        python -m Benchmarks.occurrence_benchmark [--count 10000] [--repeat 5]
+
+    Preconditions:
+        - None
+    Postconditions:
+        - Prints the average time of each strategy and the speed up
+    Errors/Exceptions:
+        - Exits with status 1 if the two strategies generate different dates
+    Side Effects:
+        - None
+    Invariants:
+        - No database is used
+    Known Faults:
+        - YEARLY series are shortened to end before year 9999 (the latest year datetime supports)
+"""
+
+
+# Imports
+import argparse
+import sys
+from datetime import datetime, MAXYEAR
+from time import perf_counter
+from Models.databaseEnums import Frequency
+from queries import month_bounds
+
+
+def iterative(frequency:Frequency, start:datetime, count:int, window_start=None, window_end=None) -> list[datetime]:
+    """The dates of a series as they were generated before, one get_next_date() call at a time"""
+    dates = []
+    current = start
+
+    for i in range(count):
+        if i > 0:
+            current = frequency.get_next_date(current, start)
+
+        if window_end is not None and current >= window_end:
+            break
+
+        if window_start is None or current >= window_start:
+            dates.append(current)
+
+    return dates
+
+
+def time_call(function, repeat:int) -> tuple[float, list[datetime]]:
+    """Average time in milliseconds of a call, and what it returned"""
+    start = perf_counter()
+    for _ in range(repeat):
+        result = function()
+
+    return (perf_counter() - start) / repeat * 1000, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare closed form and iterative occurrence generation")
+    parser.add_argument("--count", type=int, default=10000, help="number of occurrences in each series")
+    parser.add_argument("--repeat", type=int, default=5, help="number of times each strategy is timed")
+    args = parser.parse_args()
+
+    # month ends and Feb 29 are where the clamping has to match
+    starts = [datetime(2024, 1, 31, 9, 30), datetime(2024, 2, 29, 8), datetime(2023, 8, 30, 17, 45)]
+    frequencies = [Frequency.DAILY, Frequency.WEEKLY, Frequency.MONTHLY, Frequency.YEARLY]
+
+    failed = False
+    print(f"{'series':34} {'iterative':>12} {'closed form':>12} {'speed up':>9}")
+    for frequency in frequencies:
+        for start in starts:
+            count = min(args.count, MAXYEAR - start.year) if frequency == Frequency.YEARLY else args.count
+            last = frequency.nth_date(start, count - 1)
+            window = month_bounds(last.year, last.month) # a month at the end of the series
+
+            for label, window_start, window_end in (("all", None, None), ("last month", *window)):
+                old_ms, old = time_call(lambda: iterative(frequency, start, count, window_start, window_end), args.repeat)
+                new_ms, new = time_call(lambda: frequency.occurrences(start, count=count, window=(window_start, window_end)), args.repeat)
+
+                name = f"{frequency.name} {start:%m/%d} x{count} ({label})"
+                print(f"{name:34} {old_ms:10.3f}ms {new_ms:10.3f}ms {old_ms / new_ms:8.1f}x")
+
+                if old != new:
+                    failed = True
+                    print(f"    dates differ for {name}")
+
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+"""
+    Name: Pragma Benchmark
+    Description: Times adding a task and checking a task off (one commit each, like the app does) under each SQLite
+                 profile in database.PROFILES
+
+    Date Created: 10/18/2026
+    Revisions:
+        - None
+
+    Usage:
+        python -m Benchmarks.pragma_benchmark [--operations 200]
+
+    Preconditions:
+        - SQLAlchemy must be installed and configured in the environment
+    Postconditions:
+        - Prints the mean and 95th percentile latency of each operation under each profile
+    Errors/Exceptions:
+        - None
+    Side Effects:
+        - Creates (and deletes) temporary databases, on the same disk as the system's temporary directory
+    Invariants:
+        - busybee.db isn't touched
+    Known Faults:
+        - Commit latency depends on the disk (and whether it honours fsync), so compare profiles on the same machine
+"""
+
+
+# Imports
+import argparse
+import os
+import tempfile
+from datetime import datetime, timedelta
+from time import perf_counter
+from Models import Task
+import database
+
+
+def latencies(function, operations:int) -> list[float]:
+    """Milliseconds each call of function(i) took, sorted"""
+    times = []
+    for i in range(operations):
+        start = perf_counter()
+        function(i)
+        times.append((perf_counter() - start) * 1000)
+
+    return sorted(times)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Time inserts and toggles under each SQLite profile")
+    parser.add_argument("--operations", type=int, default=200, help="number of inserts (and toggles) to time")
+    args = parser.parse_args()
+
+    print(f"{'profile':10} {'insert mean':>12} {'insert p95':>11} {'toggle mean':>12} {'toggle p95':>11}")
+    for profile in database.PROFILES:
+        with tempfile.TemporaryDirectory() as directory:
+            db = database.Database(os.path.join(directory, "pragma.db"), profile=profile)
+            start = datetime(2026, 1, 1)
+
+            def insert(i):
+                """AddTaskModal.save_task(): add one task and commit"""
+                with db.get_session() as session:
+                    session.add(Task(name=f"Task {i}", due_date=start + timedelta(hours=i)))
+                    session.commit()
+
+            def toggle(i):
+                """ToDoListView.toggle_complete(): check one task off and commit"""
+                with db.get_session() as session:
+                    task = session.get(Task, i + 1)
+                    task.complete = not task.complete
+                    session.commit()
+
+            inserts = latencies(insert, args.operations)
+            toggles = latencies(toggle, args.operations)
+            p95 = int(args.operations * 0.95) - 1
+            print(f"{profile:10} {sum(inserts) / len(inserts):10.2f}ms {inserts[p95]:9.2f}ms "
+                  f"{sum(toggles) / len(toggles):10.2f}ms {toggles[p95]:9.2f}ms")
+            db.dispose()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,138 @@
+"""
+    Name: Prefetch Benchmark
+    Description: Flips forward through a year of dense months like CalendarView does, with and without prefetching
+                 the months next to the one shown, timing how long each flip waits for its month. Also checks that the
+                 cache stays within its size and that cancelled prefetches don't run
+
+    Date Created: 10/18/2026
+    Revisions:
+        - 10/18/2026
+            Events are inserted with bulk.insert_items()
+
+    Usage:
+        python -m Benchmarks.prefetch_benchmark [--per-day 20] [--months 12]
+
+    Preconditions:
+        - SQLAlchemy must be installed and configured in the environment
+    Postconditions:
+        - Prints the mean and worst wait of a flip with and without prefetching
+    Errors/Exceptions:
+        - Exits with status 1 if a prefetched month runs SQL when it's shown, the cache grows past its size,
+          or a cancelled prefetch runs
+    Side Effects:
+        - Creates (and deletes) a temporary database
+    Invariants:
+        - busybee.db isn't touched, and Kivy isn't needed (results are delivered through a queue instead of Clock)
+    Known Faults:
+        - The prefetches run between flips (as if the user paused on each month), so this is the best case
+"""
+
+
+# Imports
+import argparse
+import os
+import queue
+import sys
+import tempfile
+from datetime import datetime, timedelta
+from time import perf_counter, sleep
+from Models import Event_
+from eventcache import cached_month_summary
+from executor import DataExecutor, Prefetcher
+from queries import adjacent_months, month_bounds
+from Benchmarks.todo_query_count import StatementCounter
+from bulk import insert_items
+import database
+
+
+def fill(session, per_day:int, months:int):
+    """Insert per_day events on every day of the months from January 2026"""
+    start = datetime(2026, 1, 1)
+    days = (datetime(2026 + months // 12, months % 12 + 1, 1) - start).days
+    times = [start + timedelta(days=day, minutes=minute * 1440 // per_day) for day in range(days) for minute in range(per_day)]
+    insert_items(session, Event_, [{"name": f"Event {i}", "start_time": time} for i, time in enumerate(times, 1)])
+    session.commit()
+
+
+def flip(db, executor:DataExecutor, callbacks:queue.Queue, prefetcher:Prefetcher, months:int) -> tuple[list[float], int]:
+    """
+    Show each month in turn like CalendarView.populate(), returns the ms each flip waited and the statements the
+    shown months ran (prefetches excluded)
+    """
+    waits, statements = [], 0
+    for i in range(months):
+        month = (2026 + i // 12, i % 12 + 1)
+        if prefetcher is not None:
+            prefetcher.cancel()
+
+        start = perf_counter()
+        shown = []
+        with StatementCounter(db.engine) as counter:
+            executor.submit(lambda session: cached_month_summary(session, *month_bounds(*month)), shown.append)
+            executor.wait()
+            callbacks.get()() # the UI thread shows the month
+        waits.append((perf_counter() - start) * 1000)
+        statements += counter.count if i > 0 else 0
+
+        if prefetcher is not None:
+            prefetcher.submit([
+                lambda session, month=adjacent: cached_month_summary(session, *month_bounds(*month), prefetch=True)
+                for adjacent in adjacent_months(*month)
+            ])
+            executor.wait() # the user pauses on the month, long enough for the prefetches to run
+            while not callbacks.empty():
+                callbacks.get()()
+
+    return waits, statements
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Time flipping through months with and without prefetching")
+    parser.add_argument("--per-day", type=int, default=20, help="number of events on each day")
+    parser.add_argument("--months", type=int, default=12, help="number of months to flip through")
+    args = parser.parse_args()
+
+    failed = False
+    with tempfile.TemporaryDirectory() as directory:
+        db = database.use_database(os.path.join(directory, "prefetch.db")) # the executor's sessions use it too
+        with db.get_session() as session:
+            fill(session, args.per_day, args.months + 1)
+
+        callbacks = queue.Queue()
+        executor = DataExecutor(deliver=callbacks.put)
+
+        print(f"{'':12} {'mean wait':>10} {'worst wait':>11} {'SQL while shown':>16}")
+        for name, prefetcher in (("no prefetch", None), ("prefetch", Prefetcher("prefetch", executor=executor))):
+            db.event_cache.clear()
+            waits, statements = flip(db, executor, callbacks, prefetcher, args.months)
+            print(f"{name:12} {sum(waits[1:]) / len(waits[1:]):8.2f}ms {max(waits[1:]):9.2f}ms {statements:16}")
+
+        if statements:
+            failed = True
+            print("    prefetched months ran SQL when they were shown")
+
+        info = db.event_cache.info()
+        print(info)
+        if info.size > info.maxsize:
+            failed = True
+            print("    the cache grew past its size")
+
+        # prefetches cancelled before the worker gets to them don't run
+        db.event_cache.clear()
+        prefetched = db.event_cache.info().prefetched
+        prefetcher = Prefetcher("prefetch", executor=executor)
+        executor.submit(lambda session: sleep(0.1)) # the worker is busy
+        prefetcher.submit([lambda session: cached_month_summary(session, *month_bounds(2026, 1), prefetch=True)])
+        prefetcher.cancel()
+        executor.wait()
+        if db.event_cache.info().prefetched != prefetched:
+            failed = True
+            print("    a cancelled prefetch ran")
+
+        db.dispose()
+
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+"""
+    Name: Query Plan Check
+    Description: Checks that the calendar and daily view date range queries search the start_time index instead of
+                 scanning the Event_ table, and times them against the old extract(year/month/day) filters
+
+    Date Created: 10/18/2026
+    Revisions:
+        - None
+
+    Usage:
+        python -m Benchmarks.query_plan_check [--events 50000]
+
+    Preconditions:
+        - SQLAlchemy must be installed and configured in the environment
+    Postconditions:
+        - Prints the query plans and timings
+    Errors/Exceptions:
+        - Exits with status 1 if a date range query doesn't use an index
+    Side Effects:
+        - Creates (and deletes) a temporary database
+    Invariants:
+        - busybee.db isn't touched
+    Known Faults:
+        - None
+"""
+
+
+# Imports
+import argparse
+import os
+import sys
+import tempfile
+from datetime import datetime, timedelta
+from time import perf_counter
+from sqlalchemy import select, extract, insert
+from Models import Event_, Task
+from Models.item import Item
+from Models.databaseEnums import ItemType
+from queries import events_between, month_bounds, day_bounds, explain_query_plan
+import database
+
+
+def fill(session, events:int):
+    """Insert one event (and one task) every few hours, starting at 2020-01-01"""
+    start = datetime(2020, 1, 1)
+    items = [{"id": i, "name": f"Item {i}", "type": ItemType.EVENT if i % 2 else ItemType.TASK} for i in range(1, 2 * events + 1)]
+    session.execute(insert(Item.__table__), items)
+    session.execute(insert(Event_.__table__), [{"id": i, "start_time": start + timedelta(hours=3 * i)} for i in range(1, 2 * events + 1, 2)])
+    session.execute(insert(Task.__table__), [{"id": i, "due_date": start + timedelta(hours=3 * i)} for i in range(2, 2 * events + 1, 2)])
+    session.commit()
+
+
+def time_query(session, stmt, repeat:int=20) -> float:
+    """Average time in milliseconds to fetch all rows of a statement"""
+    start = perf_counter()
+    for _ in range(repeat):
+        session.execute(stmt).all()
+
+    return (perf_counter() - start) / repeat * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Check and time date range query plans")
+    parser.add_argument("--events", type=int, default=50000, help="number of events (and tasks) in the database")
+    args = parser.parse_args()
+
+    month, day = (2022, 6), datetime(2022, 6, 15)
+    checks = {
+        "month (range)": events_between(*month_bounds(*month)),
+        "day (range)": events_between(*day_bounds(day)),
+        "task due dates (range)": select(Task).where(Task.due_date >= day, Task.due_date < day + timedelta(days=7)),
+    }
+    old = {
+        "month (extract)": select(Event_).where(
+            extract("year", Event_.start_time) == month[0],
+            extract("month", Event_.start_time) == month[1]
+        ),
+        "day (extract)": select(Event_).where(
+            extract("year", Event_.start_time) == day.year,
+            extract("month", Event_.start_time) == day.month,
+            extract("day", Event_.start_time) == day.day
+        ),
+    }
+
+    failed = False
+    with tempfile.TemporaryDirectory() as directory:
+        db = database.Database(os.path.join(directory, "query_plan.db"))
+        with db.get_session() as session:
+            fill(session, args.events)
+
+            for name, stmt in {**checks, **old}.items():
+                plan = explain_query_plan(session, stmt)
+                print(f"{name:24} {time_query(session, stmt):8.2f} ms  {plan[0]}")
+
+                # the range queries must search an index, not scan the table
+                if name in checks and not (plan[0].startswith("SEARCH") and "USING INDEX" in plan[0]):
+                    failed = True
+                    print(f"    expected SEARCH ... USING INDEX for {name}")
+        db.dispose()
+
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
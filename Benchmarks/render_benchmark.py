@@ -0,0 +1,268 @@
+"""
+    Name: Render Benchmark
+    Description: Render-timing harness of the screens and modals. Starts BusyBeeApp on a seeded database (see
+                 Benchmarks.dataset) in an offscreen window, then drives it like a user would: pages through months,
+                 opens the daily view, switches screens, opens and closes each modal, and toggles the theme. For each
+                 action it records the time until its first frame was drawn, the time of every frame drawn until the
+                 app settled (no work pending on the executor for a moment), and the widgets and canvas
+                 instructions on screen afterwards. The report is written as JSON, and can be compared with an
+                 earlier report (e.g. from the main branch in CI)
+
+    Date Created: 10/18/2026
+    Revisions:
+        - None
+
+    Usage:
+        python -m Benchmarks.render_benchmark [--items 10000] [--output render_report.json] [--size 1024x600]
+        python -m Benchmarks.render_benchmark --baseline main_report.json [--threshold 1.5] [--count-threshold 1.1]
+        xvfb-run python -m Benchmarks.render_benchmark --video-driver x11
+
+    Preconditions:
+        - Kivy must be installed, with SDL2 able to open a window with the video driver (SDL's "offscreen" driver
+          needs EGL, use --video-driver x11 under xvfb-run without it)
+        - SQLAlchemy must be installed and configured in the environment
+    Postconditions:
+        - The report has the settings it was run with, and the timings and counts of each action
+    Errors/Exceptions:
+        - Exits with status 1 if an action's first frame or 95th percentile frame is slower than in the baseline by
+          more than the threshold (and min-ms), or it has more widgets or canvas instructions than the count threshold
+    Side Effects:
+        - Creates (and deletes) a temporary database, opens an (offscreen) window, and writes the report
+    Invariants:
+        - busybee.db isn't touched
+    Known Faults:
+        - The items are placed around the current month (that's what the app shows first), so their dates change
+          from month to month, their number and shape don't
+        - Frame times are from the start of the frame's Clock tick to its flip, the time Kivy sleeps to cap the
+          frame rate isn't counted
+"""
+
+
+# Imports
+import argparse
+import json
+import os
+import platform
+import sys
+import tempfile
+from datetime import datetime
+from statistics import mean
+
+
+THRESHOLD = 1.5 # a time more than this times its baseline is a regression
+MIN_MS = 5.0 # ... and more than this many milliseconds slower
+COUNT_THRESHOLD = 1.1 # widget or canvas instruction counts more than this times their baseline are a regression
+SETTLE_SECONDS = 0.5 # an action is done once no work has been pending for this long (frames keep being drawn
+                     # while e.g. a text cursor blinks)
+MAX_SECONDS = 30.0 # longest an action is waited for
+
+
+def percentile(values:list[float], share:float) -> float:
+    """The value share of the values are at or below (nearest rank)"""
+    values = sorted(values)
+    return values[max(int(len(values) * share + 0.5) - 1, 0)] if values else 0.0
+
+
+def run(args) -> dict:
+    """Start the app, drive it through every action, and return the report"""
+    os.environ.setdefault("KIVY_NO_ARGS", "1")
+    os.environ.setdefault("KIVY_NO_CONSOLELOG", "1")
+    os.environ.setdefault("SDL_VIDEODRIVER", args.video_driver)
+
+    width, height = args.size.split("x")
+    from kivy.config import Config # the window's size must be set before the window is created
+    Config.set("graphics", "width", width)
+    Config.set("graphics", "height", height)
+
+    import kivy
+    import database
+    from sqlalchemy import func, select
+    from kivy.clock import Clock
+    from kivy.core.window import Window
+    from kivy.graphics import Canvas, InstructionGroup
+    from kivy.uix.modalview import ModalView
+    from busybee import BusyBeeApp
+    from executor import get_executor
+    from Models import Event_, Task
+    from Benchmarks.dataset import DatasetSpec, generate
+
+    def instruction_count(group) -> int:
+        """Graphics instructions in an instruction group, with its nested groups (and a canvas' before and after)"""
+        count = instruction_count(group.before) if isinstance(group, Canvas) and group.has_before else 0
+        for instruction in group.children:
+            count += instruction_count(instruction) if isinstance(instruction, InstructionGroup) else 1
+        if isinstance(group, Canvas) and group.has_after:
+            count += instruction_count(group.after)
+
+        return count
+
+    def close_modals():
+        """Dismiss the open modals"""
+        for widget in list(Window.children):
+            if isinstance(widget, ModalView):
+                widget.dismiss()
+
+    actions = []
+    with tempfile.TemporaryDirectory() as directory:
+        # the items are around the current month, the one the calendar shows first
+        now = datetime.now()
+        spec = DatasetSpec(args.items, args.seed, start=datetime(now.year - 1, now.month, 1))
+        db = database.use_database(os.path.join(directory, "render.db")) # the screens' sessions use it too
+        generate(db, spec)
+        with db.get_session() as session:
+            event_id = session.scalar(select(func.min(Event_.id)))
+            task_id = session.scalar(select(func.min(Task.id)))
+
+        class RenderBenchmarkApp(BusyBeeApp):
+            """BusyBeeApp driven through the actions, timing every frame"""
+            screen_warm_up_delay = None # screens are built when they're first shown, like a user would see
+
+            def on_start(self):
+                calendar = lambda: self.screen_manager.get_screen("calendar")
+                daily = lambda: self.screen_manager.get_screen("daily")
+                self.script = [ # name, what it does
+                    ("next month", lambda: calendar().change_month(1)),
+                    ("next month again", lambda: calendar().change_month(1)),
+                    ("previous month", lambda: calendar().change_month(-1)),
+                    ("open daily view", lambda: calendar().open_daily_view(15)),
+                    ("next day", lambda: daily().navigate_next_day()),
+                    ("switch to to-do list", lambda: self.switch_to_screen("todo")),
+                    ("open add task modal", self.open_add_task_modal),
+                    ("close add task modal", close_modals),
+                    ("open edit task modal", lambda: self.open_edit_task_modal(task_id)),
+                    ("close edit task modal", close_modals),
+                    ("switch to calendar", lambda: self.switch_to_screen("calendar")),
+                    ("open add event modal", self.open_add_event_modal),
+                    ("close add event modal", close_modals),
+                    ("open edit event modal", lambda: calendar().open_edit_event_modal(event_id)),
+                    ("close edit event modal", close_modals),
+                    ("open search modal", self.open_search_modal),
+                    ("close search modal", close_modals),
+                    ("toggle theme", self.toggle_theme),
+                    ("toggle theme back", self.toggle_theme),
+                ]
+                Window.bind(on_flip=self.on_frame_drawn)
+                self.start_action("start", None, app_start)
+
+            def start_action(self, name, do, start=None):
+                """Run an action (start is given for the app's start, which has already begun) and time its frames"""
+                self.action = {"name": name, "frame_ms": [], "first_frame_ms": None}
+                self.action_start = Clock.time() if start is None else start
+                self.quiet_since = self.action_start
+                if do is not None:
+                    do()
+                Clock.schedule_interval(self.wait_until_settled, 0)
+
+            def on_frame_drawn(self, *args):
+                """Window flip: time the frame from the start of its Clock tick"""
+                now = Clock.time()
+                if self.action["first_frame_ms"] is None:
+                    self.action["first_frame_ms"] = (now - self.action_start) * 1000
+                self.action["frame_ms"].append((now - Clock.get_time()) * 1000)
+
+            def wait_until_settled(self, dt):
+                """Every frame: once the app has settled, record the action and start the next one"""
+                now = Clock.time()
+                if get_executor().busy():
+                    self.quiet_since = now
+                if now - self.quiet_since < SETTLE_SECONDS and now - self.action_start < MAX_SECONDS:
+                    return
+
+                frames = self.action.pop("frame_ms")
+                self.action.update({
+                    "frames": len(frames),
+                    "mean_frame_ms": mean(frames) if frames else 0.0,
+                    "p95_frame_ms": percentile(frames, 0.95),
+                    "max_frame_ms": max(frames, default=0.0),
+                    "widgets": sum(1 for root in Window.children for widget in root.walk()),
+                    "canvas_instructions": instruction_count(Window.canvas),
+                    "settled": now - self.action_start < MAX_SECONDS,
+                    "frame_ms": frames,
+                })
+                actions.append(self.action)
+
+                if self.script:
+                    name, do = self.script.pop(0)
+                    Clock.schedule_once(lambda dt: self.start_action(name, do), 0)
+                else:
+                    self.stop()
+                return False
+
+        app_start = Clock.time()
+        RenderBenchmarkApp().run()
+        get_executor().wait()
+        db.dispose()
+
+    return {
+        "settings": {
+            "items": args.items, "seed": args.seed, "size": args.size, "video_driver": os.environ["SDL_VIDEODRIVER"],
+            "window": type(Window).__name__, "kivy": kivy.__version__, "python": platform.python_version(),
+            "platform": platform.platform(),
+        },
+        "actions": actions,
+    }
+
+
+def compare(report:dict, baseline:dict, args) -> list[str]:
+    """The regressions of each action against the baseline report"""
+    regressions = []
+    baseline_actions = {action["name"]: action for action in baseline["actions"]}
+    for action in report["actions"]:
+        base = baseline_actions.get(action["name"])
+        if base is None:
+            continue
+
+        for metric in ("first_frame_ms", "p95_frame_ms"):
+            value, base_value = action[metric] or 0.0, base[metric] or 0.0
+            if value > base_value * args.threshold and value - base_value > args.min_ms:
+                regressions.append(f"{action['name']}: {metric[:-3].replace('_', ' ')} took {value:.1f}ms, {base_value:.1f}ms in the baseline")
+        for metric in ("widgets", "canvas_instructions"):
+            if action[metric] > base[metric] * args.count_threshold:
+                regressions.append(f"{action['name']}: {action[metric]} {metric.replace('_', ' ')}, {base[metric]} in the baseline")
+
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Time the frames of driving the app's screens and modals")
+    parser.add_argument("--items", type=int, default=10000, help="events and tasks in the database")
+    parser.add_argument("--seed", type=int, default=0, help="seed of the generated database")
+    parser.add_argument("--size", default="1024x600", help="window size, WIDTHxHEIGHT")
+    parser.add_argument("--video-driver", default="offscreen", help="SDL video driver (unless SDL_VIDEODRIVER is set)")
+    parser.add_argument("--output", default="render_report.json", help="where the JSON report is written")
+    parser.add_argument("--baseline", help="earlier report to compare with")
+    parser.add_argument("--threshold", type=float, default=THRESHOLD, help="largest slow down allowed (time / baseline)")
+    parser.add_argument("--min-ms", type=float, default=MIN_MS, help="smallest slow down (ms) that counts as a regression")
+    parser.add_argument("--count-threshold", type=float, default=COUNT_THRESHOLD, help="largest growth of widget and canvas instruction counts")
+    args = parser.parse_args()
+
+    report = run(args)
+    with open(args.output, "w") as file:
+        json.dump(report, file, indent=4)
+        file.write("\n")
+
+    print(f"{'action':24} {'first frame':>12} {'frames':>7} {'mean':>9} {'p95':>9} {'widgets':>8} {'instructions':>13}")
+    for action in report["actions"]:
+        first_frame = f"{action['first_frame_ms']:10.1f}ms" if action["first_frame_ms"] is not None else f"{'-':>12}"
+        print(f"{action['name']:24} {first_frame} {action['frames']:7} {action['mean_frame_ms']:7.1f}ms "
+              f"{action['p95_frame_ms']:7.1f}ms {action['widgets']:8} {action['canvas_instructions']:13}")
+    print(f"\nwrote the report to {args.output}")
+
+    failed = False
+    for action in report["actions"]:
+        if not action["settled"]:
+            failed = True
+            print(f"    {action['name']} didn't settle in {MAX_SECONDS:g}s")
+
+    if args.baseline:
+        with open(args.baseline) as file:
+            baseline = json.load(file)
+        for regression in compare(report, baseline, args):
+            failed = True
+            print(f"    {regression}")
+
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
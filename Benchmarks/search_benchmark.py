@@ -0,0 +1,211 @@
+"""
+    Name: Search Benchmark
+    Description: Times search_items() on a database of many events and tasks (bulk inserted, so the search index is
+                 filled by its triggers) for what a user types: short prefixes, whole words, several words, common and
+                 rare words, category names, and words nothing has. Checks the best match is found even when it's
+                 the oldest of thousands of matches. Also checks the index stays in sync when items,
+                 places, and category names are changed or deleted through the ORM, and that a database from before
+                 the index existed is indexed when it's opened
+
+    Date Created: 10/18/2026
+    Revisions:
+        - None
+
+    Usage:
+        python -m Benchmarks.search_benchmark [--items 100000] [--repeat 20] [--budget-ms 10]
+
+    Preconditions:
+        - SQLAlchemy must be installed and configured in the environment
+        - SQLite must have the FTS5 extension (Python's bundled SQLite does)
+    Postconditions:
+        - Prints the median and worst time of each search, and how many results it found
+    Errors/Exceptions:
+        - Exits with status 1 if a search's median time is over the budget, the best match isn't ranked first, or
+          the search index is out of sync
+    Side Effects:
+        - Creates (and deletes) temporary databases
+    Invariants:
+        - busybee.db isn't touched
+    Known Faults:
+        - Times depend on the machine, set the budget for the machine it runs on
+"""
+
+
+# Imports
+import argparse
+import os
+import sys
+import tempfile
+from datetime import datetime, timedelta
+from statistics import median
+from time import perf_counter
+from sqlalchemy import text
+import database
+from bulk import insert_items
+from Models import Category, Event_, Task
+from search import SEARCH_TABLE, search_items
+
+
+BUDGET_MS = 10.0 # default budget for the median time of each search
+WORDS = ("alpha bravo charlie delta echo foxtrot golf hotel india juliet kilo lima mike november oscar papa quebec "
+         "romeo sierra tango").split() # words the names and notes are made of
+SEARCHES = ("al", "me", "alpha", "meet", "tango nov", "task 123", "tango task 4999", "chem", "lab rep", "zzz")
+
+
+def fill(session, count:int):
+    """
+    Bulk insert count items, half events and half tasks (in the Chemistry category), plus a few lab reports, after
+    the oldest item, a meeting (half the items have "meeting" in their name, none start with it)
+    """
+    chemistry = Category(name="Chemistry", color_hex="#FFFFFF")
+    session.add(chemistry)
+    session.flush()
+    insert_items(session, Task, [{"name": "Meeting with advisor"}])
+
+    events, tasks = count // 2, count - count // 2
+    start = datetime(2026, 1, 1, 9)
+    insert_items(session, Event_, [
+        {"name": f"{WORDS[i % 20]} {WORDS[i * 7 % 20]} meeting {i}", "notes": f"notes {WORDS[i * 3 % 20]}",
+         "place": f"Room {i % 100}", "start_time": start + timedelta(minutes=i)}
+        for i in range(events)
+    ])
+    insert_items(session, Task, [
+        {"name": f"{WORDS[i % 20]} task {i}", "notes": "", "due_date": start + timedelta(hours=i)}
+        for i in range(tasks)
+    ], [[chemistry.id]] * tasks)
+    insert_items(session, Task, [{"name": f"Lab report {i}"} for i in range(5)])
+    session.commit()
+
+
+def time_searches(session, searches, repeat:int) -> dict:
+    """The median and worst time (ms) of each search, and its number of results"""
+    results = {}
+    for search_text in searches:
+        times = []
+        for _ in range(repeat):
+            start = perf_counter()
+            found = search_items(session, search_text)
+            times.append((perf_counter() - start) * 1000)
+        results[search_text] = (median(times), max(times), len(found))
+
+    return results
+
+
+def check_ranking(session) -> list[str]:
+    """Checks the best matches come first however many newer, worse matches there are, returns what was wrong"""
+    problems = []
+    for search_text, best in (("meet", "Meeting with advisor"), ("meeting adv", "Meeting with advisor"), ("lab", "Lab report 4")):
+        found = [result.name for result in search_items(session, search_text)]
+        if not found or found[0] != best:
+            problems.append(f"searching {search_text!r} found {found[:3]} first, expected {best!r}")
+
+    return problems
+
+
+def check_sync(db) -> list[str]:
+    """Changes items through the ORM and checks what search finds, returns what was wrong"""
+    problems = []
+
+    def expect(session, search_text, names):
+        found = sorted(result.name for result in search_items(session, search_text))
+        if found != sorted(names):
+            problems.append(f"searching {search_text!r} found {found}, expected {sorted(names)}")
+
+    with db.get_session() as session:
+        biology = Category(name="Biology", color_hex="#FFFFFF")
+        event = Event_(name="Lab report review", notes="bring goggles", place="Malott Hall", start_time=datetime(2026, 3, 1, 9))
+        event.categories = [biology]
+        task = Task(name="Write lab report", notes="due friday")
+        session.add_all([event, task])
+        session.commit()
+        expect(session, "lab rep", ["Lab report review", "Write lab report"])
+        expect(session, "goggles", ["Lab report review"])
+        expect(session, "malott", ["Lab report review"])
+        expect(session, "bio", ["Lab report review"])
+
+        biology.name = "Chemistry" # category renamed
+        event.place = "Eaton Hall" # place changed
+        task.name = "Write essay" # name changed
+        session.commit()
+        expect(session, "bio", [])
+        expect(session, "chem", ["Lab report review"])
+        expect(session, "malott", [])
+        expect(session, "eaton", ["Lab report review"])
+        expect(session, "lab", ["Lab report review"])
+
+        event.categories = [] # category removed
+        session.delete(task)
+        session.commit()
+        expect(session, "chem", [])
+        expect(session, "essay", [])
+
+        indexed = session.execute(text(f"SELECT count(*) FROM {SEARCH_TABLE}")).scalar()
+        items = session.execute(text("SELECT count(*) FROM Item")).scalar()
+        if indexed != items:
+            problems.append(f"{indexed} rows in the search index for {items} items")
+
+    return problems
+
+
+def check_upgrade(path:str) -> list[str]:
+    """Opens a database from before the search index (items, no index, version 1), checks its items are indexed"""
+    db = database.Database(path)
+    with db.get_session() as session:
+        session.add(Task(name="Old lab report"))
+        session.commit()
+        session.execute(text(f"DROP TABLE {SEARCH_TABLE}"))
+        session.execute(text("PRAGMA user_version = 1"))
+        session.commit()
+    db.dispose()
+
+    db = database.Database(path)
+    with db.get_session() as session:
+        found = [result.name for result in search_items(session, "old lab")]
+    db.dispose()
+
+    return [] if found == ["Old lab report"] else [f"an upgraded database's items weren't indexed, found {found}"]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Time full-text searches of many events and tasks")
+    parser.add_argument("--items", type=int, default=100000, help="number of events and tasks searched")
+    parser.add_argument("--repeat", type=int, default=20, help="number of times each search is timed")
+    parser.add_argument("--budget-ms", type=float, default=BUDGET_MS, help="maximum median time of each search")
+    args = parser.parse_args()
+
+    failed = False
+    with tempfile.TemporaryDirectory() as directory:
+        db = database.Database(os.path.join(directory, "search.db"))
+        start = perf_counter()
+        with db.get_session() as session:
+            fill(session, args.items)
+        print(f"inserted {args.items} items (and indexed them) in {perf_counter() - start:.1f}s\n")
+
+        with db.get_session() as session:
+            time_searches(session, SEARCHES, 1) # warm up the page cache
+            results = time_searches(session, SEARCHES, args.repeat)
+            problems = check_ranking(session)
+
+        print(f"{'search':18} {'median':>9} {'worst':>9} {'results':>8}")
+        for search_text, (median_ms, max_ms, found) in results.items():
+            print(f"{search_text:18} {median_ms:7.2f}ms {max_ms:7.2f}ms {found:8}")
+            if median_ms > args.budget_ms:
+                failed = True
+                print(f"    over the {args.budget_ms:g} ms budget")
+        db.dispose()
+
+        sync_db = database.Database(os.path.join(directory, "sync.db"))
+        problems += check_sync(sync_db) + check_upgrade(os.path.join(directory, "upgrade.db"))
+        sync_db.dispose()
+
+    for problem in problems:
+        failed = True
+        print(f"    {problem}")
+    if not problems:
+        print("\nbest matches ranked first, search index in sync after inserts, updates, deletes, and upgrading")
+
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
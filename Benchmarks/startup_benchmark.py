@@ -0,0 +1,98 @@
+"""
+    Name: Startup Database Benchmark
+    Description: Compares the cost of the database work done at startup before and after the shared database registry.
+                 Before, each of the eight screen modules built its own engine and ran create_all at import time.
+                 Now every module shares one lazily created engine per path
+
+    Date Created: 10/18/2026
+    Revisions:
+        - None
+
+    Usage:
+        python -m Benchmarks.startup_benchmark [--modules 8] [--repeat 20]
+
+    Preconditions:
+        - SQLAlchemy must be installed and configured in the environment
+    Postconditions:
+        - Prints the average time of each strategy and the speed up
+    Errors/Exceptions:
+        - None
+    Side Effects:
+        - Creates (and deletes) temporary databases
+    Invariants:
+        - busybee.db isn't touched
+    Known Faults:
+        - None
+"""
+
+
+# Imports
+import argparse
+import os
+import tempfile
+from time import perf_counter
+from sqlalchemy import create_engine, text
+from Models.base import Base # metadata of all models
+import Models # registers all models with Base
+import database
+
+
+def legacy_startup(db_path:str, modules:int):
+    """One engine and one create_all per screen module, like get_database() used to do at import time"""
+    engines = []
+    for _ in range(modules):
+        engine = create_engine(f"sqlite:///{db_path}")
+        Base.metadata.create_all(engine)
+        engines.append(engine)
+
+    # first session of the app
+    with engines[0].connect() as connection:
+        connection.execute(text("SELECT 1"))
+
+    for engine in engines:
+        engine.dispose()
+
+
+def registry_startup(db_path:str, modules:int):
+    """Every screen module asks the registry for the database, only the first session creates the engine"""
+    databases = [database.use_database(db_path) for _ in range(modules)]
+
+    # first session of the app
+    with databases[0].get_session() as session:
+        session.execute(text("SELECT 1"))
+
+    # forget the database, so the next run starts cold
+    database.use_database()
+    databases[0].dispose()
+    database._databases.pop(db_path, None)
+
+
+def time_strategy(strategy, modules:int, repeat:int) -> float:
+    """Returns the average time in seconds of a strategy, each run uses a fresh database file"""
+    total = 0
+    with tempfile.TemporaryDirectory() as directory:
+        for i in range(repeat):
+            db_path = os.path.join(directory, f"startup_{strategy.__name__}_{i}.db")
+            start = perf_counter()
+            strategy(db_path, modules)
+            total += perf_counter() - start
+
+    return total / repeat
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark database work done at startup")
+    parser.add_argument("--modules", type=int, default=8, help="number of modules that ask for the database")
+    parser.add_argument("--repeat", type=int, default=20, help="number of cold starts to average")
+    args = parser.parse_args()
+
+    legacy = time_strategy(legacy_startup, args.modules, args.repeat)
+    registry = time_strategy(registry_startup, args.modules, args.repeat)
+
+    print(f"per-module engines: {legacy * 1000:8.2f} ms")
+    print(f"shared registry:    {registry * 1000:8.2f} ms")
+    print(f"speed up:           {legacy / registry:8.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,147 @@
+"""
+    Name: Task List Benchmark
+    Description: Compares the to-do list built with one TaskBox per task (the old GridLayout in a ScrollView) with the
+                 RecycleView task list, which only has TaskBoxes for the rows on screen. Each list is built for 10k
+                 tasks and scrolled from top to bottom, timing the build, every frame, and the peak memory (RSS)
+
+    Date Created: 10/18/2026
+    Revisions:
+        - None
+
+    Usage:
+        python -m Benchmarks.task_list_benchmark [--tasks 10000] [--frames 120]
+
+    Preconditions:
+        - Kivy must be installed and able to open a window (e.g. run under xvfb-run without a display)
+    Postconditions:
+        - Prints build time, frame times, and peak RSS of each task list
+    Errors/Exceptions:
+        - None
+    Side Effects:
+        - Opens a window for each task list, each one runs in its own process so their peak RSS is separate
+    Invariants:
+        - No database is used, the tasks are generated
+    Known Faults:
+        - ru_maxrss is in kilobytes on Linux and bytes on macOS, so RSS is only comparable on the same OS
+"""
+
+
+# Imports
+import argparse
+import json
+import os
+import resource
+import subprocess
+import sys
+from datetime import datetime, timedelta
+from time import perf_counter
+
+
+def tasks(count:int) -> list:
+    """Generated tasks, like the ones task_occurrences() returns"""
+    from Models.databaseEnums import Priority
+    from occurrences import TaskOccurrence
+
+    start = datetime(2026, 1, 1)
+    return [
+        TaskOccurrence(i, f"Task {i}", start + timedelta(hours=i), Priority(i % 3), i % 4 == 0, [f"Category {i % 5}"])
+        for i in range(count)
+    ]
+
+
+def run(mode:str, count:int, frames:int):
+    """Build and scroll one task list in this process, then print its results as JSON"""
+    os.environ.setdefault("KIVY_NO_ARGS", "1")
+    os.environ.setdefault("KIVY_NO_CONSOLELOG", "1")
+
+    from kivy.clock import Clock
+    from kivy.metrics import dp
+    from kivy.uix.gridlayout import GridLayout
+    from kivy.uix.recycleboxlayout import RecycleBoxLayout
+    from kivy.uix.recycleview import RecycleView
+    from kivy.uix.scrollview import ScrollView
+    from busybee import BusyBeeApp # theme colors TaskBox needs
+    from screens.todolistview import TaskBox, TaskListAdapter
+
+    results = {"mode": mode, "tasks": count, "frame_ms": []}
+
+    class TaskListBenchmarkApp(BusyBeeApp):
+        """BusyBeeApp (for its theme) showing only a task list"""
+        def build(self):
+            start = perf_counter()
+
+            if mode == "recycled":
+                self.task_list = RecycleView(viewclass="TaskBox")
+                layout = RecycleBoxLayout(orientation="vertical", default_size=(None, dp(60)), default_size_hint=(1, None),
+                                          size_hint_y=None, spacing=dp(5))
+                layout.bind(minimum_height=layout.setter("height"))
+                self.task_list.add_widget(layout)
+                TaskListAdapter(self.task_list).set_tasks(tasks(count))
+            else:
+                self.task_list = ScrollView()
+                layout = GridLayout(cols=1, size_hint_y=None, spacing=dp(5))
+                layout.bind(minimum_height=layout.setter("height"))
+                adapter = TaskListAdapter(None)
+                for index, task in enumerate(tasks(count)):
+                    task_box = TaskBox(size_hint_y=None, height=dp(60))
+                    task_box.refresh_view_attrs(None, index, adapter.task_row(task))
+                    layout.add_widget(task_box)
+                self.task_list.add_widget(layout)
+
+            self.build_start = start
+            self.frame = 0
+            Clock.schedule_once(self.first_frame, 0)
+
+            return self.task_list
+
+        def first_frame(self, dt):
+            """Time from starting the build to the first frame, then start scrolling"""
+            results["build_ms"] = (perf_counter() - self.build_start) * 1000
+            self.last_frame = perf_counter()
+            Clock.schedule_interval(self.scroll, 0)
+
+        def scroll(self, dt):
+            """Scroll a bit further down every frame, and time the frame"""
+            now = perf_counter()
+            results["frame_ms"].append((now - self.last_frame) * 1000)
+            self.last_frame = now
+
+            self.frame += 1
+            self.task_list.scroll_y = max(0, 1 - self.frame / frames)
+
+            if self.frame >= frames:
+                self.stop()
+                return False
+
+    TaskListBenchmarkApp().run()
+
+    frame_ms = sorted(results.pop("frame_ms"))
+    results["mean_frame_ms"] = sum(frame_ms) / len(frame_ms)
+    results["p95_frame_ms"] = frame_ms[int(len(frame_ms) * 0.95) - 1]
+    results["max_rss_mb"] = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    print(json.dumps(results))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare the eager and RecycleView task lists")
+    parser.add_argument("--tasks", type=int, default=10000, help="number of tasks in the list")
+    parser.add_argument("--frames", type=int, default=120, help="number of frames to scroll for")
+    parser.add_argument("--mode", choices=["eager", "recycled"], help="run one task list (used by the benchmark itself)")
+    args = parser.parse_args()
+
+    if args.mode:
+        run(args.mode, args.tasks, args.frames)
+        return
+
+    print(f"{'task list':10} {'build':>10} {'mean frame':>11} {'p95 frame':>10} {'peak RSS':>10}")
+    for mode in ("eager", "recycled"):
+        output = subprocess.run(
+            [sys.executable, "-m", "Benchmarks.task_list_benchmark", "--mode", mode, "--tasks", str(args.tasks), "--frames", str(args.frames)],
+            capture_output=True, text=True, check=True
+        ).stdout
+        result = json.loads(output.strip().splitlines()[-1])
+        print(f"{mode:10} {result['build_ms']:8.0f}ms {result['mean_frame_ms']:9.1f}ms {result['p95_frame_ms']:8.1f}ms {result['max_rss_mb']:8.0f}MB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,151 @@
+"""
+    Name: Theme Toggle Benchmark
+    Description: Times toggling the theme with every screen built and a large to-do list and calendar shown, the way
+                 toggle_theme() works now (theme colors are Kivy properties, widgets are recolored in place) and the
+                 way it used to (every screen's __init__ run again and the to-do list populated again). Each toggle
+                 is timed until the next frame, and the SQL statements and widgets of each toggle are checked
+
+    Date Created: 10/18/2026
+    Revisions:
+        - None
+
+    Usage:
+        python -m Benchmarks.theme_toggle_benchmark [--tasks 10000] [--events 2000] [--toggles 20]
+
+    Preconditions:
+        - Kivy must be installed and able to open a window (e.g. run under xvfb-run without a display)
+        - SQLAlchemy must be installed and configured in the environment
+    Postconditions:
+        - Prints the mean and worst toggle latency of each way, and the SQL statements they ran
+    Errors/Exceptions:
+        - Exits with status 1 if toggling the theme runs SQL or replaces any widget of the screens
+    Side Effects:
+        - Creates (and deletes) a temporary database, and opens a window
+    Invariants:
+        - busybee.db isn't touched
+    Known Faults:
+        - None
+"""
+
+
+# Imports
+import argparse
+import os
+import sys
+import tempfile
+from time import perf_counter
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Time toggling the theme with a large to-do list and calendar")
+    parser.add_argument("--tasks", type=int, default=10000, help="number of tasks in the to-do list")
+    parser.add_argument("--events", type=int, default=2000, help="number of events (spread over the current month)")
+    parser.add_argument("--toggles", type=int, default=20, help="number of toggles timed each way")
+    args = parser.parse_args()
+
+    os.environ.setdefault("KIVY_NO_ARGS", "1")
+    os.environ.setdefault("KIVY_NO_CONSOLELOG", "1")
+
+    import database
+    from datetime import datetime, timedelta
+    from kivy.clock import Clock
+    from busybee import BusyBeeApp
+    from bulk import insert_items
+    from Models import Event_
+    from theme import Theme
+    from Benchmarks.todo_query_count import StatementCounter, fill
+
+    results = {}
+    with tempfile.TemporaryDirectory() as directory:
+        db = database.use_database(os.path.join(directory, "theme_toggle.db")) # the screens' sessions use it too
+        month = datetime.now().replace(day=1, hour=9, minute=0, second=0, microsecond=0)
+        with db.get_session() as session:
+            fill(session, args.tasks)
+            insert_items(session, Event_, [
+                {"name": f"Event {i}", "start_time": month + timedelta(hours=i * 27 * 24 // max(args.events, 1))}
+                for i in range(args.events)
+            ])
+            session.commit()
+
+        class ThemeToggleBenchmarkApp(BusyBeeApp):
+            """BusyBeeApp that times theme toggles once every screen is built and the to-do list is shown"""
+            screen_warm_up_delay = None
+
+            def legacy_toggle_theme(self):
+                """How toggle_theme() used to work: rebuild every screen and load the to-do list again"""
+                theme = Theme.toggle(self.current_theme)
+                self.set_theme_settings(theme.get_settings())
+                self.current_theme = theme
+                for name in ("daily", "calendar", "todo"):
+                    self.screen_manager.get_screen(name).__init__()
+                self.screen_manager.get_screen("todo").populate()
+
+            def on_start(self):
+                for name in ("todo", "daily"):
+                    self.screen_manager.get_screen(name)
+                self.pending = [("in place", self.toggle_theme), ("legacy", self.legacy_toggle_theme)]
+                Clock.schedule_interval(self.wait_for_tasks, 0)
+
+            def wait_for_tasks(self, dt):
+                """Start once the to-do list is shown, and the months and days next to the ones shown are prefetched"""
+                if not self.screen_manager.get_screen("todo").ids.task_list.data:
+                    return
+                Clock.schedule_once(self.start_way, 1)
+                return False
+
+            def widgets(self):
+                """Every widget of the screens, to check nothing is replaced"""
+                return {id(widget) for screen in self.screen_manager.screens for widget in screen.walk(restrict=True)}
+
+            def start_way(self, *args):
+                self.way, self.toggle = self.pending.pop(0)
+                self.latencies = []
+                self.before = self.widgets()
+                self.counter = StatementCounter(db.engine).__enter__()
+                Clock.schedule_once(self.toggle_once, 0)
+
+            def toggle_once(self, dt):
+                self.start = perf_counter()
+                self.toggle()
+                Clock.schedule_once(self.next_frame, 0)
+
+            def next_frame(self, dt):
+                self.latencies.append((perf_counter() - self.start) * 1000)
+                if len(self.latencies) < args.toggles:
+                    Clock.schedule_once(self.toggle_once, 0)
+                    return
+
+                # let loads the toggles started finish before counting their statements
+                Clock.schedule_once(self.finish_way, 0.5)
+
+            def finish_way(self, dt):
+                self.counter.__exit__(None, None, None)
+                results[self.way] = {
+                    "mean_ms": sum(self.latencies) / len(self.latencies),
+                    "max_ms": max(self.latencies),
+                    "statements": self.counter.count,
+                    "replaced_widgets": len(self.before - self.widgets()),
+                }
+                if self.pending:
+                    self.start_way()
+                else:
+                    self.stop()
+
+        ThemeToggleBenchmarkApp().run()
+        db.dispose()
+
+    failed = False
+    print(f"{'toggle':9} {'mean':>9} {'worst':>9} {'statements':>11} {'replaced widgets':>17}")
+    for way, result in results.items():
+        print(f"{way:9} {result['mean_ms']:7.1f}ms {result['max_ms']:7.1f}ms {result['statements']:11} {result['replaced_widgets']:17}")
+
+    in_place = results.get("in place")
+    if in_place is None or in_place["statements"] or in_place["replaced_widgets"]:
+        failed = True
+        print("    toggling the theme ran SQL or replaced widgets")
+
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
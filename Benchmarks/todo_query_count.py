@@ -0,0 +1,138 @@
+"""
+    Name: To-Do Query Count
+    Description: Counts the SQL statements the to-do list runs to load its tasks. Loading categories lazily ran one
+                 SELECT per task (N+1), the to-do list queries now load them (and recurrences) in batches, so the
+                 number of statements must not grow with the number of tasks (selectinload does split its IN list
+                 into chunks of 500 tasks, so there's one more SELECT per 500 tasks)
+
+    Date Created: 10/18/2026
+    Revisions:
+        - None
+
+    Usage:
+        python -m Benchmarks.todo_query_count [--tasks 10 100 1000]
+
+    Preconditions:
+        - SQLAlchemy must be installed and configured in the environment
+    Postconditions:
+        - Prints the number of statements and time of each strategy for each number of tasks
+    Errors/Exceptions:
+        - Exits with status 1 if the batched queries run more statements than their limit
+    Side Effects:
+        - Creates (and deletes) temporary databases
+    Invariants:
+        - busybee.db isn't touched
+    Known Faults:
+        - None
+"""
+
+
+# Imports
+import argparse
+import math
+import os
+import sys
+import tempfile
+from datetime import datetime, timedelta
+from time import perf_counter
+from sqlalchemy import event, select
+from Models import Task, Category, Recurrence
+from Models.databaseEnums import Frequency, Priority
+from occurrences import task_occurrences
+from queries import tasks_sorted_by
+import database
+
+
+CHUNK = 500 # tasks per selectinload SELECT
+
+
+def statement_limit(tasks:int) -> int:
+    """Most statements batched_populate() can run: the tasks, their categories and recurrences, and exceptions"""
+    return 1 + 2 * math.ceil(tasks / CHUNK) + 1
+
+
+class StatementCounter:
+    """Counts the statements an engine executes while it's used in a "with" statement"""
+    def __init__(self, engine):
+        self.engine = engine
+        self.count = 0
+
+    def _count(self, *args):
+        self.count += 1
+
+    def __enter__(self):
+        event.listen(self.engine, "before_cursor_execute", self._count)
+        return self
+
+    def __exit__(self, *args):
+        event.remove(self.engine, "before_cursor_execute", self._count)
+
+
+def fill(session, tasks:int):
+    """Insert tasks with two categories each, every tenth task repeats weekly"""
+    categories = [Category(name=f"Category {i}", color_hex="#FFFFFF") for i in range(5)]
+    start = datetime(2026, 1, 1)
+
+    for i in range(tasks):
+        task = Task(name=f"Task {i}", due_date=start + timedelta(hours=i), priority=Priority(i % 3))
+        task.categories = [categories[i % 5], categories[(i + 1) % 5]]
+        if i % 10 == 0:
+            task.recurrence = Recurrence(frequency=Frequency.WEEKLY, times=4)
+        session.add(task)
+
+    session.commit()
+
+
+def lazy_populate(session):
+    """How ToDoListView.populate() loaded tasks before: categories touched twice per task, loaded lazily"""
+    tasks = session.scalars(select(Task).order_by(Task.due_date.asc())).all()
+    for task in tasks:
+        [category.name for category in task.categories] # debug print
+    for task in tasks:
+        ", ".join([category.name for category in task.categories]) # display
+
+
+def batched_populate(session):
+    """How ToDoListView.populate() loads tasks now (filter_tasks() uses the same loading options)"""
+    tasks = task_occurrences(session, session.scalars(tasks_sorted_by("Due Date")).unique().all())
+    for task in tasks:
+        task.categories # debug print
+    for task in tasks:
+        ", ".join(task.categories) # display
+
+
+def measure(db, populate) -> tuple[int, float]:
+    """Number of statements and milliseconds a populate function takes, in a fresh session"""
+    with db.get_session() as session, StatementCounter(db.engine) as counter:
+        start = perf_counter()
+        populate(session)
+        return counter.count, (perf_counter() - start) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Count the statements the to-do list runs")
+    parser.add_argument("--tasks", type=int, nargs="+", default=[10, 100, 1000], help="numbers of tasks to try")
+    args = parser.parse_args()
+
+    failed = False
+    print(f"{'tasks':>6} {'lazy':>16} {'batched':>16} {'limit':>6}")
+    for tasks in args.tasks:
+        with tempfile.TemporaryDirectory() as directory:
+            db = database.Database(os.path.join(directory, "todo_query_count.db"))
+            with db.get_session() as session:
+                fill(session, tasks)
+
+            lazy_count, lazy_ms = measure(db, lazy_populate)
+            batched_count, batched_ms = measure(db, batched_populate)
+            print(f"{tasks:6} {lazy_count:6} {lazy_ms:7.1f}ms {batched_count:6} {batched_ms:7.1f}ms {statement_limit(tasks):6}")
+            db.dispose()
+
+        if batched_count > statement_limit(tasks):
+            failed = True
+            print(f"    expected at most {statement_limit(tasks)} statements for {tasks} tasks")
+
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,310 @@
+"""
+    Name: View Benchmark
+    Description: Benchmark suite of the calendar, daily view, and to-do list on seeded synthetic databases (see
+                 Benchmarks.dataset) of 1k, 10k, 100k, and 1M events and tasks. For each view and size it times the
+                 view's query (the month summary, the day's events, or every task with its occurrences, loaded
+                 without the event cache like a view shown for the first time) and building its widgets from the
+                 result (CalendarView.bind_day_cells and show_month_summary, DailyView.display_events,
+                 ToDoListView.show_tasks and laying out its RecycleView). The medians are compared with a baseline
+                 file, and a scenario fails when it's slower than the baseline by more than a threshold
+
+                 Widgets are built in a BusyBeeApp started in its own process for each database size, nothing is
+                 clicked or shown to anyone. With --query-only only the queries are timed, without Kivy
+
+    Date Created: 10/18/2026
+    Revisions:
+        - None
+
+    Usage:
+        python -m Benchmarks.view_benchmark --save-baseline # record the baseline of this machine
+        python -m Benchmarks.view_benchmark [--scales 1000 10000 100000 1000000] [--repeat 5] [--threshold 1.5]
+                                            [--data-dir DIR] [--query-only]
+
+    Preconditions:
+        - SQLAlchemy must be installed and configured in the environment
+        - Unless --query-only, Kivy must be installed and able to open a window (e.g. run under xvfb-run without a
+          display)
+    Postconditions:
+        - Prints the median query and build time of each view and size, next to its baseline
+    Errors/Exceptions:
+        - Exits with status 1 if a scenario is slower than its baseline by more than the threshold (and min-ms)
+    Side Effects:
+        - Writes the seeded databases to the data directory (a temporary one by default), they're reused if it's given
+        - With --save-baseline, writes the medians to the baseline file
+    Invariants:
+        - busybee.db isn't touched
+    Known Faults:
+        - Baselines depend on the machine, record them on the machine the suite runs on before changing anything
+        - Generating the 1M database takes a few minutes, pass --data-dir to keep the databases between runs
+"""
+
+
+# Imports
+import argparse
+import gc
+import json
+import os
+import subprocess
+import sys
+import tempfile
+from datetime import datetime, timedelta
+from statistics import median
+from time import perf_counter
+import database
+from Benchmarks.dataset import GENERATOR_VERSION, DatasetSpec, generate
+from occurrences import event_occurrences, month_summary, todo_list_tasks
+from queries import day_bounds, month_bounds
+
+
+SCALES = [1000, 10000, 100000, 1000000] # events and tasks in each database
+VIEWS = ("calendar", "daily", "todo")
+CALENDAR_EVENTS = 2 # events shown in a day cell (DayCell.max_events)
+TODO_SORT = "Due Date" # the to-do list's default sort
+THRESHOLD = 1.5 # a median more than this times its baseline is a regression (runs on a busy machine vary by up to a third)
+MIN_MS = 5.0 # ... and more than this many milliseconds slower, so noise in fast scenarios isn't
+MIN_SECONDS = 0.5 # fast scenarios are repeated until they've run this long, so their median is steady
+BASELINE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "view_baselines.json")
+
+
+def scale_name(items:int) -> str:
+    """e.g. 1k for 1000, 1M for 1000000"""
+    for size, suffix in ((1000000, "M"), (1000, "k")):
+        if items >= size and items % size == 0:
+            return f"{items // size}{suffix}"
+
+    return str(items)
+
+
+def shown_dates(spec:DatasetSpec) -> tuple[tuple[int, int], datetime]:
+    """The month and day the views show: the middle of the dataset's date range, where every view has items"""
+    middle = spec.start + timedelta(days=spec.days // 2)
+    return (middle.year, middle.month), datetime(middle.year, middle.month, 15)
+
+
+def load_view(session, view:str, spec:DatasetSpec):
+    """The view's query, what the view loads on the data executor when it's shown"""
+    month, day = shown_dates(spec)
+    if view == "calendar":
+        return month_summary(session, *month_bounds(*month), per_day=CALENDAR_EVENTS)
+    if view == "daily":
+        return event_occurrences(session, *day_bounds(day))
+
+    return todo_list_tasks(session, TODO_SORT)
+
+
+def dataset(directory:str, spec:DatasetSpec) -> str:
+    """The path of the spec's database in the directory, generated first if it isn't there"""
+    path = os.path.join(directory, spec.name())
+    if os.path.exists(path):
+        return path
+
+    start = perf_counter()
+    partial = path + ".partial" # renamed once it's complete, so a cancelled run isn't reused
+    for leftover in (partial, partial + "-wal", partial + "-shm"):
+        if os.path.exists(leftover):
+            os.remove(leftover)
+    db = database.Database(partial)
+    summary = generate(db, spec)
+    db.dispose()
+    os.replace(partial, path)
+    print(f"generated {scale_name(spec.items)}: {summary.events} events, {summary.tasks} tasks, {summary.series} "
+          f"repeating, {summary.category_links} category links in {perf_counter() - start:.1f}s")
+
+    return path
+
+
+def repeat_runs(run, repeat:int) -> list:
+    """
+    Calls run once to warm up, then at least repeat times and for at least MIN_SECONDS, returns what each call returned.
+    Garbage is collected before each call, so one call's garbage isn't collected (and timed) in the next
+    """
+    run()
+    results = []
+    start = perf_counter()
+    while len(results) < repeat or perf_counter() - start < MIN_SECONDS:
+        gc.collect()
+        results.append(run())
+
+    return results
+
+
+def time_queries(path:str, spec:DatasetSpec, repeat:int) -> dict:
+    """The median time (ms) of each view's query"""
+    results = {}
+    db = database.Database(path)
+    with db.get_session() as session:
+        for view in VIEWS:
+            def run():
+                start = perf_counter()
+                load_view(session, view, spec)
+                return (perf_counter() - start) * 1000
+
+            results[view] = {"query_ms": median(repeat_runs(run, repeat))}
+    db.dispose()
+
+    return results
+
+
+def time_views(path:str, spec:DatasetSpec, repeat:int):
+    """Start the app on the database in this process, time each view's query and build, then print them as JSON"""
+    os.environ.setdefault("KIVY_NO_ARGS", "1")
+    os.environ.setdefault("KIVY_NO_CONSOLELOG", "1")
+
+    from kivy.clock import Clock
+    from busybee import BusyBeeApp
+    from executor import get_executor
+    from screens.todolistview import ToDoListView
+
+    db = database.use_database(path) # the screens' sessions use it too
+    month, day = shown_dates(spec)
+    results = {}
+
+    def build(view:str, screen, data):
+        """Build the view's widgets from what its query returned"""
+        if view == "calendar":
+            screen.current_year, screen.current_month = month
+            screen.bind_day_cells()
+            screen.show_month_summary(month, data)
+            screen.prefetcher.cancel() # nothing is prefetched while the next view is timed
+        elif view == "daily":
+            screen.current_date = screen.selected_date = day
+            screen.display_events(data)
+        else:
+            screen.show_tasks(data)
+            screen.ids.task_list.refresh_views() # RecycleView creates the rows on screen at the next frame otherwise
+
+    class ViewBenchmarkApp(BusyBeeApp):
+        """BusyBeeApp that shows each view, times it, and stops"""
+        screen_warm_up_delay = None # only the views being timed are built
+
+        def build_todo_list_view(self, name):
+            return ToDoListView(name=name) # not populated, the benchmark fills it
+
+        def on_start(self):
+            self.views = list(VIEWS)
+            Clock.schedule_once(self.show_next_view, 0)
+
+        def show_next_view(self, dt):
+            """Switch to the next view, it's timed at the next frame (once it's laid out)"""
+            if not self.views:
+                self.stop()
+                return
+            self.screen_manager.current = self.views[0]
+            Clock.schedule_once(self.time_view, 0)
+
+        def time_view(self, dt):
+            view = self.views.pop(0)
+            screen = self.screen_manager.get_screen(view)
+            get_executor().wait() # the screen's own first load doesn't run while it's timed
+
+            with db.get_session() as session:
+                def run():
+                    start = perf_counter()
+                    data = load_view(session, view, spec)
+                    loaded = perf_counter()
+                    build(view, screen, data)
+                    return (loaded - start) * 1000, (perf_counter() - loaded) * 1000
+
+                times = repeat_runs(run, repeat)
+
+            results[view] = {"query_ms": median(time[0] for time in times), "build_ms": median(time[1] for time in times)}
+            Clock.schedule_once(self.show_next_view, 0)
+
+    ViewBenchmarkApp().run()
+    get_executor().wait()
+    db.dispose()
+
+    print(json.dumps(results))
+
+
+def read_baseline(path:str, spec:DatasetSpec) -> dict:
+    """The baseline medians of each scenario, {} if there's no baseline of the same generator and seed"""
+    if not os.path.exists(path):
+        return {}
+
+    with open(path) as file:
+        baseline = json.load(file)
+    if (baseline.get("generator_version"), baseline.get("seed")) != (GENERATOR_VERSION, spec.seed):
+        print(f"{path} was recorded on other datasets (generator version or seed), not comparing with it")
+        return {}
+
+    return baseline["scenarios"]
+
+
+def save_baseline(path:str, spec:DatasetSpec, scenarios:dict):
+    """Write the medians of this run to the baseline file, keeping the other scenarios it has"""
+    baseline = {"generator_version": GENERATOR_VERSION, "seed": spec.seed, "scenarios": read_baseline(path, spec)}
+    for scenario, medians in scenarios.items():
+        baseline["scenarios"].setdefault(scenario, {}).update(medians)
+
+    with open(path, "w") as file:
+        json.dump(baseline, file, indent=4, sort_keys=True)
+        file.write("\n")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Time each view's query and build on seeded databases of several sizes")
+    parser.add_argument("--scales", type=int, nargs="+", default=SCALES, help="events and tasks in each database")
+    parser.add_argument("--seed", type=int, default=0, help="seed of the generated databases")
+    parser.add_argument("--repeat", type=int, default=5, help="number of times each scenario is timed")
+    parser.add_argument("--threshold", type=float, default=THRESHOLD, help="largest slow down allowed (median / baseline)")
+    parser.add_argument("--min-ms", type=float, default=MIN_MS, help="smallest slow down (ms) that counts as a regression")
+    parser.add_argument("--baseline", default=BASELINE_PATH, help="baseline file to compare with")
+    parser.add_argument("--save-baseline", action="store_true", help="write this run's medians to the baseline file")
+    parser.add_argument("--data-dir", help="where the databases are kept between runs (a temporary directory by default)")
+    parser.add_argument("--query-only", action="store_true", help="only time the queries (without Kivy)")
+    parser.add_argument("--views-of", help="time the views on one database (used by the suite itself)")
+    args = parser.parse_args()
+
+    if args.views_of:
+        time_views(args.views_of, DatasetSpec(args.scales[0], args.seed), args.repeat)
+        return
+
+    with tempfile.TemporaryDirectory() as temporary:
+        directory = args.data_dir or temporary
+        os.makedirs(directory, exist_ok=True)
+
+        scenarios = {}
+        for items in args.scales:
+            spec = DatasetSpec(items, args.seed)
+            path = dataset(directory, spec)
+            if args.query_only:
+                results = time_queries(path, spec, args.repeat)
+            else:
+                output = subprocess.run(
+                    [sys.executable, "-m", "Benchmarks.view_benchmark", "--views-of", path, "--scales", str(items),
+                     "--seed", str(args.seed), "--repeat", str(args.repeat)],
+                    capture_output=True, text=True, check=True
+                ).stdout
+                results = json.loads(output.strip().splitlines()[-1])
+
+            for view, medians in results.items():
+                scenarios[f"{view} {scale_name(items)}"] = medians
+
+    failed = False
+    baseline = read_baseline(args.baseline, DatasetSpec(0, args.seed))
+    print(f"\n{'scenario':14} {'query':>10} {'baseline':>10} {'build':>10} {'baseline':>10}")
+    for scenario, medians in scenarios.items():
+        line = f"{scenario:14}"
+        regressions = []
+        for metric in ("query_ms", "build_ms"):
+            value, base = medians.get(metric), baseline.get(scenario, {}).get(metric)
+            line += f" {value:8.2f}ms" if value is not None else f" {'-':>10}"
+            line += f" {base:8.2f}ms" if base is not None else f" {'-':>10}"
+            if value is not None and base is not None and value > base * args.threshold and value - base > args.min_ms:
+                regressions.append(f"{metric[:-3]} is {value / base:.2f}x its baseline")
+        print(line)
+
+        for regression in regressions:
+            failed = True
+            print(f"    {regression}")
+
+    if args.save_baseline:
+        save_baseline(args.baseline, DatasetSpec(0, args.seed), scenarios)
+        print(f"\nsaved the baseline to {args.baseline}")
+
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -5,7 +5,8 @@
 
     Date Created: 10/26/2024
     Revisions: 
-        - None
+        - 10/18/2026
+            Added RecurrenceException
 
     Preconditions: 
         - None
@@ -25,4 +26,5 @@
 from .event import Event_
 from .task import Task
 from .category import Category
-from .recurrence import Recurrence
\ No newline at end of file
+from .recurrence import Recurrence
+from .recurrenceException import RecurrenceException
\ No newline at end of file
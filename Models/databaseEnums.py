@@ -9,6 +9,8 @@
             Added a static method to Priority to get string and color associated with a given priority
         - 11/18/2024 Magaly Camacho
             Added helpful methods to Frequency enum
+        - 10/18/2026
+            Added Frequency.occurrences() to compute the dates of a series (or just those in a window) directly
 
     Preconditions: 
         - None
@@ -27,6 +29,15 @@
 
 from enum import Enum
 from datetime import datetime, timedelta
+from typing import Optional
+
+
+def _days_in_month(year:int, month:int) -> int:
+    """Returns the number of days in a month (calendar.monthrange() without the weekday)"""
+    if month == 2:
+        return 29 if year % 4 == 0 and (year % 100 != 0 or year % 400 == 0) else 28
+
+    return 30 if month in (4, 6, 9, 11) else 31
 
 
 class ItemType(Enum):
@@ -173,5 +184,139 @@ class Frequency(Enum):
             
             # Normal
             return current_date.replace(year=next_year)
-        
-    
+
+
+    def nth_date(self, original_date:datetime, n:int) -> datetime:
+        """
+        Returns the date n steps after the original date, the same date get_next_date() reaches after n calls.
+        MONTHLY keeps the original day, or the last day of shorter months; YEARLY turns Feb 29 into Feb 28
+
+        Parameters:
+            original_date (datetime): the first date of the series
+            n (int): the number of steps (0 is the original date)
+        """
+        if n == 0 or self == Frequency.NO_REPEAT:
+            return original_date
+
+        elif self == Frequency.DAILY:
+            return original_date + timedelta(days=n)
+
+        elif self == Frequency.WEEKLY:
+            return original_date + timedelta(weeks=n)
+
+        elif self == Frequency.MONTHLY:
+            months = original_date.month - 1 + n
+            year, month = original_date.year + months // 12, months % 12 + 1
+            day = min(original_date.day, _days_in_month(year, month))
+            return original_date.replace(year=year, month=month, day=day)
+
+        elif self == Frequency.YEARLY:
+            year = original_date.year + n
+
+            # Feb 29 becomes Feb 28, and stays there
+            if original_date.month == 2 and original_date.day == 29:
+                return original_date.replace(year=year, day=28)
+
+            return original_date.replace(year=year)
+
+
+    def first_index(self, original_date:datetime, date:datetime) -> int:
+        """
+        Returns the number of steps to the first date of the series that's on or after the given date
+
+        Parameters:
+            original_date (datetime): the first date of the series
+            date (datetime): the date to look for
+        """
+        if date <= original_date:
+            return 0
+
+        if self == Frequency.NO_REPEAT:
+            return 1
+
+        if self in (Frequency.DAILY, Frequency.WEEKLY):
+            step = timedelta(days=1) if self == Frequency.DAILY else timedelta(weeks=1)
+            return -((original_date - date) // step) # rounded up
+
+        # estimate from the calendar, one step early at most, then step forward
+        n = (date.year - original_date.year) * (12 if self == Frequency.MONTHLY else 1)
+        if self == Frequency.MONTHLY:
+            n += date.month - original_date.month
+        n = max(n - 1, 0)
+
+        while self.nth_date(original_date, n) < date:
+            n += 1
+
+        return n
+
+
+    def occurrences(self, original_date:datetime, count:Optional[int]=None, until:Optional[datetime]=None,
+                    window:Optional[tuple[Optional[datetime], Optional[datetime]]]=None) -> list[datetime]:
+        """
+        Returns the dates of a series, without stepping through the dates before the window
+
+        Parameters:
+            original_date (datetime): the first date of the series
+            count (int): number of dates in the series (including the first), None if only limited by until
+            until (datetime): last possible date of the series (inclusive), None if only limited by count
+            window (tuple[datetime, datetime]): only return dates in [start, end), either can be None for no limit
+
+        Returns:
+            list[datetime]: dates in order, the same ones get_next_date() generates
+
+        Raises:
+            ValueError: if neither count nor until is given (the series would never end)
+        """
+        if count is None and until is None:
+            raise ValueError("count or until is required")
+
+        window_start, window_end = window if window is not None else (None, None)
+
+        # range of steps in the series and the window
+        first = self.first_index(original_date, window_start) if window_start is not None else 0
+        limits = [1] if self == Frequency.NO_REPEAT else []
+
+        if count is not None:
+            limits.append(count)
+        if until is not None:
+            limits.append(self.first_index(original_date, until + timedelta(microseconds=1)))
+        if window_end is not None:
+            limits.append(self.first_index(original_date, window_end))
+
+        stop = min(limits)
+
+        if first >= stop:
+            return []
+
+        # branch on the frequency once, not once per date
+        if self in (Frequency.DAILY, Frequency.WEEKLY):
+            step = timedelta(days=1) if self == Frequency.DAILY else timedelta(weeks=1)
+            date = self.nth_date(original_date, first)
+            dates = [date]
+            for _ in range(stop - first - 1):
+                date += step
+                dates.append(date)
+            return dates
+
+        # build the dates from their fields, datetime() is cheaper than replace()
+        time = (original_date.hour, original_date.minute, original_date.second, original_date.microsecond, original_date.tzinfo)
+
+        if self == Frequency.MONTHLY:
+            day = original_date.day
+            dates = []
+            for months in range(original_date.month - 1 + first, original_date.month - 1 + stop):
+                year, month = original_date.year + months // 12, months % 12 + 1
+                dates.append(datetime(year, month, min(day, _days_in_month(year, month)), *time))
+            return dates
+
+        elif self == Frequency.YEARLY:
+            month, day = original_date.month, original_date.day
+            dates = [self.nth_date(original_date, first)] # the first date can be the original Feb 29
+
+            # Feb 29 becomes Feb 28 after the first date
+            day = 28 if (month, day) == (2, 29) else day
+            for year in range(original_date.year + first + 1, original_date.year + stop):
+                dates.append(datetime(year, month, day, *time))
+            return dates
+
+        return [self.nth_date(original_date, n) for n in range(first, stop)]
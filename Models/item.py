@@ -7,6 +7,8 @@
     Revisions: 
         - 11/18/2024 Magaly Camacho
             Added relation to recurrence
+        - 10/18/2026
+            Indexed recurrence_id, an item with a recurrence is the template of all of its occurrences
 
     Preconditions: 
         - SQLAlchemy must be installed and configured in the environment
@@ -83,7 +85,10 @@ class Item(Base):
 
 
     # Foreign Key to the Recurrence model
-    recurrence_id: Mapped[Optional[int]] = mapped_column(ForeignKey("Recurrence.id"))
+    recurrence_id: Mapped[Optional[int]] = mapped_column(
+        ForeignKey("Recurrence.id"),
+        index=True # series are expanded by joining recurrences to their items
+    )
 
 
     # Many-to-One Relationship with Recurrence
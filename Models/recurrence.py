@@ -9,6 +9,11 @@
             Added __repr__() method
         - 11/18/2024 Magaly Camacho
             Removed relation to events, added relation to items
+        - 10/18/2026
+            Recurrence is the source of truth for occurrences: added occurrence_times() and relation to exceptions.
+            Items no longer get deleted when they're removed from their recurrence (edited occurrences are one-off items)
+        - 10/18/2026
+            occurrence_times() uses Frequency.occurrences(), so a window late in a long series is cheap
 
     Preconditions: 
         - SQLAlchemy must be installed and configured in the environment
@@ -22,7 +27,8 @@
         - The class will always be a sub class of the declarative_base from SQLAlchemy
         - The id attribute will always be unique and automatically generated
         - ItemType Enum, Frequency Enum, and Event model are implemented
-        - One-to-Many Relationship With Event_
+        - One-to-Many Relationship With Item, the item is the template of every occurrence
+        - One-to-Many Relationship With RecurrenceException
     Known Faults: 
         - None
 """
@@ -32,8 +38,9 @@
 import datetime
 from .base import Base # base model
 from .item import Item # Event model
+from .recurrenceException import RecurrenceException # edited/deleted occurrences
 from .databaseEnums import Frequency # Enum for frequency attribute
-from typing import List, Optional
+from typing import Iterator, List, Optional
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 
@@ -49,6 +56,7 @@ class Recurrence(Base):
         r_created (datetime): date and time recurrence was created
         r_last_updated (datetime): date and time recurrence was last updated
         items (list[Item]): items associated with this recurrence
+        exceptions (list[RecurrenceException]): occurrences that were edited or deleted
     """
     __tablename__ = "Recurrence"
 
@@ -74,9 +82,32 @@ class Recurrence(Base):
     # One-to-Many Relationship With Items
     items: Mapped[Optional[List[Item]]] = relationship(
         back_populates="recurrence", # attribute
-        cascade="all, delete-orphan" # delete recurrence if all of it's events are deleted
+        cascade="all" # deleting a recurrence deletes its items, but an item can leave its series without being deleted
     )
 
+    # One-to-Many Relationship With Exceptions
+    exceptions: Mapped[List[RecurrenceException]] = relationship(
+        back_populates="recurrence", # attribute
+        cascade="all, delete-orphan" # exceptions are deleted with their recurrence
+    )
+
+
+    def occurrence_times(self, start:datetime.datetime, window_start:Optional[datetime.datetime]=None,
+                         window_end:Optional[datetime.datetime]=None) -> Iterator[datetime.datetime]:
+        """
+        Generates the times of the occurrences of a series, optionally only those in [window_start, window_end)
+
+        Parameters:
+            start (datetime): the start time of the first occurrence (the item's start time or due date)
+            window_start (datetime): earliest time to generate (inclusive), None for no limit
+            window_end (datetime): latest time to generate (exclusive), None for no limit
+
+        Returns:
+            Iterator[datetime]: occurrence times in order
+        """
+        # computed directly, the occurrences before the window aren't stepped through
+        return iter(self.frequency.occurrences(start, count=self.times, window=(window_start, window_end)))
+
 
     def __repr__(self):
         """String representation of recurrence instance"""
@@ -0,0 +1,101 @@
+"""
+    Name: Recurrence Exception Model
+    Description: Recurrence exception model class to represent records in Recurrence_Exception table of the database.
+                 Occurrences of a recurring item aren't stored, they're generated from the item and its recurrence.
+                 An exception is only stored for an occurrence that was edited (replaced by a one-off item) or deleted
+
+    Date Created: 10/18/2026
+    Revisions:
+        - None
+
+    Preconditions:
+        - SQLAlchemy must be installed and configured in the environment
+    Postconditions:
+        - None
+    Errors/Exceptions:
+        - Validation errors if the attribute constraints (e.g. type, string length, etc.) are not met
+    Side Effects:
+        - Base class will have RecurrenceException as a part of its metadata
+    Invariants:
+        - The class will always be a sub class of the declarative_base from SQLAlchemy
+        - The id attribute will always be unique and automatically generated
+        - Many-to-One Relationship with Recurrence
+        - occurrence_time is the generated time of the occurrence, not the time of the item replacing it
+    Known Faults:
+        - None
+"""
+
+
+# Imports
+from datetime import datetime
+from typing import Optional
+from sqlalchemy import ForeignKey
+from sqlalchemy.orm import Mapped, mapped_column, relationship
+from .base import Base # base model
+
+
+class RecurrenceException(Base):
+    """
+    Recurrence Exception Model for records in the Recurrence_Exception Table
+
+    Attributes:
+        __tablename__ (str): the name of the table
+        id (int): exception id (primary key, automatically generated by database)
+        recurrence_id (int): id of the recurrence the occurrence belongs to
+        occurrence_time (datetime): generated date and time of the occurrence
+        item_id (int): id of the one-off item that replaces the occurrence (None if the occurrence was deleted)
+        x_created (datetime): date and time exception was created
+        x_last_updated (datetime): date and time exception was last updated
+        recurrence (Recurrence): recurrence object
+        item (Item): item replacing the occurrence (optional)
+    """
+    __tablename__ = "Recurrence_Exception"
+
+
+    # Attributes, all are NOT NULL (required) except item_id
+    id: Mapped[int] = mapped_column(
+        primary_key=True # primary key, automatically generated by database
+    )
+
+    recurrence_id: Mapped[int] = mapped_column(
+        ForeignKey("Recurrence.id"), # Foreign Key: Recurrence(id)
+        index=True # exceptions are looked up by recurrence
+    )
+
+    occurrence_time: Mapped[datetime] = mapped_column(
+        index=True # exceptions are looked up by date range
+    )
+
+    item_id: Mapped[Optional[int]] = mapped_column(
+        ForeignKey("Item.id") # Foreign Key: Item(id), None if the occurrence was deleted
+    )
+
+    x_created: Mapped[datetime] = mapped_column(
+        default=datetime.now # defaults to inserted date and time
+    )
+
+    x_last_updated: Mapped[datetime] = mapped_column(
+        default=datetime.now, # defaults to inserted date and time
+        onupdate=datetime.now # auto update this attribute, when record is updated
+    )
+
+
+    # Many-to-One Relationship with Recurrence
+    recurrence: Mapped["Recurrence"] = relationship( # type: ignore
+        back_populates="exceptions" # attribute
+    )
+
+    # Many-to-One Relationship with the Item replacing the occurrence
+    item: Mapped[Optional["Item"]] = relationship() # type: ignore
+
+
+    def __repr__(self):
+        """String representation of recurrence exception instance"""
+        string = "\nRecurrenceException("
+        string += f"\n\tid={self.id}"
+        string += f"\n\trecurrence_id={self.recurrence_id}"
+        string += f"\n\toccurrence_time={self.occurrence_time}"
+        string += f"\n\titem_id={self.item_id}"
+        string += "\n)\n"
+
+        return string
@@ -11,6 +11,8 @@
             Added __repr__() method, and added superclass attributes to docstring
         - 11/04/2024 Magaly Camacho
             Added due_date attribute
+        - 10/18/2026
+            Indexed due_date
 
     Preconditions: 
         - SQLAlchemy must be installed and configured in the environment
@@ -62,7 +64,9 @@ class Task(Item):
         primary_key=True # foreign key is primary key
     ) 
 
-    due_date: Mapped[Optional[datetime]] # optional due date
+    due_date: Mapped[Optional[datetime]] = mapped_column( # optional due date
+        index=True # tasks are sorted and queried by due date
+    )
     
     complete: Mapped[bool] = mapped_column(
         default=False # defaults to not complete
@@ -0,0 +1,140 @@
+"""
+    Name: Bulk Inserts
+    Description: Fast path for writing many events or tasks at once (e.g. importing a calendar). Items are inserted
+                 with executemany-style Core inserts: one INSERT into Item, one into Event/Task, and one into
+                 Item_Category, instead of two INSERTs (and a flush) per item through the ORM
+
+    Date Created: 10/18/2026
+    Revisions:
+        - 10/18/2026
+            Category links are inserted before the Event/Task rows, so the search index triggers index each item once
+        - 10/18/2026
+            Added insert_recurrences() and insert_exceptions(), for imported repeating events
+
+    Preconditions:
+        - SQLAlchemy must be installed and configured in the environment
+        - Models and Enums must be implemented
+    Postconditions:
+        - None
+    Errors/Exceptions:
+        - ValueError if the model isn't Event_ or Task, or a row has a column the model doesn't
+        - SQLAlchemyError for any SQLAlchemy-related errors (e.g. rows with different columns)
+    Side Effects:
+        - Committed event inserts invalidate the event cache windows they touch, like ORM inserts do
+    Invariants:
+        - Nothing is committed, the inserts are part of the session's transaction
+        - Only one connection writes items at a time (the app writes through the data executor), ids are allocated
+          from the largest id when the rows are inserted
+        - Objects already loaded in the session don't see the new items (e.g. a category's items)
+    Known Faults:
+        - None
+"""
+
+
+# Imports
+from typing import Iterable, Optional, Type, Union
+from sqlalchemy import func, insert, select
+from sqlalchemy.orm import Session
+from Models import Event_, Task, Recurrence, RecurrenceException
+from Models.item import Item
+from Models.itemCategory import item_category_association
+from eventcache import record_changes
+
+
+def insert_items(session:Session, model:Type[Union[Event_, Task]], rows:list[dict],
+                 category_ids:Optional[list[Iterable[int]]]=None) -> list[int]:
+    """
+    Inserts events or tasks with one SELECT and three executemany statements, whatever the number of rows
+
+    Parameters:
+        session (Session): session to insert with (the inserts are committed with it)
+        model (type): Event_ or Task
+        rows (list[dict]): column values of each item, e.g. {"name": "Lab", "start_time": datetime(...)}, Item and
+                           model columns can be mixed. Every row must have the same columns, missing columns get
+                           their defaults
+        category_ids (list[Iterable[int]]): ids of the categories of each row, in the same order (optional)
+
+    Returns:
+        list[int]: the ids of the new items, in the order of the rows
+
+    Raises:
+        ValueError: if the model isn't Event_ or Task, or a row has a column neither Item nor the model has
+    """
+    if model not in (Event_, Task):
+        raise ValueError(f"Invalid model: {model}, expected Event_ or Task")
+    if not rows:
+        return []
+
+    item_table, model_table = Item.__table__, model.__table__
+    unknown = set(rows[0]) - set(item_table.c.keys()) - set(model_table.c.keys())
+    if unknown:
+        raise ValueError(f"Invalid columns for {model.__name__}: {', '.join(sorted(unknown))}")
+
+    # Item rows first, their ids are the Event/Task primary keys. They're allocated like SQLite would (after the
+    # largest id), RETURNING the ids in order would make SQLAlchemy insert one row per statement
+    first_id = (session.scalar(select(func.max(item_table.c.id))) or 0) + 1
+    ids = list(range(first_id, first_id + len(rows)))
+    item_type = model.__mapper__.polymorphic_identity
+    item_rows = [
+        {key: value for key, value in row.items() if key in item_table.c} | {"id": item_id, "type": item_type}
+        for item_id, row in zip(ids, rows)
+    ]
+    session.execute(insert(item_table), item_rows)
+
+    # Categories before the Event/Task rows, so the search index triggers index each item once, with its categories
+    if category_ids:
+        links = [{"item_id": item_id, "category_id": category_id} for item_id, categories in zip(ids, category_ids) for category_id in categories]
+        if links:
+            session.execute(insert(item_category_association), links)
+
+    model_rows = [{key: value for key, value in row.items() if key in model_table.c} | {"id": item_id} for item_id, row in zip(ids, rows)]
+    session.execute(insert(model_table), model_rows)
+
+    # Core inserts skip the ORM's flush events, tell the event cache which times changed
+    if model is Event_:
+        record_changes(session, [
+            (row["start_time"], None if row.get("recurrence_id") else row["start_time"]) for row in rows if row.get("start_time")
+        ])
+
+    return ids
+
+
+def insert_recurrences(session:Session, rows:list[dict]) -> list[int]:
+    """
+    Inserts recurrences with one executemany statement, so items inserted with insert_items() can repeat
+
+    Parameters:
+        session (Session): session to insert with (the inserts are committed with it)
+        rows (list[dict]): column values of each recurrence, e.g. {"frequency": Frequency.WEEKLY, "times": 10}
+
+    Returns:
+        list[int]: the ids of the new recurrences, in the order of the rows (for the items' recurrence_id)
+    """
+    if not rows:
+        return []
+
+    # ids allocated like insert_items() does
+    recurrence_table = Recurrence.__table__
+    first_id = (session.scalar(select(func.max(recurrence_table.c.id))) or 0) + 1
+    ids = list(range(first_id, first_id + len(rows)))
+    session.execute(insert(recurrence_table), [row | {"id": recurrence_id} for recurrence_id, row in zip(ids, rows)])
+
+    return ids
+
+
+def insert_exceptions(session:Session, rows:list[dict]):
+    """
+    Inserts edited or deleted occurrences of series with one executemany statement
+
+    Parameters:
+        session (Session): session to insert with (the inserts are committed with it)
+        rows (list[dict]): column values of each exception, e.g. {"recurrence_id": 3, "occurrence_time": datetime(...),
+                           "item_id": None}, item_id is the one-off item replacing the occurrence (None if it's deleted)
+    """
+    if not rows:
+        return
+
+    session.execute(insert(RecurrenceException.__table__), rows)
+
+    # the occurrences' days change, tell the event cache like insert_items() does
+    record_changes(session, [(row["occurrence_time"], row["occurrence_time"]) for row in rows])
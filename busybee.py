@@ -15,11 +15,17 @@
 # - December 6, 2024: Implemented variables for ease of UI modification (Matthew McManness)
 # - December 7, 2024: Added theme toggling functionality (Magaly Camacho)
 # - December 8, 2024: Theme toggling improved (Magaly Camacho)
+# - October 18, 2026: open_edit_task_modal() passes which occurrence of a recurring task is edited
+# - October 18, 2026: Modals are imported when they're first opened instead of at startup
+# - October 18, 2026: Screens are registered as factories and built when first shown (or once the app is idle), the to-do list is no longer built and populated at startup
+# - October 18, 2026: Theme colors are Kivy properties, toggle_theme() recolors widgets in place instead of rebuilding the screens and reloading the tasks
+# - October 18, 2026: Added open_search_modal() to search events and tasks (the modal is imported when it's first opened)
 #
 # Preconditions:
 # - Kivy must be installed and properly configured in the Python environment.
 # - The `screens` directory must contain the required screen classes 
 #   (CalendarView, ToDoListView, AddEventModal, AddTaskModal).
+#   The modals are imported when they're first opened.
 #
 # Acceptable Input:
 # - Screen names such as "calendar" and "todo" for switching screens.
@@ -39,11 +45,11 @@
 # - RuntimeError: Raised if the Kivy environment is not properly initialized.
 #
 # Side Effects:
-# - Adds multiple screens to the screen manager.
+# - Adds multiple screens to the screen manager, each one when it's first needed.
 #
 # Invariants:
 # - ScreenManager should always contain at least two screens: CalendarView and 
-#   ToDoListView.
+#   ToDoListView (registered, each one is built when it's first needed).
 #
 # Known Faults:
 # - None identified at the time of writing.
@@ -56,21 +62,61 @@ from kivy.uix.screenmanager import ScreenManager, NoTransition  # Manage screens
 # Import screen classes from the screens directory
 from screens.calendarview import CalendarView # Import the Calendar View class
 from screens.todolistview import ToDoListView # Import the TodoListView class
-from screens.addevent import AddEventModal # Import the add event modal
-from screens.addtask import AddTaskModal # Import the add task modal
-from screens.edittask import EditTaskModal  # Import the edit modal
-from screens.editEvent import EditEventModal # Import the edit event modal
+# The modals (screens.addevent, screens.addtask, screens.edittask, screens.editEvent, screens.searchmodal) are imported when first opened,
+# so startup only imports what the first screen needs
 from kivy.uix.screenmanager import ScreenManager
 from screens.dailyview import DailyView # Import the daily view class
 from datetime import datetime
 from kivy.app import App
 from kivy.uix.screenmanager import ScreenManager
-from kivy.properties import NumericProperty
+from kivy.properties import NumericProperty, ColorProperty, DictProperty, ObjectProperty
+from kivy.clock import Clock  # To build the other screens once the app is idle
 from kivy.core.window import Window
 from kivy.utils import get_color_from_hex
 from theme import Theme
 
 
+# -----------------------------------------------------------------------------
+# Screen Manager: LazyScreenManager
+# Screens are registered as factories and built the first time they're shown
+# or looked up, so startup only builds the first screen.
+# -----------------------------------------------------------------------------
+class LazyScreenManager(ScreenManager):
+    """ScreenManager that builds each screen from its factory the first time it's needed."""
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.factories = {}  # name -> function that builds the screen, until it's built
+
+    def register(self, name, factory):
+        """
+        Register a screen that's built when it's first needed.
+
+        Parameters:
+        - name (str): The screen's name, e.g. "todo".
+        - factory (function): Called with the name, returns the (populated) screen.
+        """
+        self.factories[name] = factory
+
+    def is_built(self, name):
+        """Whether the screen has been built (a registered screen isn't until it's needed)."""
+        return self.has_screen(name)
+
+    def get_screen(self, name):
+        """Return the screen with the given name, building it first if needed (switching screens uses this too)."""
+        factory = self.factories.pop(name, None)
+        if factory is not None:
+            self.add_widget(factory(name))
+
+        return super().get_screen(name)
+
+    def warm_up(self, *args):
+        """Build the screens that haven't been built yet, one per frame so the app stays responsive."""
+        if self.factories:
+            self.get_screen(next(iter(self.factories)))
+            Clock.schedule_once(self.warm_up)
+
+
 # -----------------------------------------------------------------------------
 # Main Application Class: BusyBeeApp
 # This class manages the screens and provides functionality to open modals.
@@ -80,75 +126,86 @@ class BusyBeeApp(App):
 
     #Variables:
 
+    # Seconds after the first frame before the screens not shown yet are built, None to build them when first shown
+    screen_warm_up_delay = 2.0
+
     #Sizes
     button_font_size = NumericProperty((Window.width + Window.height) * 0.018)
     title_font_size = NumericProperty((Window.width + Window.height) * 0.03)
     label_font_size = NumericProperty((Window.width + Window.height) * 0.015)
     button_size = NumericProperty((Window.width + Window.height) * 0.025)
 
-    # Colors - Initialize to Light Mode
-    current_theme = Theme.LIGHT
-    theme_settings = current_theme.get_settings()
+    # Colors - Initialize to Light Mode. They're Kivy properties, so kv rules using them (and widgets bound to
+    # current_theme) update in place when the theme is toggled
+    current_theme = ObjectProperty(Theme.LIGHT)
+    theme_settings = Theme.LIGHT.get_settings()
 
-    Title_Color = theme_settings["Title_Color"]
-    Title_Background = theme_settings["Title_Background"]
+    Title_Color = ColorProperty(theme_settings["Title_Color"])
+    Title_Background = ColorProperty(theme_settings["Title_Background"])
 
-    Subtitle_Color = theme_settings["Subtitle_Color"]
-    Background_Color = theme_settings["Background_Color"]
+    Subtitle_Color = ColorProperty(theme_settings["Subtitle_Color"])
+    Background_Color = ColorProperty(theme_settings["Background_Color"])
 
-    Text_Color = theme_settings["Text_Color"]
-    Checkbox_Color = theme_settings["Checkbox_Color"]
+    Text_Color = ColorProperty(theme_settings["Text_Color"])
+    Checkbox_Color = ColorProperty(theme_settings["Checkbox_Color"])
 
-    Button_Color = theme_settings["Button_Color"]
-    Button_Text = theme_settings["Button_Text"]
+    Button_Color = ColorProperty(theme_settings["Button_Color"])
+    Button_Text = ColorProperty(theme_settings["Button_Text"])
 
-    Event_Button = theme_settings["Event_Button"]
-    Event_Button_Text = theme_settings["Event_Button_Text"]
+    Event_Button = ColorProperty(theme_settings["Event_Button"])
+    Event_Button_Text = ColorProperty(theme_settings["Event_Button_Text"])
     
-    Task_Box = theme_settings["Task_Box"]
-    Event_Box = theme_settings["Event_Box"]
-    Event_More_Label = theme_settings["Event_More_Label"]
-    Box_Greyed_Out = theme_settings["Box_Greyed_Out"]
-    Box_Greyed_Out_Text = theme_settings["Box_Greyed_Out_Text"]
+    Task_Box = ColorProperty(theme_settings["Task_Box"])
+    Event_Box = ColorProperty(theme_settings["Event_Box"])
+    Event_More_Label = ColorProperty(theme_settings["Event_More_Label"])
+    Box_Greyed_Out = ColorProperty(theme_settings["Box_Greyed_Out"])
+    Box_Greyed_Out_Text = ColorProperty(theme_settings["Box_Greyed_Out_Text"])
 
-    Date_Selected = theme_settings["Date_Selected"]
-    Date_Selected_Text = theme_settings["Date_Selected_Text"]
+    Date_Selected = ColorProperty(theme_settings["Date_Selected"])
+    Date_Selected_Text = ColorProperty(theme_settings["Date_Selected_Text"])
 
-    Edit_Button_Color = theme_settings["Edit_Button_Color"]
-    Edit_Button_Text = theme_settings["Edit_Button_Text"]
+    Edit_Button_Color = ColorProperty(theme_settings["Edit_Button_Color"])
+    Edit_Button_Text = ColorProperty(theme_settings["Edit_Button_Text"])
 
-    Weekday_Background = theme_settings["Weekday_Background"]
-    Weekday_Color = theme_settings["Weekday_Color"]
+    Weekday_Background = ColorProperty(theme_settings["Weekday_Background"])
+    Weekday_Color = ColorProperty(theme_settings["Weekday_Color"])
 
-    Priority_Colors = theme_settings["Priorities"]
+    Priority_Colors = DictProperty(theme_settings["Priorities"])
 
     def build(self):
         """
-        Initialize the screen manager and add the CalendarView and ToDoListView screens.
+        Initialize the screen manager and register the CalendarView, ToDoListView, and DailyView screens.
 
         Preconditions:
         - ScreenManager must be correctly initialized.
 
         Postconditions:
-        - CalendarView and ToDoListView screens are added to the screen manager.
+        - The CalendarView is built (it's shown first), ToDoListView and DailyView are built (and populated) when
+          they're first shown, or once the app is idle (see screen_warm_up_delay).
 
         Return:
         - Returns the initialized ScreenManager instance.
         """
-        self.screen_manager = ScreenManager(transition=NoTransition())  # Initialize ScreenManager
+        self.screen_manager = LazyScreenManager(transition=NoTransition())  # Initialize ScreenManager
 
+        # Register the CalendarView, ToDoListView, and DailyView screens, they're built when first needed
+        self.screen_manager.register("calendar", lambda name: CalendarView(name=name))
+        self.screen_manager.register("todo", self.build_todo_list_view)
+        self.screen_manager.register("daily", lambda name: DailyView(name=name))
 
-        # Initialize To Do list view
-        todo = ToDoListView(name="todo")
-        todo.populate() # add existing tasks 
-
-        # Add the CalendarView and ToDoListView screens to the manager
-        self.screen_manager.add_widget(CalendarView(name="calendar"))
-        self.screen_manager.add_widget(todo)
-        self.screen_manager.add_widget(DailyView(name="daily"))
+        # Show the calendar first, the other screens are built once the app is idle
+        self.screen_manager.current = "calendar"
+        if self.screen_warm_up_delay is not None:
+            Clock.schedule_once(self.screen_manager.warm_up, self.screen_warm_up_delay)
 
         return self.screen_manager  # Return the configured ScreenManager
 
+    def build_todo_list_view(self, name):
+        """Build the To Do list view and add the existing tasks (they're loaded on the worker thread)."""
+        todo = ToDoListView(name=name)
+        todo.populate() # add existing tasks
+        return todo
+
     def open_add_task_modal(self):
         """
         Open the AddTaskModal for creating a new task.
@@ -164,6 +221,8 @@ class BusyBeeApp(App):
         todo_list_view = self.root.get_screen('todo')
 
         if hasattr(todo_list_view, 'refresh_tasks'):  # Ensure the callback exists
+            from screens.addtask import AddTaskModal # Imported on first use, see imports
+
             # Pass refresh_tasks to the AddTaskModal
             add_task_modal = AddTaskModal(refresh_callback=todo_list_view.refresh_tasks)
             add_task_modal.open()
@@ -189,9 +248,17 @@ class BusyBeeApp(App):
         Return:
         - None.
         """
+        from screens.addevent import AddEventModal # Imported on first use, see imports
+
         add_event_modal = AddEventModal()  # Create an instance of AddEventModal
         add_event_modal.open()  # Open the modal
 
+    def open_search_modal(self):
+        """Open the Search modal, to find events and tasks as you type and open one in its edit modal."""
+        from screens.searchmodal import SearchModal # Imported on first use, see imports
+
+        SearchModal().open()
+
     def switch_to_screen(self, screen_name):
         """
         Switch between Calendar and To-Do List screens.
@@ -216,22 +283,25 @@ class BusyBeeApp(App):
         """
         self.screen_manager.current = screen_name  # Change the active screen
 
-    def open_edit_task_modal(self, task_id):
+    def open_edit_task_modal(self, task_id, occurrence_time=None):
         """
         Open the Edit Task modal for a specific task.
 
         Args:
         - task_id (int): ID of the task to edit.
+        - occurrence_time (datetime): Which occurrence of a recurring task to edit (optional).
 
         Postconditions:
         - The Edit Task modal will open with the task data preloaded.
         """
         """Open the Edit Task modal for a specific task."""
+        from screens.edittask import EditTaskModal # Imported on first use, see imports
+
         # Get the ToDoListView instance to access its refresh_tasks method
         todo_screen = self.screen_manager.get_screen("todo")
         
         # Create the EditTaskModal and pass the task ID and refresh callback
-        edit_task_modal = EditTaskModal(task_id=task_id, refresh_callback=todo_screen.refresh_tasks)
+        edit_task_modal = EditTaskModal(task_id=task_id, refresh_callback=todo_screen.refresh_tasks, occurrence_time=occurrence_time)
         edit_task_modal.open()
 
     def switch_to_daily_view_today(self):
@@ -243,56 +313,19 @@ class BusyBeeApp(App):
         self.screen_manager.current = "daily"  # Switch to the Daily View screen
 
     def toggle_theme(self):
-        """Toggle theme between light and dark mode"""
-        # get new theme and save
-        self.current_theme = Theme.toggle(self.current_theme)
-        theme_settings = self.current_theme.get_settings()
-        self.set_theme_settings(theme_settings)
-
-        # reload screens
-        screens = [self.screen_manager.get_screen(screen_name) for screen_name in ["daily", "calendar", "todo"]]
-        for screen in screens:
-            screen.__init__()
-
-        # re-add tasks
-        self.root.get_screen('todo').populate()
+        """Toggle theme between light and dark mode, the screens' colors are updated in place"""
+        # get new theme, set its colors (kv rules update themselves), then tell the widgets bound to current_theme
+        theme = Theme.toggle(self.current_theme)
+        self.set_theme_settings(theme.get_settings())
+        self.current_theme = theme
 
     def set_theme_settings(self, theme_settings:dict):
-        """Set color variables based on theme settings"""
-        self.Title_Color = theme_settings["Title_Color"]
-        self.Title_Background = theme_settings["Title_Background"]
-
-        self.Subtitle_Color = theme_settings["Subtitle_Color"]
-        self.Background_Color = theme_settings["Background_Color"]
-
-        self.Text_Color = theme_settings["Text_Color"]
-        self.Checkbox_Color = theme_settings["Checkbox_Color"]
-
-        self.Button_Color = theme_settings["Button_Color"]
-        self.Button_Text = theme_settings["Button_Text"]
-
-        self.Event_Button = theme_settings["Event_Button"]
-        self.Event_Button_Text = theme_settings["Event_Button_Text"]
-        
-        self.Task_Box = theme_settings["Task_Box"]
-        self.Event_Box = theme_settings["Event_Box"]
-        self.Event_More_Label = theme_settings["Event_More_Label"]
-        self.Box_Greyed_Out = theme_settings["Box_Greyed_Out"]
-        self.Box_Greyed_Out_Text = theme_settings["Box_Greyed_Out_Text"]
-
-        self.Date_Selected = theme_settings["Date_Selected"]
-        self.Date_Selected_Text = theme_settings["Date_Selected_Text"]
-
-        self.Edit_Button_Color = theme_settings["Edit_Button_Color"]
-        self.Edit_Button_Text = theme_settings["Edit_Button_Text"]
-
-        self.Weekday_Background = theme_settings["Weekday_Background"]
-        self.Weekday_Color = theme_settings["Weekday_Color"]
-
-        self.Priority_Colors = theme_settings["Priorities"]
-        
+        """Set color properties based on theme settings"""
+        for name, value in theme_settings.items():
+            setattr(self, "Priority_Colors" if name == "Priorities" else name, value)
 
 
 def open_edit_event_modal(self, event_id):
+    from screens.editEvent import EditEventModal # Imported on first use, see imports
     edit_event_modal = EditEventModal(event_id=event_id, refresh_callback=self.populate)
     edit_event_modal.open()
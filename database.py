@@ -4,77 +4,278 @@
     Author: Magaly Camacho [3072618]
 
     Date Created: 10/20/2024
-    Revisions: 
+    Revisions:
         - 11/01/2024 Magaly Camacho
             Added method to get database session
         - 11/04/2024 Magaly Camacho
             Added method default db for testing (Tests/Output/test_db.db)
+        - 10/18/2026
+            Process-wide database registry: one lazily created engine and one schema check per path,
+            plus use_database() to swap the database every screen talks to (e.g. the test database)
+        - 10/18/2026
+            Indexes added to models are created on existing databases too
+        - 10/18/2026
+            Data migrations tracked with PRAGMA user_version, recurring series are collapsed to one row each
+        - 10/18/2026
+            SQLite performance profiles (WAL, synchronous, mmap, cache, temp_store, busy_timeout) applied to every connection
+        - 10/18/2026
+            Each database has an event window cache, its sessions carry it in session.info
+        - 10/18/2026
+            Full-text search index (FTS5 table and triggers) created with the schema, existing items indexed once
+        - 10/18/2026
+            get_database(debug=True) returns a separate engine that prints its SQL instead of turning echo on for every user of the shared engine
+        - 10/18/2026
+            The profile can be chosen with use_database()/get_database(profile=...) or BUSYBEE_DB_PROFILE, the sqlite profile sets journal_mode=DELETE
 
-    Preconditions: 
+    Preconditions:
         - SQLAlchemy must be installed and configured in the environment
         - Models and Enums must be implemented
-    Postconditions: 
+    Postconditions:
         - None
-    Errors/Exceptions: 
+    Errors/Exceptions:
         - Operational Error if the database cannot be created or accessed
         - SQLAlchemyError for any SQLAlchemy-related errors
-    Side Effects: 
-        - None
-    Invariants: 
+    Side Effects:
+        - The first session requested for a path creates its engine and, if needed, its tables
+    Invariants:
         - Base will contain all database metadata (models/tables)
         - The database schema will be consistent with the defined models
-    Known Faults: 
+        - There is at most one Database (and therefore one engine) per database path in the process, plus one that
+          prints its SQL for get_database(debug=True)
+    Known Faults:
         - None
 """
 
 
 # Imports
-from sqlalchemy import create_engine
+import os
+from threading import Lock
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import Engine
 from sqlalchemy.orm import Session
 from Models.base import Base # base class for database models
+from eventcache import EventWindowCache # events loaded for months and days
+
+
+APP_DB_PATH = "busybee.db" # database used by the application
+TEST_DB_PATH = "Tests/Output/test_db.db" # database used for testing
+SCHEMA_VERSION = 2 # version of the data in the database, see Database._create_schema()
+
+# SQLite settings applied to every connection, by profile name
+PROFILES = {
+    # write-ahead log: readers don't block the writer, and a commit only syncs the log (not on every commit)
+    "default": {
+        "journal_mode": "WAL",
+        "synchronous": "NORMAL", # safe with WAL, the last commits can be lost on power loss but never corrupted
+        "mmap_size": 64 * 1024 * 1024, # read pages through memory mapping (64 MB)
+        "cache_size": -16000, # page cache of 16 MB (negative is in KB)
+        "temp_store": "MEMORY", # temporary tables and indexes (e.g. sorting) in memory
+        "busy_timeout": 5000, # wait up to 5 s for a lock instead of failing
+    },
+    # same, but every commit is synced to disk before it returns
+    "durable": {
+        "journal_mode": "WAL",
+        "synchronous": "FULL",
+        "mmap_size": 64 * 1024 * 1024,
+        "cache_size": -16000,
+        "temp_store": "MEMORY",
+        "busy_timeout": 5000,
+    },
+    # SQLite's own defaults (rollback journal, full sync), for comparison. The journal mode is set explicitly: WAL
+    # is stored in the database file, so a database once opened with another profile would stay in WAL mode
+    "sqlite": {
+        "journal_mode": "DELETE",
+    },
+}
+DEFAULT_PROFILE = "default" # profile of databases created by get_database() and use_database()
+PROFILE_ENV = "BUSYBEE_DB_PROFILE" # environment variable choosing another profile for them, e.g. durable
 
 
 class Database:
     """
     Class to interact with the SQLite database
-    
+
     Attributes:
-        engine (Engine): database engine created from models
+        db_path (str): the path to the database (or where it should be created)
+        debug (bool): whether or not to print SQL emitted by connection
+        profile (str): name of the SQLite settings applied to every connection (see PROFILES)
+        engine (Engine): database engine created from models, created on first use
+        event_cache (EventWindowCache): events loaded for months and days, invalidated by committed changes
     """
-    def __init__(self, db_path:str="Tests/Output/test_db.db", debug:bool=False):
+    def __init__(self, db_path:str=TEST_DB_PATH, debug:bool=False, profile:str=DEFAULT_PROFILE):
         """
-        Initialize database from models
+        Initialize database from models. The engine isn't created until it's first needed
 
         Attributes:
             db_path (str): the path to the database (or where it should be created)
             debug (bool): whether or not to print SQL emitted by connection, False by default
+            profile (str): name of the SQLite settings applied to every connection, "default" by default
+
+        Raises:
+            ValueError: if the profile doesn't exist
         """
-        # engine to create database connections
-        self.engine = create_engine(f"sqlite:///{db_path}", echo=debug)
-        
-        # create database if it doesn't exist already
-        Base.metadata.create_all(self.engine) 
+        if profile not in PROFILES:
+            raise ValueError(f"Invalid profile: {profile}, expected one of {', '.join(PROFILES)}")
+
+        self.db_path = db_path
+        self.debug = debug
+        self.profile = profile
+        self._engine = None # created lazily by the engine property
+        self.event_cache = EventWindowCache()
+        self._lock = Lock() # so two threads can't both create the engine
+
+    @property
+    def engine(self) -> Engine:
+        """Engine to create database connections, the database is created the first time this is accessed"""
+        if self._engine is None:
+            with self._lock:
+                if self._engine is None:
+                    engine = create_engine(f"sqlite:///{self.db_path}", echo=self.debug)
+
+                    # apply the profile's settings to every new connection
+                    event.listen(engine, "connect", self._apply_profile)
+
+                    # create database if it doesn't exist already
+                    self._create_schema(engine)
+
+                    self._engine = engine
+
+        return self._engine
+
+    def _apply_profile(self, dbapi_connection, connection_record):
+        """Connect event hook: run the profile's PRAGMAs on a new SQLite connection"""
+        cursor = dbapi_connection.cursor()
+        for name, value in PROFILES[self.profile].items():
+            cursor.execute(f"PRAGMA {name} = {value}")
+        cursor.close()
+
+    @staticmethod
+    def _create_schema(engine:Engine):
+        """
+        Create missing tables, and missing indexes on tables that already existed (create_all skips those), and the
+        search index. Then migrate the data of older databases, PRAGMA user_version holds the version the data is at.
+        The migrations and the search index are imported here, so the modules they're in can import database
+        """
+        from occurrences import collapse_materialized_series # to migrate old recurring series
+        from search import create_search_index # full-text search of items
+
+        Base.metadata.create_all(engine)
+
+        with engine.begin() as connection:
+            for table in Base.metadata.sorted_tables:
+                for index in table.indexes:
+                    index.create(connection, checkfirst=True)
+
+            version = connection.exec_driver_sql("PRAGMA user_version").scalar()
+
+            # version 1: one row per recurring series instead of one row per occurrence
+            if version < 1:
+                with Session(bind=connection) as session:
+                    collapse_materialized_series(session)
+                    session.flush()
+
+            # version 2: items are in the full-text search index (kept in sync by triggers from then on)
+            create_search_index(connection, rebuild=version < 2)
+
+            if version < SCHEMA_VERSION:
+                connection.exec_driver_sql(f"PRAGMA user_version = {SCHEMA_VERSION}")
 
-    
     def get_session(self) -> Session:
         """Starts and returns a session to manage persistence operations for ORM-mapped objects. Must be used with "with" statement"""
-        return Session(self.engine)
-    
+        return Session(self.engine, info={"event_cache": self.event_cache})
+
+    def dispose(self):
+        """Close all pooled connections, the engine is recreated if the database is used again"""
+        with self._lock:
+            if self._engine is not None:
+                self._engine.dispose()
+                self._engine = None
+            self.event_cache.clear()
+
+
+# Registry of databases by path, so each path only gets one engine and one schema check
+_databases: dict[str, Database] = {}
+_debug_databases: dict[str, Database] = {} # same, with their own engine that prints the SQL it emits
+_registry_lock = Lock()
+_active_path = APP_DB_PATH # path returned by get_database() when no test database is requested
 
-def get_database(test:bool=False, debug:bool=False):
+
+def default_profile() -> str:
+    """The profile of databases registered without one: $BUSYBEE_DB_PROFILE if it's set, "default" otherwise"""
+    return os.environ.get(PROFILE_ENV) or DEFAULT_PROFILE
+
+
+def _get_or_create(db_path:str, debug:bool=False, profile:str=None) -> Database:
+    """
+    Returns the registered database for the given path, registering it (with the given profile, or
+    default_profile()) if needed. With debug, returns its debug
+    twin instead: a Database of the same path with its own engine that prints the SQL it emits, sharing the event
+    cache (so its commits invalidate the events everyone else sees). The shared engine's echo is never changed
+    """
+    with _registry_lock:
+        database = _databases.get(db_path)
+        if database is None:
+            database = Database(db_path=db_path, profile=profile or default_profile())
+            _databases[db_path] = database
+        elif profile is not None and profile != database.profile:
+            raise ValueError(f"{db_path} is already open with the {database.profile} profile, can't use {profile}")
+
+        if debug:
+            twin = _debug_databases.get(db_path)
+            if twin is None:
+                twin = Database(db_path=db_path, debug=True, profile=database.profile)
+                twin.event_cache = database.event_cache
+                _debug_databases[db_path] = twin
+            return twin
+
+    return database
+
+
+def get_database(test:bool=False, debug:bool=False, profile:str=None) -> Database:
     """
-    Returns database object for busybee
-    
+    Returns database object for busybee. Calls with the same path share one Database (and one engine),
+    so this is cheap and can be called whenever a session is needed
+
     Parameters:
-        test (bool): whether to connect to test the database (default in Database)
-        debug (bool): whether to print logs or not
+        test (bool): whether to connect to test the database (Tests/Output/test_db.db)
+        debug (bool): whether to print the SQL of this caller's sessions, they use a separate engine that prints it
+                      (the shared database's engine doesn't)
+        profile (str): SQLite settings of the database (see PROFILES) if it isn't open yet, default_profile() if None
 
     Returns:
         Database: database object
+
+    Raises:
+        ValueError: if the profile doesn't exist, or the database is already open with another profile
+    """
+    # debugging, connect to test database; otherwise connect to the active (application) database
+    return _get_or_create(TEST_DB_PATH if test else _active_path, debug, profile)
+
+
+def use_database(db_path:str=APP_DB_PATH, profile:str=None) -> Database:
+    """
+    Swap the database returned by get_database(), e.g. to point the whole app at the test database:
+
+        use_database(TEST_DB_PATH)  # every screen now reads/writes the test database
+        use_database()              # back to busybee.db
+        use_database(profile="durable")  # busybee.db, syncing every commit (if it isn't open yet)
+
+    Screens look the database up with get_database() when they need a session, so this can be
+    called before or after they're imported
+
+    Parameters:
+        db_path (str): the path to the database to use, busybee.db by default
+        profile (str): SQLite settings of the database (see PROFILES) if it isn't open yet, default_profile() if None
+
+    Returns:
+        Database: the database that is now active
+
+    Raises:
+        ValueError: if the profile doesn't exist, or the database is already open with another profile
     """
-    # debugging, connect to test database
-    if test:
-        return Database(debug=debug)
-    
-    # otherwise, connect to actual database
-    return Database(db_path="busybee.db", debug=debug)
\ No newline at end of file
+    database = _get_or_create(db_path, profile=profile)
+
+    global _active_path
+    _active_path = db_path
+
+    return database
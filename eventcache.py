@@ -0,0 +1,264 @@
+"""
+    Name: Event Cache
+    Description: LRU cache of the events loaded for date windows (a calendar month or a day), so going back to a month
+                 or day that was already shown doesn't query the database again. Each Database has its own cache,
+                 sessions from Database.get_session() find it in session.info. Committed changes to events, recurring
+                 series, and their exceptions invalidate only the windows they touch (a series from its start onward)
+
+    Date Created: 10/18/2026
+    Revisions:
+        - 10/18/2026
+            Windows can be prefetched (loaded before they're looked up), prefetches don't count as hits or misses
+        - 10/18/2026
+            Added record_changes(), for changes made without the ORM (e.g. bulk inserts)
+
+    Preconditions:
+        - SQLAlchemy must be installed and configured in the environment
+        - Models and Enums must be implemented
+    Postconditions:
+        - None
+    Errors/Exceptions:
+        - None
+    Side Effects:
+        - Listens to flush, commit, and rollback events of every Session (sessions without a cache are ignored)
+    Invariants:
+        - A cached window never outlives a commit that changed an event in it
+        - Cached results are shared, callers must not change them
+    Known Faults:
+        - Changes made without the ORM (e.g. Core insert()) don't invalidate anything, unless they're passed to record_changes()
+"""
+
+
+# Imports
+from collections import OrderedDict
+from datetime import date, datetime
+from threading import Lock
+from typing import Any, Callable, Hashable, NamedTuple, Optional
+from sqlalchemy import event, inspect
+from sqlalchemy.orm import Session
+from Models import Event_, Recurrence, RecurrenceException
+from occurrences import DaySummary, EventOccurrence, event_occurrences, month_summary
+
+
+MAX_WINDOWS = 24 # windows kept by default, e.g. a year of months and a year of days around them
+
+
+class CacheInfo(NamedTuple):
+    """Hit and miss counters of an EventWindowCache, like functools.lru_cache's cache_info()"""
+    hits: int
+    misses: int
+    size: int
+    maxsize: int
+    prefetched: int
+
+
+class EventWindowCache:
+    """
+    LRU cache of values loaded for date windows [start, end)
+
+    Attributes:
+        maxsize (int): number of windows kept, the least recently used window is dropped first
+        hits (int): number of lookups served from memory
+        misses (int): number of lookups that loaded from the database
+        prefetched (int): number of windows loaded ahead of a lookup (they don't count as hits or misses)
+    """
+    def __init__(self, maxsize:int=MAX_WINDOWS):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self.prefetched = 0
+        self._windows = OrderedDict() # key -> (start, end, value), least recently used first
+        self._lock = Lock()
+
+    def get(self, key:Hashable, start:datetime, end:datetime, load:Callable[[], Any]) -> Any:
+        """
+        Returns the value cached for a window, loading (and caching) it if it isn't cached
+
+        Parameters:
+            key (Hashable): what was loaded for the window, e.g. ("month", start, end, per_day)
+            start (datetime): start of the window (inclusive)
+            end (datetime): end of the window (exclusive)
+            load (function): loads the value, called without the lock held
+
+        Returns:
+            Any: the cached or loaded value
+        """
+        with self._lock:
+            window = self._windows.get(key)
+            if window is not None:
+                self._windows.move_to_end(key)
+                self.hits += 1
+                return window[2]
+            self.misses += 1
+
+        value = load()
+        self._store(key, start, end, value)
+
+        return value
+
+    def prefetch(self, key:Hashable, start:datetime, end:datetime, load:Callable[[], Any]):
+        """
+        Loads and caches a window that's likely to be looked up soon, if it isn't cached
+
+        Parameters:
+            key (Hashable): what would be loaded for the window, see get()
+            start (datetime): start of the window (inclusive)
+            end (datetime): end of the window (exclusive)
+            load (function): loads the value, called without the lock held
+        """
+        with self._lock:
+            if key in self._windows:
+                return
+            self.prefetched += 1
+
+        self._store(key, start, end, load())
+
+    def _store(self, key:Hashable, start:datetime, end:datetime, value:Any):
+        """Cache a window as the most recently used one, and drop the least recently used if it's full"""
+        with self._lock:
+            self._windows[key] = (start, end, value)
+            self._windows.move_to_end(key)
+            while len(self._windows) > self.maxsize:
+                self._windows.popitem(last=False)
+
+    def invalidate(self, first:Optional[datetime]=None, last:Optional[datetime]=None):
+        """
+        Drops the windows that overlap [first, last]
+
+        Parameters:
+            first (datetime): earliest changed time, None for the beginning of time
+            last (datetime): latest changed time, None for the end of time
+        """
+        with self._lock:
+            stale = [
+                key for key, (start, end, value) in self._windows.items()
+                if (first is None or end > first) and (last is None or start <= last)
+            ]
+            for key in stale:
+                del self._windows[key]
+
+    def clear(self):
+        """Drops every window (the counters are kept)"""
+        with self._lock:
+            self._windows.clear()
+
+    def info(self) -> CacheInfo:
+        """Returns the hit and miss counters, and the number of cached windows"""
+        with self._lock:
+            return CacheInfo(self.hits, self.misses, len(self._windows), self.maxsize, self.prefetched)
+
+
+def _cache_of(session:Session) -> Optional[EventWindowCache]:
+    """Returns the event cache of the session's database, None if it doesn't have one"""
+    return session.info.get("event_cache")
+
+
+def cached_month_summary(session:Session, start:datetime, end:datetime, per_day:int=2,
+                         prefetch:bool=False) -> Optional[dict[date, DaySummary]]:
+    """
+    occurrences.month_summary(), served from the cache of the session's database when it's cached.
+    With prefetch, the month is only loaded into the cache (if it isn't cached) and None is returned
+    """
+    cache = _cache_of(session)
+    key, load = ("month", start, end, per_day), lambda: month_summary(session, start, end, per_day)
+    if cache is None:
+        return None if prefetch else load()
+    if prefetch:
+        return cache.prefetch(key, start, end, load)
+
+    return cache.get(key, start, end, load)
+
+
+def cached_event_occurrences(session:Session, start:datetime, end:datetime,
+                             prefetch:bool=False) -> Optional[list[EventOccurrence]]:
+    """
+    occurrences.event_occurrences(), served from the cache of the session's database when it's cached.
+    With prefetch, the window is only loaded into the cache (if it isn't cached) and None is returned
+    """
+    cache = _cache_of(session)
+    key, load = ("events", start, end), lambda: event_occurrences(session, start, end)
+    if cache is None:
+        return None if prefetch else load()
+    if prefetch:
+        return cache.prefetch(key, start, end, load)
+
+    return cache.get(key, start, end, load)
+
+
+def _values(obj, attribute:str) -> Optional[list]:
+    """
+    Current and (if it changed) previous values of an attribute, without loading anything.
+    None if a previous value isn't known (it was expired, e.g. by a commit, before it was changed or deleted)
+    """
+    state = inspect(obj)
+    history = state.attrs[attribute].history
+    if not state.pending and not history.unchanged and not history.deleted:
+        return None
+    return [value for value in (*history.unchanged, *history.added, *history.deleted) if value is not None]
+
+
+def _changed_ranges(obj) -> list[tuple[Optional[datetime], Optional[datetime]]]:
+    """Ranges of time [first, last] whose events are changed by a new, changed, or deleted object"""
+    everything = [(None, None)]
+
+    if isinstance(obj, Event_):
+        times = _values(obj, "start_time")
+        recurrences = _values(obj, "recurrence_id")
+        if times is None or recurrences is None:
+            return everything
+        if not times:
+            return []
+        if recurrences or obj.__dict__.get("recurrence") is not None:
+            return [(min(times), None)] # a series' occurrences, from its (earliest) start onward
+        return [(time, time) for time in times]
+
+    if isinstance(obj, RecurrenceException):
+        times = _values(obj, "occurrence_time")
+        return everything if times is None else [(time, time) for time in times]
+
+    if isinstance(obj, Recurrence):
+        items = obj.__dict__.get("items") # only if loaded, loading during a flush isn't safe
+        if items is None:
+            return everything
+        return [(time, None) for item in items if isinstance(item, Event_) for time in _values(item, "start_time") or [None]]
+
+    return []
+
+
+def record_changes(session:Session, ranges:list[tuple[Optional[datetime], Optional[datetime]]]):
+    """
+    Remember ranges of time whose events the session changed, they're invalidated when the transaction commits.
+    Flushes are recorded automatically, this is for changes made without the ORM (e.g. bulk inserts)
+
+    Parameters:
+        session (Session): the session that made the changes
+        ranges (list[tuple]): changed ranges [first, last], None for the beginning or end of time
+    """
+    if _cache_of(session) is None:
+        return
+
+    session.info.setdefault("event_cache_changes", []).extend(ranges)
+
+
+@event.listens_for(Session, "after_flush")
+def _collect_changes(session:Session, flush_context):
+    """Remember the ranges each flush changed, they're invalidated when the transaction commits"""
+    record_changes(session, [change for obj in (*session.new, *session.dirty, *session.deleted) for change in _changed_ranges(obj)])
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_changes(session:Session):
+    """Drop the windows the committed changes touched"""
+    cache = _cache_of(session)
+    changed = session.info.pop("event_cache_changes", None)
+    if cache is None or not changed:
+        return
+
+    for first, last in changed:
+        cache.invalidate(first, last)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_changes(session:Session):
+    """Rolled back changes never reached the database, so there's nothing to invalidate"""
+    session.info.pop("event_cache_changes", None)
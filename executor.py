@@ -0,0 +1,265 @@
+"""
+    Name: Data Executor
+    Description: Runs database queries and commands on a worker thread, so the UI thread never waits on the database.
+                 Screens submit work (a function that takes a session) and get its result back on the UI thread,
+                 through Clock.schedule_once. Work submitted with a key supersedes the earlier work with that key,
+                 e.g. paging through three months quickly only shows the last month's events
+
+    Date Created: 10/18/2026
+    Revisions:
+        - 10/18/2026
+            Added Prefetcher, which submits low-priority work once the UI has been idle for a moment
+        - 10/18/2026
+            Work's statements are counted (by instrumentation.py) for the action that submitted it, or for where it's defined
+        - 10/18/2026
+            Added DataExecutor.busy(), to check for pending work without blocking
+
+    Preconditions:
+        - SQLAlchemy must be installed and configured in the environment
+        - Kivy must be installed to deliver results to the UI thread (unless another deliver function is given)
+    Postconditions:
+        - None
+    Errors/Exceptions:
+        - Errors raised by work are delivered to its on_error callback (or printed) on the UI thread
+    Side Effects:
+        - Starts a daemon worker thread the first time work is submitted
+    Invariants:
+        - Work runs one at a time, in the order it was submitted, so a refresh submitted after a save sees the save
+        - Each piece of work gets its own session, opened and closed on the worker thread
+        - Work runs in a copy of the context variables of the code that submitted it
+        - on_result and on_error are only called on the UI thread, and never for cancelled work
+    Known Faults:
+        - None
+"""
+
+
+# Imports
+import contextvars
+import queue
+import traceback
+from threading import Lock, Thread
+from typing import Any, Callable, Hashable, Optional
+from sqlalchemy.orm import Session
+from database import get_database
+from instrumentation import action, current_action
+
+
+PREFETCH_DELAY = 0.2 # seconds the UI must be idle before prefetching
+
+
+def _schedule_on_ui(callback:Callable[[], None]):
+    """Default deliver function: run a callback on Kivy's main thread, at the next frame"""
+    from kivy.clock import Clock # imported when first needed, so the executor can be used without Kivy
+    Clock.schedule_once(lambda dt: callback(), 0)
+
+
+class Request:
+    """
+    Work submitted to the executor
+
+    Attributes:
+        work (function): the query or command, called with a session on the worker thread
+        on_result (function): called with what work returned, on the UI thread (optional)
+        on_error (function): called with the exception work raised, on the UI thread (optional)
+        key (Hashable): work submitted later with the same key cancels this one (optional)
+        cancelled (bool): whether the request was cancelled
+        name (str): where the work comes from, e.g. "CalendarView.populate", its statements are counted for this
+                    action unless it was submitted inside another one (see instrumentation.action())
+    """
+    def __init__(self, work:Callable[[Session], Any], on_result:Optional[Callable[[Any], None]]=None,
+                 on_error:Optional[Callable[[Exception], None]]=None, key:Optional[Hashable]=None):
+        self.work = work
+        self.on_result = on_result
+        self.on_error = on_error
+        self.key = key
+        self.cancelled = False
+        self.context = contextvars.copy_context() # context variables of the code that submitted the work
+        self.name = getattr(work, "__qualname__", repr(work)).replace(".<locals>", "").replace(".<lambda>", "")
+
+    def cancel(self):
+        """Don't run the work if it hasn't started, and don't deliver its result if it has"""
+        self.cancelled = True
+
+    def run(self, session:Session) -> Any:
+        """Run the work (in the submitter's context), counting its statements for its action"""
+        if current_action() is not None:
+            return self.work(session)
+
+        with action(self.name):
+            return self.work(session)
+
+
+class DataExecutor:
+    """
+    Worker thread that owns the database sessions, see module description
+
+    Attributes:
+        deliver (function): runs a callback on the UI thread, Clock.schedule_once by default
+    """
+    def __init__(self, deliver:Optional[Callable[[Callable[[], None]], None]]=None):
+        """
+        Initialize the executor, the worker thread is started when work is first submitted
+
+        Parameters:
+            deliver (function): runs a callback on the UI thread, Clock.schedule_once by default
+        """
+        self.deliver = deliver or _schedule_on_ui
+        self._queue = queue.Queue()
+        self._latest = {} # latest request of each key
+        self._lock = Lock()
+        self._thread = None
+
+    def submit(self, work:Callable[[Session], Any], on_result:Optional[Callable[[Any], None]]=None,
+               on_error:Optional[Callable[[Exception], None]]=None, key:Optional[Hashable]=None) -> Request:
+        """
+        Run work on the worker thread and deliver its result to the UI thread
+
+        Parameters:
+            work (function): the query or command, called with a session. Return plain data (e.g. named tuples),
+                             not ORM objects, the session is closed before the result is delivered
+            on_result (function): called with what work returned, on the UI thread (optional)
+            on_error (function): called with the exception work raised, on the UI thread (optional)
+            key (Hashable): cancels the pending work with the same key (optional)
+
+        Returns:
+            Request: the request, it can be cancelled
+        """
+        request = Request(work, on_result, on_error, key)
+
+        with self._lock:
+            if key is not None:
+                previous = self._latest.get(key)
+                if previous is not None:
+                    previous.cancel()
+                self._latest[key] = request
+
+            if self._thread is None:
+                self._thread = Thread(target=self._run, name="DataExecutor", daemon=True)
+                self._thread.start()
+
+        self._queue.put(request)
+
+        return request
+
+    def cancel(self, key:Hashable):
+        """Cancel the pending work with the given key, if any"""
+        with self._lock:
+            request = self._latest.pop(key, None)
+        if request is not None:
+            request.cancel()
+
+    def wait(self):
+        """Block until all submitted work has run (results may still be waiting to be delivered)"""
+        self._queue.join()
+
+    def busy(self) -> bool:
+        """Whether submitted work is waiting or running, without blocking (see wait())"""
+        return self._queue.unfinished_tasks > 0
+
+    def _run(self):
+        """Worker thread: run requests one at a time, and hand their results to deliver"""
+        while True:
+            request = self._queue.get()
+            try:
+                if not request.cancelled:
+                    result, error = None, None
+                    try:
+                        with get_database().get_session() as session:
+                            result = request.context.run(request.run, session)
+                    except Exception as e:
+                        error = e
+
+                    self.deliver(lambda request=request, result=result, error=error: self._finish(request, result, error))
+            finally:
+                self._queue.task_done()
+
+    def _finish(self, request:Request, result:Any, error:Optional[Exception]):
+        """UI thread: call the request's callback, unless it was cancelled"""
+        with self._lock:
+            if request.key is not None and self._latest.get(request.key) is request:
+                del self._latest[request.key]
+
+        if request.cancelled:
+            return
+
+        if error is not None:
+            if request.on_error:
+                request.on_error(error)
+            else:
+                traceback.print_exception(type(error), error, error.__traceback__)
+        elif request.on_result:
+            request.on_result(result)
+
+
+class Prefetcher:
+    """
+    Submits work that's likely to be needed soon (e.g. the months next to the one shown), once the UI has been idle
+    for a moment. Scheduling or cancelling drops the prefetches that haven't run yet, so they never delay the work
+    the user is waiting for
+
+    Attributes:
+        name (str): prefix of the keys of the submitted work
+        delay (float): seconds the UI must be idle before the work is submitted
+        executor (DataExecutor): executor to submit the work to, the shared one by default
+    """
+    def __init__(self, name:str, delay:float=PREFETCH_DELAY, executor:Optional[DataExecutor]=None):
+        self.name = name
+        self.delay = delay
+        self.executor = executor
+        self._works = []
+        self._keys = []
+        self._event = None # Clock event that submits the work
+
+    def schedule(self, works:list[Callable[[Session], Any]]):
+        """
+        Submit each piece of work (a function that takes a session) after the delay, replacing the ones scheduled before
+
+        Parameters:
+            works (list[function]): the work, in the order it should run
+        """
+        from kivy.clock import Clock # imported when first needed, so the executor can be used without Kivy
+
+        self.cancel()
+        self._works = works
+        self._event = Clock.schedule_once(lambda dt: self.submit(), self.delay)
+
+    def submit(self, works:Optional[list[Callable[[Session], Any]]]=None):
+        """Submit the given work (the scheduled work by default) now, without waiting for the UI to be idle"""
+        executor = self.executor or get_executor()
+        works = self._works if works is None else works
+        self._keys = [(self.name, i) for i in range(len(works))]
+        for key, work in zip(self._keys, works):
+            executor.submit(work, key=key)
+        self._works = []
+
+    def cancel(self):
+        """Drop the scheduled work, and the submitted work that hasn't run yet"""
+        if self._event is not None:
+            self._event.cancel()
+            self._event = None
+        self._works = []
+
+        executor = self.executor or get_executor()
+        for key in self._keys:
+            executor.cancel(key)
+        self._keys = []
+
+
+# Executor shared by every screen, created when first needed
+_executor: Optional[DataExecutor] = None
+_executor_lock = Lock()
+
+
+def get_executor() -> DataExecutor:
+    """
+    Returns the data executor shared by every screen
+
+    Returns:
+        DataExecutor: the executor
+    """
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = DataExecutor()
+
+    return _executor
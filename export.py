@@ -0,0 +1,318 @@
+"""
+    Name: Export
+    Description: Exports every event and task to an iCalendar (.ics) or CSV file, e.g. to move them to another app.
+                 Items are read with one query (their categories, recurrence, and edited or deleted occurrences
+                 joined in) streamed BATCH_SIZE rows at a time (yield_per), and each one is written as soon as it's
+                 read, so memory doesn't grow with the database
+
+                 In .ics files events are VEVENTs and tasks are VTODOs. A series is written once, with an RRULE from
+                 its Recurrence, EXDATEs for its deleted occurrences, and its edited occurrences as separate
+                 components with its UID and a RECURRENCE-ID (the way icsimport reads them back). MONTHLY series
+                 starting on the 29th-31st are on the last day of shorter months, which RFC 5545 would skip, so
+                 their RRULE says so (see rrule())
+
+    Date Created: 10/18/2026
+    Revisions:
+        - None
+
+    Usage:
+        python -m export busybee.ics [--db busybee.db]
+        python -m export busybee.csv
+
+        with open("busybee.ics", "w", newline="") as file:
+            result = export_ics(file)
+
+    Preconditions:
+        - SQLAlchemy must be installed and configured in the environment
+        - Models and Enums must be implemented
+    Postconditions:
+        - The file has every event and task, in the order they were added
+    Errors/Exceptions:
+        - OSError if the file can't be written
+        - ValueError if export_file() is given a path that isn't .ics or .csv
+    Side Effects:
+        - None
+    Invariants:
+        - Times are written as they're stored (local time, floating times in .ics files)
+    Known Faults:
+        - Events have no end time, so their VEVENTs only have a DTSTART
+        - YEARLY series starting on Feb 29 are on Feb 28 every later year in BusyBee, other apps only show them in
+          leap years
+"""
+
+
+# Imports
+import argparse
+import csv
+import os
+from datetime import datetime, timezone
+from typing import Callable, Iterator, NamedTuple, Optional, TextIO
+from sqlalchemy import Row, func, select
+from sqlalchemy.orm import aliased
+from database import Database, get_database, use_database
+from Models import Category, Event_, Recurrence, RecurrenceException, Task
+from Models.item import Item
+from Models.itemCategory import item_category_association
+from Models.databaseEnums import Frequency, ItemType, Priority
+
+
+BATCH_SIZE = 1000 # rows fetched from the database at a time
+SEPARATOR = "\x1f" # separates the values SQLite concatenates (categories, deleted occurrences), names can't have it
+PRODUCT_ID = "-//BusyBee//BusyBee Calendar//EN" # PRODID of the .ics files
+RRULE_FREQUENCIES = {Frequency.DAILY: "DAILY", Frequency.WEEKLY: "WEEKLY", Frequency.MONTHLY: "MONTHLY", Frequency.YEARLY: "YEARLY"}
+PRIORITIES = {Priority.HIGH: 1, Priority.MEDIUM: 5, Priority.LOW: 9} # iCalendar PRIORITY of each Priority
+CSV_COLUMNS = ["id", "type", "name", "notes", "place", "start_time", "due_date", "complete", "priority", "repeats",
+               "times", "categories", "deleted_occurrences", "replaces_item", "replaces_occurrence"]
+
+
+class ExportResult(NamedTuple):
+    """What was exported"""
+    events: int # events written (series count once)
+    tasks: int # tasks written (series count once)
+
+
+def items(db:Database, batch_size:int=BATCH_SIZE) -> Iterator[Row]:
+    """
+    Streams every item, with its event or task columns, recurrence, categories, and exceptions
+
+    Parameters:
+        db (Database): database to read
+        batch_size (int): rows fetched at a time
+
+    Returns:
+        Iterator[Row]: rows with id, type, name, notes, place, start_time, due_date, complete, priority, frequency,
+                       times, categories (joined by SEPARATOR), deleted (times of a series' deleted occurrences, joined
+                       by SEPARATOR), series_id and occurrence_time (of the occurrence a one-off item replaces)
+    """
+    item, event, task, recurrence = Item.__table__, Event_.__table__, Task.__table__, Recurrence.__table__
+    exception, category = RecurrenceException.__table__, Category.__table__
+    replaced = aliased(exception, name="replaced")
+    template = aliased(item, name="template")
+
+    categories = (
+        select(func.group_concat(category.c.name, SEPARATOR))
+        .select_from(item_category_association.join(category, category.c.id == item_category_association.c.category_id))
+        .where(item_category_association.c.item_id == item.c.id)
+        .scalar_subquery()
+    )
+    deleted = (
+        select(func.group_concat(exception.c.occurrence_time, SEPARATOR))
+        .where(exception.c.recurrence_id == item.c.recurrence_id, exception.c.item_id.is_(None))
+        .scalar_subquery()
+    )
+    series_id = ( # the template item of the series whose occurrence a one-off item replaces
+        select(func.min(template.c.id)).where(template.c.recurrence_id == replaced.c.recurrence_id).scalar_subquery()
+    )
+
+    stmt = (
+        select(
+            item.c.id, item.c.type, item.c.name, item.c.notes, event.c.place, event.c.start_time, task.c.due_date,
+            task.c.complete, task.c.priority, recurrence.c.frequency, recurrence.c.times,
+            categories.label("categories"), deleted.label("deleted"), series_id.label("series_id"),
+            replaced.c.occurrence_time,
+        )
+        .select_from(
+            item.outerjoin(event, event.c.id == item.c.id)
+            .outerjoin(task, task.c.id == item.c.id)
+            .outerjoin(recurrence, recurrence.c.id == item.c.recurrence_id)
+            .outerjoin(replaced, replaced.c.item_id == item.c.id)
+        )
+        .order_by(item.c.id)
+        .execution_options(yield_per=batch_size) # streamed, batch_size rows at a time
+    )
+
+    with db.get_session() as session:
+        yield from session.execute(stmt)
+
+
+def _split(values:Optional[str]) -> list[str]:
+    """The values SQLite concatenated with SEPARATOR"""
+    return values.split(SEPARATOR) if values else []
+
+
+def escape(text:str) -> str:
+    """A TEXT value, with backslashes, semicolons, commas, and new lines escaped"""
+    return text.replace("\\", "\\\\").replace(";", "\\;").replace(",", "\\,").replace("\r\n", "\\n").replace("\n", "\\n")
+
+
+def fold(line:str) -> str:
+    """A content line folded into lines of at most 75 bytes (the next ones start with a space), with its CRLF"""
+    if len(line) <= 75 and line.isascii():
+        return line + "\r\n"
+
+    lines, current, size = [], [], 0
+    for character in line:
+        character_size = len(character.encode("utf-8"))
+        if size + character_size > 75:
+            lines.append("".join(current))
+            current, size = [" "], 1
+        current.append(character)
+        size += character_size
+    lines.append("".join(current))
+
+    return "\r\n".join(lines) + "\r\n"
+
+
+def ics_time(time:datetime) -> str:
+    """A floating DATE-TIME value, e.g. 20261018T090000"""
+    return time.strftime("%Y%m%dT%H%M%S")
+
+
+def rrule(frequency:Frequency, times:int, start:datetime) -> str:
+    """
+    The RRULE of a series, with the same dates as Frequency.nth_date(). A MONTHLY series starting on the 29th-31st
+    is on the latest of the 28th to its day each month (BYSETPOS=-1), so shorter months get their last day instead of
+    being skipped
+
+    Parameters:
+        frequency (Frequency): how often it repeats
+        times (int): how many times (COUNT)
+        start (datetime): its first occurrence
+    """
+    rule = f"RRULE:FREQ={RRULE_FREQUENCIES[frequency]}"
+    if frequency == Frequency.MONTHLY and start.day > 28:
+        rule += f";BYMONTHDAY={','.join(str(day) for day in range(28, start.day + 1))};BYSETPOS=-1"
+
+    return f"{rule};COUNT={times}"
+
+
+def ics_component(row:Row, stamp:str) -> str:
+    """The VEVENT or VTODO of an item"""
+    component = "VEVENT" if row.type == ItemType.EVENT else "VTODO"
+    uid = row.series_id if row.series_id is not None else row.id # an edited occurrence has its series' UID
+    lines = [f"BEGIN:{component}", f"UID:{uid}@busybee", f"DTSTAMP:{stamp}", f"SUMMARY:{escape(row.name)}"]
+
+    time = row.start_time if row.type == ItemType.EVENT else row.due_date
+    if time is not None:
+        lines.append(f"DTSTART:{ics_time(time)}")
+        if row.type == ItemType.TASK:
+            lines.append(f"DUE:{ics_time(time)}")
+    if row.notes:
+        lines.append(f"DESCRIPTION:{escape(row.notes)}")
+    if row.place:
+        lines.append(f"LOCATION:{escape(row.place)}")
+    if row.categories:
+        lines.append("CATEGORIES:" + ",".join(escape(name) for name in _split(row.categories)))
+    if row.type == ItemType.TASK:
+        if row.complete:
+            lines.append("STATUS:COMPLETED")
+        if row.priority is not None:
+            lines.append(f"PRIORITY:{PRIORITIES[row.priority]}")
+
+    # how it repeats, or which occurrence of a series it replaces
+    if row.frequency in RRULE_FREQUENCIES and time is not None:
+        lines.append(rrule(row.frequency, row.times, time))
+        deleted = _split(row.deleted)
+        if deleted:
+            lines.append("EXDATE:" + ",".join(ics_time(datetime.fromisoformat(occurrence)) for occurrence in deleted))
+    if row.series_id is not None and row.occurrence_time is not None:
+        lines.append(f"RECURRENCE-ID:{ics_time(row.occurrence_time)}")
+
+    lines.append(f"END:{component}")
+
+    return "".join(fold(line) for line in lines)
+
+
+def export_ics(file:TextIO, db:Optional[Database]=None, batch_size:int=BATCH_SIZE) -> ExportResult:
+    """
+    Writes every event and task to an iCalendar file as they're read
+
+    Parameters:
+        file (TextIO): file to write to, opened with newline="" (lines end with CRLF)
+        db (Database): database to export, get_database() by default
+        batch_size (int): rows fetched from the database at a time
+
+    Returns:
+        ExportResult: what was written
+    """
+    counts = {ItemType.EVENT: 0, ItemType.TASK: 0}
+    stamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+
+    file.write(f"BEGIN:VCALENDAR\r\nVERSION:2.0\r\nPRODID:{PRODUCT_ID}\r\nCALSCALE:GREGORIAN\r\n")
+    for row in items(db or get_database(), batch_size):
+        file.write(ics_component(row, stamp))
+        counts[row.type] += 1
+    file.write("END:VCALENDAR\r\n")
+
+    return ExportResult(counts[ItemType.EVENT], counts[ItemType.TASK])
+
+
+def csv_row(row:Row) -> list:
+    """The CSV_COLUMNS of an item"""
+    def iso(time:Optional[datetime]) -> str:
+        return time.isoformat(sep=" ") if time is not None else ""
+
+    repeats = row.frequency is not None and not Frequency.is_no_repeat(row.frequency)
+    return [
+        row.id, row.type.name.lower(), row.name, row.notes or "", row.place or "", iso(row.start_time), iso(row.due_date),
+        "" if row.complete is None else int(row.complete), row.priority.name.lower() if row.priority else "",
+        row.frequency.name.lower() if repeats else "", row.times if repeats else "",
+        ", ".join(_split(row.categories)),
+        " ".join(iso(datetime.fromisoformat(occurrence)) for occurrence in _split(row.deleted)) if repeats else "",
+        row.series_id if row.series_id is not None else "", iso(row.occurrence_time) if row.series_id is not None else "",
+    ]
+
+
+def export_csv(file:TextIO, db:Optional[Database]=None, batch_size:int=BATCH_SIZE) -> ExportResult:
+    """
+    Writes every event and task to a CSV file (one row per item, see CSV_COLUMNS) as they're read
+
+    Parameters:
+        file (TextIO): file to write to, opened with newline=""
+        db (Database): database to export, get_database() by default
+        batch_size (int): rows fetched from the database at a time
+
+    Returns:
+        ExportResult: what was written
+    """
+    counts = {ItemType.EVENT: 0, ItemType.TASK: 0}
+    writer = csv.writer(file)
+
+    writer.writerow(CSV_COLUMNS)
+    for row in items(db or get_database(), batch_size):
+        writer.writerow(csv_row(row))
+        counts[row.type] += 1
+
+    return ExportResult(counts[ItemType.EVENT], counts[ItemType.TASK])
+
+
+# Exporter of each file extension
+EXPORTERS: dict[str, Callable[..., ExportResult]] = {".ics": export_ics, ".csv": export_csv}
+
+
+def export_file(path:str, db:Optional[Database]=None, batch_size:int=BATCH_SIZE) -> ExportResult:
+    """
+    Exports every event and task to a file, as iCalendar or CSV depending on its extension
+
+    Parameters:
+        path (str): the .ics or .csv file (replaced if it exists)
+        db (Database): database to export, get_database() by default
+        batch_size (int): rows fetched from the database at a time
+
+    Returns:
+        ExportResult: what was written
+
+    Raises:
+        ValueError: if the path doesn't end with .ics or .csv
+    """
+    exporter = EXPORTERS.get(os.path.splitext(path)[1].lower())
+    if exporter is None:
+        raise ValueError(f"Can't export to {path}, expected a .ics or .csv file")
+
+    with open(path, "w", encoding="utf-8", newline="") as file:
+        return exporter(file, db, batch_size)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Export every event and task to an iCalendar (.ics) or CSV file")
+    parser.add_argument("path", help="file to write, .ics or .csv")
+    parser.add_argument("--db", default=None, help="database to export (busybee.db by default)")
+    args = parser.parse_args()
+
+    db = use_database(args.db) if args.db else get_database()
+    result = export_file(args.path, db)
+    print(f"Exported {result.events} events and {result.tasks} tasks to {args.path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,523 @@
+"""
+    Name: iCalendar Import
+    Description: Imports the events of iCalendar (.ics) files, e.g. a calendar exported from another app. Files are
+                 read and parsed one line at a time (parse_ics() is a generator), so a file of tens of thousands of
+                 events is never loaded at once. Events are inserted CHUNK_SIZE at a time with bulk Core inserts, each
+                 chunk in its own transaction, and progress is reported after each chunk. Several files can be parsed
+                 in a pool of processes while the chunks are inserted (SQLite only has one writer)
+
+                 Repeating events are stored as one event and its recurrence: RRULEs with FREQ=DAILY, WEEKLY, MONTHLY,
+                 or YEARLY map onto Frequency, with COUNT (or UNTIL) as the number of times. EXDATEs are deleted
+                 occurrences, and events with a RECURRENCE-ID replace an occurrence of their series
+
+    Date Created: 10/18/2026
+    Revisions:
+        - None
+
+    Usage:
+        python -m icsimport calendar.ics [more.ics ...] [--processes 4] [--db busybee.db]
+
+        result = import_files(["calendar.ics"], progress=print)
+
+    Preconditions:
+        - SQLAlchemy must be installed and configured in the environment
+        - Models and Enums must be implemented
+    Postconditions:
+        - The files' events (and their categories) are in the database
+    Errors/Exceptions:
+        - OSError if a file can't be read, the chunks inserted before it stay imported
+    Side Effects:
+        - Adds the categories the events have that don't exist yet
+    Invariants:
+        - Times are stored in local time: UTC and TZID times are converted, floating times and dates are kept as is
+    Known Faults:
+        - RRULEs with an INTERVAL, or BY... parts other than the start's own day, can't be stored: only the first
+          occurrence is imported (counted as unsupported_rules)
+        - RRULEs without COUNT or UNTIL repeat for OPEN_ENDED_YEARS from now
+        - MONTHLY series starting on the 29th-31st land on the last day of shorter months (they're skipped in iCalendar),
+          unless their RRULE says so the way export writes it (BYMONTHDAY=28,...,day;BYSETPOS=-1)
+        - Importing a file again imports its events again
+"""
+
+
+# Imports
+import argparse
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+from multiprocessing import Manager
+from typing import Callable, Iterable, Iterator, NamedTuple, Optional
+from sqlalchemy import select
+from bulk import insert_exceptions, insert_items, insert_recurrences
+from database import Database, get_database, use_database
+from Models import Category, Event_
+from Models.databaseEnums import Frequency
+
+
+CHUNK_SIZE = 1000 # events inserted per transaction
+OPEN_ENDED_YEARS = 10 # how long series without an end repeat (from now)
+FREQUENCIES = {"DAILY": Frequency.DAILY, "WEEKLY": Frequency.WEEKLY, "MONTHLY": Frequency.MONTHLY, "YEARLY": Frequency.YEARLY}
+WEEKDAYS = ("MO", "TU", "WE", "TH", "FR", "SA", "SU") # BYDAY codes by datetime.weekday()
+PROPERTIES = {"UID", "SUMMARY", "DESCRIPTION", "LOCATION", "DTSTART", "RRULE", "EXDATE", "RECURRENCE-ID", "CATEGORIES"}
+NAME_LENGTH, NOTES_LENGTH, PLACE_LENGTH = 50, 255, 100 # column lengths of Item.name, Item.notes, and Event_.place
+UNTITLED = "Untitled event" # name of events without a SUMMARY
+
+_NAME = re.compile(r"[^:;]*") # name of a content line
+_ESCAPED = re.compile(r"\\([\\;,nN])") # escaped characters in TEXT values
+_UNESCAPED_COMMA = re.compile(r"(?<!\\),") # separates the values of a list (e.g. CATEGORIES)
+
+
+class ICSEvent(NamedTuple):
+    """A VEVENT of an iCalendar file, ready to be inserted"""
+    uid: Optional[str]
+    name: str
+    notes: Optional[str]
+    place: Optional[str]
+    start_time: Optional[datetime] # None if it has no (valid) DTSTART, it's skipped
+    frequency: Optional[Frequency] # None if it doesn't repeat (or its RRULE isn't supported)
+    times: Optional[int] # number of occurrences, including the first
+    categories: tuple[str, ...]
+    exdates: tuple[datetime, ...] # deleted occurrences
+    replaces: Optional[datetime] # RECURRENCE-ID: the occurrence of the series (same uid) this event replaces
+    unsupported_rule: bool # has an RRULE that couldn't be stored, only the first occurrence is imported
+    open_ended: bool # has an RRULE without COUNT or UNTIL, it repeats for OPEN_ENDED_YEARS
+
+
+class ImportProgress(NamedTuple):
+    """Reported after each chunk is inserted"""
+    path: str # file of the chunk
+    events: int # events imported so far (from every file)
+    bytes_read: int # bytes parsed so far (from every file)
+    total_bytes: int # size of every file
+
+
+class ImportResult(NamedTuple):
+    """What import_files() imported"""
+    events: int # events inserted (series count once)
+    series: int # repeating events
+    exceptions: int # deleted or replaced occurrences
+    skipped: int # events without a (valid) DTSTART
+    unsupported_rules: int # repeating events only imported once, see Known Faults
+    open_ended: int # series without an end, see OPEN_ENDED_YEARS
+
+
+def unfold(lines:Iterable[str]) -> Iterator[str]:
+    """Joins folded content lines (a line starting with a space or tab continues the previous one)"""
+    current = None
+    for line in lines:
+        line = line.rstrip("\r\n")
+        if line[:1] in (" ", "\t"):
+            if current is not None:
+                current += line[1:]
+            continue
+
+        if current is not None:
+            yield current
+        current = line
+
+    if current is not None:
+        yield current
+
+
+def split_line(line:str) -> tuple[str, dict[str, str], str]:
+    """
+    Splits a content line into its name, parameters, and value
+
+    Parameters:
+        line (str): e.g. 'DTSTART;TZID="America/Chicago":20261018T090000'
+
+    Returns:
+        tuple: e.g. ("DTSTART", {"TZID": "America/Chicago"}, "20261018T090000"), names are upper case
+    """
+    if '"' in line: # a quoted parameter may have a colon in it
+        in_quotes = False
+        for i, character in enumerate(line):
+            if character == '"':
+                in_quotes = not in_quotes
+            elif character == ":" and not in_quotes:
+                break
+        else:
+            i = len(line)
+        head, value = line[:i], line[i + 1:]
+    else:
+        head, _, value = line.partition(":")
+
+    name, *params = head.split(";")
+    parameters = {}
+    for param in params:
+        key, _, param_value = param.partition("=")
+        parameters[key.upper()] = param_value.strip('"')
+
+    return name.upper(), parameters, value
+
+
+def unescape(value:str) -> str:
+    """The text of a TEXT value (\\n is a new line, \\, \\; and \\\\ are the characters)"""
+    if "\\" not in value:
+        return value
+
+    return _ESCAPED.sub(lambda match: "\n" if match.group(1) in "nN" else match.group(1), value)
+
+
+@lru_cache(maxsize=None)
+def _zone(tzid:str):
+    """The time zone of a TZID, None if it isn't known (e.g. a Windows zone name), its times are kept as is"""
+    try:
+        from zoneinfo import ZoneInfo
+        return ZoneInfo(tzid)
+    except Exception: # ZoneInfoNotFoundError, an invalid key, or no time zone database
+        return None
+
+
+def parse_time(value:str, parameters:dict[str, str]) -> Optional[datetime]:
+    """
+    Parses a DATE or DATE-TIME value into local time
+
+    Parameters:
+        value (str): e.g. "20261018", "20261018T090000", or "20261018T140000Z"
+        parameters (dict): the property's parameters (VALUE, TZID)
+
+    Returns:
+        datetime: the time (midnight for a date), None if it isn't valid
+    """
+    value = value.strip()
+    try:
+        if len(value) == 8 or parameters.get("VALUE") == "DATE":
+            return datetime(int(value[0:4]), int(value[4:6]), int(value[6:8]))
+        time = datetime(int(value[0:4]), int(value[4:6]), int(value[6:8]), int(value[9:11]), int(value[11:13]), int(value[13:15]))
+    except ValueError:
+        return None
+
+    if value.endswith("Z"):
+        zone = timezone.utc
+    elif "TZID" in parameters:
+        zone = _zone(parameters["TZID"])
+    else:
+        zone = None # floating time
+
+    return time if zone is None else time.replace(tzinfo=zone).astimezone().replace(tzinfo=None)
+
+
+def map_rule(rule:str, start:datetime) -> Optional[tuple[Frequency, int, bool]]:
+    """
+    Maps an RRULE onto a Frequency and a number of times
+
+    Parameters:
+        rule (str): e.g. "FREQ=WEEKLY;COUNT=10"
+        start (datetime): the series' first occurrence
+
+    Returns:
+        tuple: (frequency, times, whether it was open-ended), None if the rule can't be stored (see Known Faults)
+    """
+    parts = dict(part.split("=", 1) for part in rule.upper().split(";") if "=" in part)
+    frequency = FREQUENCIES.get(parts.pop("FREQ", None))
+    if frequency is None or parts.pop("INTERVAL", "1") != "1":
+        return None
+    parts.pop("WKST", None)
+
+    # BY... parts that only say what the start already does (e.g. BYDAY=MO for a weekly series starting on a Monday)
+    if parts.get("BYDAY") == WEEKDAYS[start.weekday()] and frequency == Frequency.WEEKLY:
+        del parts["BYDAY"]
+    if parts.get("BYMONTHDAY") == str(start.day) and frequency in (Frequency.MONTHLY, Frequency.YEARLY):
+        del parts["BYMONTHDAY"]
+    # the latest of the 28th to the start's day, i.e. its day or the last day of shorter months (how export writes
+    # series starting on the 29th-31st)
+    if (parts.get("BYMONTHDAY") == ",".join(str(day) for day in range(28, start.day + 1)) and start.day > 28
+            and parts.get("BYSETPOS") == "-1" and frequency == Frequency.MONTHLY):
+        del parts["BYMONTHDAY"], parts["BYSETPOS"]
+    if parts.get("BYMONTH") == str(start.month) and frequency == Frequency.YEARLY:
+        del parts["BYMONTH"]
+
+    count, until = parts.pop("COUNT", None), parts.pop("UNTIL", None)
+    if parts: # anything else changes which dates repeat
+        return None
+
+    if count is not None:
+        return (frequency, int(count), False) if count.isdigit() else None
+
+    open_ended = until is None
+    if open_ended:
+        last = max(start, datetime.now()) + timedelta(days=365 * OPEN_ENDED_YEARS)
+    else:
+        last = parse_time(until, {})
+        if last is None:
+            return None
+        if len(until) == 8: # a date, the whole day is included
+            last += timedelta(days=1, microseconds=-1)
+
+    return frequency, frequency.first_index(start, last + timedelta(microseconds=1)), open_ended
+
+
+def _event(properties:dict[str, list[tuple[dict, str]]]) -> ICSEvent:
+    """The ICSEvent of a VEVENT's properties (name -> [(parameters, value), ...])"""
+    def text(name:str, length:int) -> Optional[str]:
+        values = properties.get(name)
+        return unescape(values[0][1]).strip()[:length].rstrip() if values else None
+
+    def time(name:str) -> Optional[datetime]:
+        values = properties.get(name)
+        return parse_time(values[0][1], values[0][0]) if values else None
+
+    start_time = time("DTSTART")
+    replaces = time("RECURRENCE-ID")
+
+    # how it repeats (an event replacing an occurrence doesn't repeat itself)
+    frequency, times, unsupported_rule, open_ended = None, None, False, False
+    if "RRULE" in properties and start_time is not None and replaces is None:
+        mapped = map_rule(properties["RRULE"][0][1], start_time)
+        if mapped is None:
+            unsupported_rule = True
+        elif mapped[1] > 1:
+            frequency, times, open_ended = mapped
+
+    exdates = ()
+    if frequency is not None:
+        exdates = tuple(filter(None, (
+            parse_time(part, parameters) for parameters, value in properties.get("EXDATE", []) for part in value.split(",")
+        )))
+    categories = tuple(dict.fromkeys( # without duplicates, in order
+        unescape(category).strip()[:NAME_LENGTH] for parameters, value in properties.get("CATEGORIES", [])
+        for category in _UNESCAPED_COMMA.split(value) if category.strip()
+    ))
+
+    return ICSEvent(
+        uid=text("UID", 255),
+        name=text("SUMMARY", NAME_LENGTH) or UNTITLED,
+        notes=text("DESCRIPTION", NOTES_LENGTH),
+        place=text("LOCATION", PLACE_LENGTH),
+        start_time=start_time,
+        frequency=frequency,
+        times=times,
+        categories=categories,
+        exdates=exdates,
+        replaces=replaces,
+        unsupported_rule=unsupported_rule,
+        open_ended=open_ended,
+    )
+
+
+def parse_ics(lines:Iterable[str]) -> Iterator[ICSEvent]:
+    """
+    Parses the VEVENTs of an iCalendar file as it's read
+
+    Parameters:
+        lines (Iterable[str]): the file's lines, e.g. an open file
+
+    Returns:
+        Iterator[ICSEvent]: the events, in the order they're in the file
+    """
+    properties = None # properties of the VEVENT being read
+    depth = 0 # components nested in it (e.g. VALARM), their properties aren't the event's
+
+    for line in unfold(lines):
+        name = _NAME.match(line).group().upper() # most lines aren't needed, they're only split if they are
+
+        if name == "BEGIN":
+            if properties is not None:
+                depth += 1
+            elif line[6:].strip().upper() == "VEVENT":
+                properties = {}
+        elif name == "END":
+            if depth:
+                depth -= 1
+            elif properties is not None and line[4:].strip().upper() == "VEVENT":
+                yield _event(properties)
+                properties = None
+        elif properties is not None and not depth and name in PROPERTIES:
+            name, parameters, value = split_line(line)
+            properties.setdefault(name, []).append((parameters, value))
+
+
+def read_chunks(path:str, chunk_size:int=CHUNK_SIZE) -> Iterator[tuple[list[ICSEvent], int]]:
+    """
+    Parses a file chunk_size events at a time
+
+    Parameters:
+        path (str): the .ics file
+        chunk_size (int): events per chunk
+
+    Returns:
+        Iterator[tuple[list[ICSEvent], int]]: each chunk and the bytes of the file read so far, the last chunk
+                                              (possibly empty) is yielded once the whole file is read
+    """
+    with open(path, encoding="utf-8-sig", errors="replace", newline="") as file:
+        chunk = []
+        for event in parse_ics(file):
+            chunk.append(event)
+            if len(chunk) >= chunk_size:
+                yield chunk, file.buffer.tell() # bytes read ahead of the line are counted too
+                chunk = []
+
+        yield chunk, os.path.getsize(path)
+
+
+def _parse_file(path:str, chunk_size:int, queue):
+    """Parses a file in a pool process, its chunks are put on the queue, then (path, None, None, error)"""
+    error = None
+    try:
+        for chunk, bytes_read in read_chunks(path, chunk_size):
+            queue.put((path, chunk, bytes_read, None))
+    except Exception as exception:
+        error = exception
+    queue.put((path, None, None, error))
+
+
+def _parsed_chunks(paths:list[str], chunk_size:int, processes:int) -> Iterator[tuple[str, list[ICSEvent], int]]:
+    """The chunks of every file as (path, chunk, bytes of the file read), parsed in a pool if processes > 1"""
+    if processes <= 1 or len(paths) <= 1:
+        for path in paths:
+            for chunk, bytes_read in read_chunks(path, chunk_size):
+                yield path, chunk, bytes_read
+        return
+
+    # the queue is bounded, so parsing doesn't get ahead of inserting by more than a few chunks per process. It's
+    # closed first on the way out, so a process waiting to put a chunk stops and the pool can shut down
+    with ProcessPoolExecutor(max_workers=min(processes, len(paths))) as pool, Manager() as manager:
+        queue = manager.Queue(maxsize=processes * 2)
+        for path in paths:
+            pool.submit(_parse_file, path, chunk_size, queue)
+
+        remaining = len(paths)
+        while remaining:
+            path, chunk, bytes_read, error = queue.get()
+            if error is not None:
+                raise error
+            if chunk is None:
+                remaining -= 1
+            else:
+                yield path, chunk, bytes_read
+
+
+class _Importer:
+    """Inserts the chunks of an import, and remembers what later chunks refer to (categories, series by uid)"""
+    def __init__(self, session):
+        self.session = session
+        self.category_ids = {name: category_id for category_id, name in session.execute(select(Category.id, Category.name))}
+        self.series = {} # recurrence id of each series by uid, for the events replacing their occurrences
+        self.replacements = [] # (uid, occurrence time, item id) of events whose series wasn't inserted yet
+        self.excepted = set() # (recurrence id, occurrence time) of the exceptions inserted
+        self.counts = dict.fromkeys(ImportResult._fields, 0)
+
+    def insert(self, chunk:list[ICSEvent]):
+        """Inserts a chunk of events and commits them"""
+        events = [event for event in chunk if event.start_time is not None]
+        self.counts["skipped"] += len(chunk) - len(events)
+
+        # categories that don't exist yet
+        new_categories = {name for event in events for name in event.categories if name not in self.category_ids}
+        if new_categories:
+            categories = [Category(name=name) for name in sorted(new_categories)]
+            self.session.add_all(categories)
+            self.session.flush()
+            self.category_ids.update((category.name, category.id) for category in categories)
+
+        # repeating events' recurrences, then the events
+        recurring = [i for i, event in enumerate(events) if event.frequency is not None]
+        recurrence_ids = dict(zip(recurring, insert_recurrences(self.session, [
+            {"frequency": events[i].frequency, "times": events[i].times} for i in recurring
+        ])))
+        item_ids = insert_items(self.session, Event_, [
+            {"name": event.name, "notes": event.notes, "place": event.place, "start_time": event.start_time,
+             "recurrence_id": recurrence_ids.get(i)}
+            for i, event in enumerate(events)
+        ], [[self.category_ids[name] for name in event.categories] for event in events])
+
+        # deleted occurrences, and events replacing occurrences (their series may come later in the file)
+        exceptions = []
+        for i, (event, item_id) in enumerate(zip(events, item_ids)):
+            recurrence_id = recurrence_ids.get(i)
+            if recurrence_id is not None:
+                if event.uid:
+                    self.series[event.uid] = recurrence_id
+                exceptions += [self.exception(recurrence_id, exdate) for exdate in event.exdates]
+            elif event.replaces is not None and event.uid:
+                self.replacements.append((event.uid, event.replaces, item_id))
+        exceptions += self.resolve_replacements()
+        insert_exceptions(self.session, [exception for exception in exceptions if exception is not None])
+
+        self.session.commit()
+
+        self.counts["events"] += len(events)
+        self.counts["series"] += len(recurring)
+        self.counts["unsupported_rules"] += sum(event.unsupported_rule for event in events)
+        self.counts["open_ended"] += sum(event.open_ended for event in events)
+
+    def exception(self, recurrence_id:int, occurrence_time:datetime, item_id:Optional[int]=None) -> Optional[dict]:
+        """The row of an exception, None if the occurrence already has one"""
+        if (recurrence_id, occurrence_time) in self.excepted:
+            return None
+
+        self.excepted.add((recurrence_id, occurrence_time))
+        self.counts["exceptions"] += 1
+        return {"recurrence_id": recurrence_id, "occurrence_time": occurrence_time, "item_id": item_id}
+
+    def resolve_replacements(self) -> list[Optional[dict]]:
+        """The exceptions of the events replacing occurrences of series inserted so far"""
+        exceptions, waiting = [], []
+        for uid, occurrence_time, item_id in self.replacements:
+            recurrence_id = self.series.get(uid)
+            if recurrence_id is None:
+                waiting.append((uid, occurrence_time, item_id))
+            else:
+                exceptions.append(self.exception(recurrence_id, occurrence_time, item_id))
+        self.replacements = waiting # stay one-off events if their series never comes
+
+        return exceptions
+
+
+def import_files(paths:list[str], db:Optional[Database]=None, chunk_size:int=CHUNK_SIZE, processes:int=1,
+                 progress:Optional[Callable[[ImportProgress], None]]=None) -> ImportResult:
+    """
+    Imports the events of iCalendar files
+
+    Parameters:
+        paths (list[str]): the .ics files
+        db (Database): database to import into, get_database() by default
+        chunk_size (int): events inserted per transaction
+        processes (int): processes parsing the files, more than 1 parses several files at once
+        progress (function): called with an ImportProgress after each chunk is committed (optional)
+
+    Returns:
+        ImportResult: what was imported
+
+    Raises:
+        OSError: if a file can't be read
+    """
+    db = db or get_database()
+    total_bytes = sum(os.path.getsize(path) for path in paths)
+    bytes_read = dict.fromkeys(paths, 0)
+
+    with db.get_session() as session:
+        importer = _Importer(session)
+        for path, chunk, file_bytes_read in _parsed_chunks(paths, chunk_size, processes):
+            importer.insert(chunk)
+            bytes_read[path] = file_bytes_read
+            if progress is not None:
+                progress(ImportProgress(path, importer.counts["events"], sum(bytes_read.values()), total_bytes))
+
+    return ImportResult(**importer.counts)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Import the events of iCalendar (.ics) files")
+    parser.add_argument("paths", nargs="+", help=".ics files to import")
+    parser.add_argument("--db", default=None, help="database to import into (busybee.db by default)")
+    parser.add_argument("--processes", type=int, default=1, help="processes parsing the files (when there are several)")
+    parser.add_argument("--chunk-size", type=int, default=CHUNK_SIZE, help="events inserted per transaction")
+    args = parser.parse_args()
+
+    def show(progress:ImportProgress):
+        percent = 100 * progress.bytes_read / progress.total_bytes if progress.total_bytes else 100
+        print(f"\r{percent:5.1f}%  {progress.events} events", end="", flush=True)
+
+    db = use_database(args.db) if args.db else get_database()
+    result = import_files(args.paths, db, args.chunk_size, args.processes, show)
+    print()
+    for field, value in result._asdict().items():
+        print(f"{field.replace('_', ' ')}: {value}")
+
+
+if __name__ == "__main__":
+    main()
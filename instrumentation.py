@@ -0,0 +1,242 @@
+"""
+    Name: SQL Instrumentation
+    Description: Records every SQL statement the app runs, from SQLAlchemy's before/after_cursor_execute events:
+                 count, latency histogram, and rows changed per statement and per UI action, and logs statements
+                 slower than a threshold. Rows returned are only counted if asked to (enable(count_rows=True)), that
+                 costs a Python call per row. Off by default, and nothing is listened to while it's off.
+                 The action is a context variable, the data executor copies it to the work it runs, so statements run
+                 on the worker thread are counted for the action that submitted them
+
+    Date Created: 10/18/2026
+    Revisions:
+        - None
+
+    Usage:
+        instrumentation = get_instrumentation()
+        instrumentation.enable(slow_query_ms=50)   # count_rows=True to count rows returned too
+        with action("CalendarView.populate"):
+            ...                                  # statements are counted for CalendarView.populate
+        instrumentation.print_report()
+
+    Preconditions:
+        - SQLAlchemy must be installed and configured in the environment
+    Postconditions:
+        - None
+    Errors/Exceptions:
+        - None
+    Side Effects:
+        - While enabled, listens to cursor events of every engine, and with count_rows, counts rows as SQLite
+          returns them
+    Invariants:
+        - Statements are grouped by their SQL (with placeholders), so one query run with different values is one entry
+    Known Faults:
+        - Rows returned are only counted on SQLite (through the cursor's row_factory) with count_rows, otherwise
+          only rows changed by INSERT, UPDATE, and DELETE are counted
+"""
+
+
+# Imports
+import contextvars
+from bisect import bisect_left
+from contextlib import contextmanager
+from threading import Lock
+from time import perf_counter
+from typing import Callable, Iterator, Optional
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+
+SLOW_QUERY_MS = 100.0 # statements slower than this are logged by default
+BUCKETS_MS = (0.1, 0.25, 0.5, 1, 2.5, 5, 10, 25, 50, 100, 250, 500, 1000) # upper bounds of the latency buckets
+
+_action = contextvars.ContextVar("sql_action", default=None) # UI action the running statements are counted for
+
+
+@contextmanager
+def action(name:str) -> Iterator[None]:
+    """
+    Count the statements run inside the "with" block (and work it submits to the data executor) for an action
+
+    Parameters:
+        name (str): the action, e.g. "CalendarView.populate"
+    """
+    token = _action.set(name)
+    try:
+        yield
+    finally:
+        _action.reset(token)
+
+
+def current_action() -> Optional[str]:
+    """Returns the action statements are currently counted for, None if there isn't one"""
+    return _action.get()
+
+
+class StatementStats:
+    """
+    What was recorded for one statement in one action
+
+    Attributes:
+        action (str): the action that ran the statement, None if there wasn't one
+        statement (str): the SQL, with placeholders
+        count (int): number of times it ran (an executemany counts once)
+        total_ms (float): total latency
+        max_ms (float): worst latency
+        rows (int): rows changed (INSERT, UPDATE, DELETE), and rows returned (SELECT) if they're counted
+        histogram (list[int]): number of runs in each latency bucket of BUCKETS_MS, and one more for slower runs
+    """
+    __slots__ = ("action", "statement", "count", "total_ms", "max_ms", "rows", "histogram")
+
+    def __init__(self, action:Optional[str], statement:str):
+        self.action = action
+        self.statement = statement
+        self.count = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+        self.rows = 0
+        self.histogram = [0] * (len(BUCKETS_MS) + 1)
+
+    def add(self, ms:float):
+        """Record one run"""
+        self.count += 1
+        self.total_ms += ms
+        self.max_ms = max(self.max_ms, ms)
+        self.histogram[bisect_left(BUCKETS_MS, ms)] += 1
+
+    def percentile(self, fraction:float) -> float:
+        """Upper bound of the bucket the given fraction of runs fall into (e.g. 0.95), inf if it's the last bucket"""
+        target, seen = fraction * self.count, 0
+        for bound, runs in zip((*BUCKETS_MS, float("inf")), self.histogram):
+            seen += runs
+            if seen >= target:
+                return bound
+        return float("inf")
+
+
+class Instrumentation:
+    """
+    Records the statements of every engine while it's enabled, see module description
+
+    Attributes:
+        enabled (bool): whether statements are being recorded
+        count_rows (bool): whether rows returned are counted too
+        slow_query_ms (float): statements slower than this are logged
+        log (function): called with each slow query message, print by default
+    """
+    def __init__(self, slow_query_ms:float=SLOW_QUERY_MS, log:Callable[[str], None]=print):
+        self.enabled = False
+        self.count_rows = False
+        self.slow_query_ms = slow_query_ms
+        self.log = log
+        self._stats = {} # (action, statement) -> StatementStats
+        self._lock = Lock()
+
+    def enable(self, slow_query_ms:Optional[float]=None, count_rows:bool=False):
+        """
+        Start recording the statements of every engine (including engines created later)
+
+        Parameters:
+            slow_query_ms (float): statements slower than this are logged, the current threshold by default
+            count_rows (bool): count the rows statements return too, off by default since it slows every row down
+        """
+        if slow_query_ms is not None:
+            self.slow_query_ms = slow_query_ms
+        self.count_rows = count_rows
+        if not self.enabled:
+            event.listen(Engine, "before_cursor_execute", self._before)
+            event.listen(Engine, "after_cursor_execute", self._after)
+            self.enabled = True
+
+    def disable(self):
+        """Stop recording (what was recorded is kept)"""
+        if self.enabled:
+            event.remove(Engine, "before_cursor_execute", self._before)
+            event.remove(Engine, "after_cursor_execute", self._after)
+            self.enabled = False
+
+    def reset(self):
+        """Forget what was recorded"""
+        with self._lock:
+            self._stats.clear()
+
+    def _stats_for(self, statement:str) -> StatementStats:
+        """Returns the stats of a statement in the current action, creating them if needed"""
+        key = (_action.get(), statement)
+        stats = self._stats.get(key)
+        if stats is None:
+            with self._lock:
+                stats = self._stats.setdefault(key, StatementStats(*key))
+        return stats
+
+    def _before(self, conn, cursor, statement, parameters, context, executemany):
+        """before_cursor_execute: start the clock, and with count_rows, count the rows the cursor returns"""
+        stats = self._stats_for(statement)
+        if context is not None:
+            context._sql_stats = (stats, perf_counter())
+
+        if self.count_rows and hasattr(cursor, "row_factory"): # SQLite calls it for every row it returns
+            lock = self._lock
+            def count_row(cursor, row):
+                with lock:
+                    stats.rows += 1
+                return row
+            cursor.row_factory = count_row
+
+    def _after(self, conn, cursor, statement, parameters, context, executemany):
+        """after_cursor_execute: record the latency and rows changed, and log the statement if it's slow"""
+        stats, start = getattr(context, "_sql_stats", (None, None))
+        if stats is None:
+            return
+        ms = (perf_counter() - start) * 1000
+
+        with self._lock:
+            stats.add(ms)
+            if cursor.rowcount > 0 and cursor.description is None: # rows changed, not returned
+                stats.rows += cursor.rowcount
+
+        if ms >= self.slow_query_ms:
+            self.log(f"Slow query ({ms:.1f} ms) in {stats.action or '-'}: {' '.join(statement.split())[:200]}")
+
+    def statements(self) -> list[StatementStats]:
+        """Returns what was recorded for each statement in each action, slowest in total first"""
+        with self._lock:
+            return sorted(self._stats.values(), key=lambda stats: stats.total_ms, reverse=True)
+
+    def actions(self) -> dict[Optional[str], tuple[int, float]]:
+        """Returns the number of statements and their total latency (ms) for each action"""
+        totals = {}
+        for stats in self.statements():
+            count, total_ms = totals.get(stats.action, (0, 0.0))
+            totals[stats.action] = (count + stats.count, total_ms + stats.total_ms)
+        return totals
+
+    def print_report(self, limit:int=20):
+        """Print the statements and total latency of each action, then the slowest statements"""
+        print(f"{'action':48} {'statements':>10} {'total':>10}")
+        for name, (count, total_ms) in sorted(self.actions().items(), key=lambda item: item[1][1], reverse=True):
+            print(f"{(name or '-')[:48]:48} {count:10} {total_ms:8.1f}ms")
+
+        print(f"\n{'count':>6} {'total':>10} {'max':>9} {'p95 <=':>8} {'rows':>7}  statement")
+        for stats in self.statements()[:limit]:
+            print(f"{stats.count:6} {stats.total_ms:8.1f}ms {stats.max_ms:7.1f}ms {stats.percentile(0.95):6g}ms "
+                  f"{stats.rows:7}  {(stats.action or '-')}: {' '.join(stats.statement.split())[:80]}")
+
+
+# Instrumentation shared by every engine, created when first needed
+_instrumentation: Optional[Instrumentation] = None
+_instrumentation_lock = Lock()
+
+
+def get_instrumentation() -> Instrumentation:
+    """
+    Returns the instrumentation shared by every engine
+
+    Returns:
+        Instrumentation: the instrumentation (disabled until enable() is called)
+    """
+    global _instrumentation
+    with _instrumentation_lock:
+        if _instrumentation is None:
+            _instrumentation = Instrumentation()
+
+    return _instrumentation
@@ -7,6 +7,9 @@
 # Revision History:
 # - October 26, 2024: Initial version created. (Author: Matthew McManness)
 # - October 27, 2024: Final version completed (including comments)
+# - October 18, 2026: SQL instrumentation is turned on with BUSYBEE_SQL_STATS=1, its report is printed on exit
+# - October 18, 2026: --profile writes a cProfile/tracemalloc profile of each user action (see profiling.py)
+# - October 18, 2026: BUSYBEE_SQL_ROWS=1 counts the rows SQL statements return
 # 
 # Preconditions:
 # - The BusyBeeApp class must be correctly defined and imported from busybee.py.
@@ -14,6 +17,7 @@
 # 
 # Acceptable Input:
 # - No direct input is required for this script.
+# - Optional: --profile [--profile-dir DIR] to write a profile of each user action into DIR (profiles by default).
 # 
 # Unacceptable Input:
 # - Attempting to execute without Kivy or without the correct directory setup will result in errors.
@@ -30,6 +34,9 @@
 # 
 # Side Effects:
 # - Adds the project directory to the system's Python path for module imports.
+# - With BUSYBEE_SQL_STATS=1, logs SQL statements slower than BUSYBEE_SLOW_QUERY_MS (100 by default) and prints
+#   statement counts and latencies per action on exit (and rows returned, with BUSYBEE_SQL_ROWS=1).
+# - With BUSYBEE_DB_PROFILE=durable (or sqlite), busybee.db is opened with that SQLite profile (see database.PROFILES).
 #
 # Invariants:
 # - Kivy must remain installed for the application to work properly.
@@ -40,7 +47,7 @@
 # -----------------------------------------------------------------------------
 
 # Import necessary modules
-from kivy.app import App  # Kivy's base class for applications
+import argparse  # To read BusyBee's own command line options
 import sys  # System-specific parameters and functions
 import os  # Miscellaneous operating system interfaces
 
@@ -48,7 +55,11 @@ import os  # Miscellaneous operating system interfaces
 # Add the project directory to Python path to ensure imports work
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
-from busybee import BusyBeeApp  # Import the BusyBeeApp class from busybee.py
+from instrumentation import get_instrumentation, SLOW_QUERY_MS  # SQL statement counts and latencies
+from profiling import get_profiler, app_actions, PROFILE_DIR  # Per-action cProfile/tracemalloc profiles
+
+# Kivy (and busybee, which imports it) is imported in the main entry point, after BusyBee's own options are read:
+# Kivy parses the command line when it's imported, and importing main shouldn't change anyone's sys.argv
 
 # -----------------------------------------------------------------------------
 # Main Entry Point:
@@ -56,4 +67,27 @@ from busybee import BusyBeeApp  # Import the BusyBeeApp class from busybee.py
 # directly (i.e., not when imported as a module).
 # -----------------------------------------------------------------------------
 if __name__ == "__main__":
+    # BusyBee's own options are read (and removed) before Kivy is imported, Kivy parses the rest of the command line
+    parser = argparse.ArgumentParser(add_help=False)
+    parser.add_argument("--profile", action="store_true", help="write a profile of each user action")
+    parser.add_argument("--profile-dir", default=PROFILE_DIR, help="where profiles are written")
+    options, sys.argv[1:] = parser.parse_known_args()
+
+    from kivy.app import App  # Kivy's base class for applications
+    from busybee import BusyBeeApp  # Import the BusyBeeApp class from busybee.py
+
+    # Record SQL statements if asked to (off by default)
+    instrumentation = get_instrumentation()
+    if os.environ.get("BUSYBEE_SQL_STATS") == "1":
+        instrumentation.enable(slow_query_ms=float(os.environ.get("BUSYBEE_SLOW_QUERY_MS", SLOW_QUERY_MS)),
+                               count_rows=os.environ.get("BUSYBEE_SQL_ROWS") == "1")
+
+    # Profile each user action if asked to (off by default)
+    if options.profile:
+        get_profiler(options.profile_dir).install(app_actions())
+        print(f"Profiling user actions into {os.path.abspath(options.profile_dir)}")
+
     BusyBeeApp().run()  # Run the BusyBee application
+
+    if instrumentation.enabled:
+        instrumentation.print_report()
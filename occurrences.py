@@ -0,0 +1,415 @@
+"""
+    Name: Occurrences
+    Description: Virtual expansion of recurring events and tasks. A recurring series is stored once, as an item (the
+                 template) and its recurrence; its occurrences are generated for whatever date range a view asks for.
+                 Only edited or deleted occurrences are stored, as recurrence exceptions
+
+    Date Created: 10/18/2026
+    Revisions:
+        - 10/18/2026
+            Added month_summary(), the first events and event count of each day, for the calendar
+        - 10/18/2026
+            detach_occurrence() returns the existing copy if the occurrence was already detached
+        - 10/18/2026
+            Added todo_list_tasks(), the sorted tasks and occurrences the to-do list shows
+
+    Preconditions:
+        - SQLAlchemy must be installed and configured in the environment
+        - Models and Enums must be implemented
+    Postconditions:
+        - None
+    Errors/Exceptions:
+        - SQLAlchemyError for any SQLAlchemy-related errors
+    Side Effects:
+        - The write helpers add to (but don't commit) the given session
+    Invariants:
+        - Creating, editing or deleting a series writes a constant number of rows, however many times it repeats
+        - An edited occurrence is a one-off item (no recurrence) linked to its series by a RecurrenceException
+    Known Faults:
+        - None
+"""
+
+
+# Imports
+from collections import defaultdict
+from datetime import datetime, date
+from typing import NamedTuple, Optional, Union
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+from Models import Event_, Task, Recurrence, RecurrenceException
+from Models.item import Item
+from Models.databaseEnums import Frequency, Priority
+from queries import events_between, month_summary_rows, tasks_sorted_by
+
+
+class EventOccurrence(NamedTuple):
+    """
+    One occurrence of an event, as shown by the calendar and daily view
+
+    Attributes:
+        id (int): id of the event (the series' template event for a generated occurrence)
+        name (str): name of the event
+        start_time (datetime): start date and time of this occurrence
+        place (str): place of the event (optional)
+        recurrence_id (int): id of the series' recurrence, None for a one-off event
+        occurrence_time (datetime): generated time of this occurrence in its series, None for a one-off event
+    """
+    id: int
+    name: str
+    start_time: datetime
+    place: Optional[str] = None
+    recurrence_id: Optional[int] = None
+    occurrence_time: Optional[datetime] = None
+
+
+class DaySummary(NamedTuple):
+    """
+    What the calendar shows for one day
+
+    Attributes:
+        events (list[EventOccurrence]): the first events of the day, by start time
+        count (int): how many events the day has
+    """
+    events: list[EventOccurrence]
+    count: int
+
+
+class TaskOccurrence(NamedTuple):
+    """
+    One occurrence of a task, as shown by the to-do list
+
+    Attributes:
+        id (int): id of the task (the series' template task for a generated occurrence)
+        name (str): name of the task
+        due_date (datetime): due date of this occurrence (optional)
+        priority (Priority): task priority (optional)
+        complete (bool): whether this occurrence is complete
+        categories (list[str]): names of the task's categories
+        recurrence_id (int): id of the series' recurrence, None for a one-off task
+        occurrence_time (datetime): generated time of this occurrence in its series, None for a one-off task
+    """
+    id: int
+    name: str
+    due_date: Optional[datetime]
+    priority: Optional[Priority]
+    complete: bool
+    categories: list[str]
+    recurrence_id: Optional[int] = None
+    occurrence_time: Optional[datetime] = None
+
+
+def item_time(item:Item) -> Optional[datetime]:
+    """Returns the time a series is generated from: an event's start time or a task's due date"""
+    return item.start_time if isinstance(item, Event_) else item.due_date
+
+
+def _exception_times(session:Session, recurrence_ids:Optional[list[int]]=None,
+                     start:Optional[datetime]=None, end:Optional[datetime]=None) -> set[tuple[int, datetime]]:
+    """Returns (recurrence id, occurrence time) of every edited or deleted occurrence, optionally filtered"""
+    stmt = select(RecurrenceException.recurrence_id, RecurrenceException.occurrence_time)
+
+    if recurrence_ids is not None:
+        stmt = stmt.where(RecurrenceException.recurrence_id.in_(recurrence_ids))
+    if start is not None:
+        stmt = stmt.where(RecurrenceException.occurrence_time >= start)
+    if end is not None:
+        stmt = stmt.where(RecurrenceException.occurrence_time < end)
+
+    return set(session.execute(stmt).tuples())
+
+
+def event_occurrences(session:Session, start:datetime, end:datetime) -> list[EventOccurrence]:
+    """
+    Returns the occurrences of all events in [start, end), sorted by start time
+
+    Parameters:
+        session (Session): session to query with
+        start (datetime): start of the range (inclusive)
+        end (datetime): end of the range (exclusive)
+
+    Returns:
+        list[EventOccurrence]: one-off events and generated occurrences of recurring events
+    """
+    # one-off events, including edited occurrences
+    stmt = events_between(start, end).where(Event_.recurrence_id.is_(None))
+    occurrences = [
+        EventOccurrence(event.id, event.name, event.start_time, event.place)
+        for event in session.scalars(stmt)
+    ]
+
+    occurrences.extend(_series_occurrences(session, start, end))
+    occurrences.sort(key=lambda occurrence: occurrence.start_time)
+
+    return occurrences
+
+
+def month_summary(session:Session, start:datetime, end:datetime, per_day:int=2) -> dict[date, DaySummary]:
+    """
+    Returns what the calendar shows for each day in [start, end) that has events: its first events and its event count.
+    Only per_day one-off events are loaded for each day (see queries.month_summary_rows), however many it has
+
+    Parameters:
+        session (Session): session to query with
+        start (datetime): start of the range (inclusive)
+        end (datetime): end of the range (exclusive)
+        per_day (int): number of events to return for each day
+
+    Returns:
+        dict[date, DaySummary]: summary of each day with events
+    """
+    first_events = defaultdict(list)
+    counts = defaultdict(int)
+
+    # first one-off events of each day, and how many one-off events each day has
+    for event_id, name, start_time, place, day_count in session.execute(month_summary_rows(start, end, per_day)):
+        first_events[start_time.date()].append(EventOccurrence(event_id, name, start_time, place))
+        counts[start_time.date()] = day_count
+
+    # generated occurrences of recurring events can be among the first events of a day too
+    for occurrence in _series_occurrences(session, start, end):
+        first_events[occurrence.start_time.date()].append(occurrence)
+        counts[occurrence.start_time.date()] += 1
+
+    summaries = {}
+    for day, events in first_events.items():
+        events.sort(key=lambda occurrence: occurrence.start_time)
+        summaries[day] = DaySummary(events[:per_day], counts[day])
+
+    return summaries
+
+
+def _series_occurrences(session:Session, start:datetime, end:datetime) -> list[EventOccurrence]:
+    """Returns the generated occurrences of recurring events in [start, end), without edited or deleted ones"""
+    # series that started before the end of the range
+    stmt = (
+        select(Event_, Recurrence)
+        .join(Recurrence, Event_.recurrence_id == Recurrence.id)
+        .where(Event_.start_time < end)
+    )
+    series = session.execute(stmt).all()
+    if not series:
+        return []
+
+    exceptions = _exception_times(session, start=start, end=end)
+
+    occurrences = []
+    for event, recurrence in series:
+        for time in recurrence.occurrence_times(event.start_time, start, end):
+            if (recurrence.id, time) not in exceptions:
+                occurrences.append(EventOccurrence(event.id, event.name, time, event.place, recurrence.id, time))
+
+    return occurrences
+
+
+def task_occurrences(session:Session, tasks:list[Task]) -> list[TaskOccurrence]:
+    """
+    Returns the occurrences of the given tasks, in the given order with each series expanded in place
+
+    Parameters:
+        session (Session): session the tasks were loaded with
+        tasks (list[Task]): tasks to expand
+
+    Returns:
+        list[TaskOccurrence]: one-off tasks and generated occurrences of recurring tasks
+    """
+    recurrence_ids = [task.recurrence_id for task in tasks if task.recurrence_id is not None]
+    exceptions = _exception_times(session, recurrence_ids) if recurrence_ids else set()
+
+    occurrences = []
+    for task in tasks:
+        categories = [category.name for category in task.categories] if task.categories else []
+
+        # one-off task, or a series without a due date to repeat from
+        if task.recurrence_id is None or task.due_date is None:
+            occurrences.append(TaskOccurrence(task.id, task.name, task.due_date, task.priority, task.complete, categories))
+            continue
+
+        # generated occurrences are incomplete until they're checked (which makes them one-off tasks)
+        for time in task.recurrence.occurrence_times(task.due_date):
+            if (task.recurrence_id, time) not in exceptions:
+                occurrences.append(TaskOccurrence(
+                    task.id, task.name, time, task.priority, False, categories, task.recurrence_id, time
+                ))
+
+    return occurrences
+
+
+def todo_list_tasks(session:Session, sort:str) -> list[TaskOccurrence]:
+    """
+    Returns what the to-do list shows: every task, with recurring tasks expanded into their occurrences
+
+    Parameters:
+        session (Session): session to query with
+        sort (str): "Priority", "Category" or "Due Date" (see queries.tasks_sorted_by)
+
+    Returns:
+        list[TaskOccurrence]: the tasks in the sorted order
+    """
+    # Tasks sorted by the selected option, with their categories and recurrence loaded in batches
+    tasks = task_occurrences(session, session.scalars(tasks_sorted_by(sort)).unique().all())
+
+    # Occurrences are placed with their series' first due date, re-sort them by their own (no due date first)
+    if sort not in ("Priority", "Category"):
+        tasks.sort(key=lambda task: (task.due_date is not None, task.due_date or datetime.min))
+
+    return tasks
+
+
+def detach_occurrence(session:Session, item:Union[Event_, Task], occurrence_time:datetime) -> Union[Event_, Task]:
+    """
+    Replaces one generated occurrence of a series with a one-off copy of the series' item, so it can be edited alone
+
+    Parameters:
+        session (Session): session to add the copy and exception to
+        item (Event_ | Task): the series' template item
+        occurrence_time (datetime): generated time of the occurrence
+
+    Returns:
+        Event_ | Task: the one-off copy (not flushed), or the copy made earlier if the occurrence was already detached
+    """
+    # the occurrence may have been detached already, e.g. a checkbox toggled twice before the first toggle was saved
+    exception = session.scalar(
+        select(RecurrenceException)
+        .where(RecurrenceException.recurrence_id == item.recurrence_id, RecurrenceException.occurrence_time == occurrence_time)
+    )
+    if exception is not None and exception.item is not None:
+        return exception.item
+
+    if isinstance(item, Event_):
+        copy = Event_(name=item.name, notes=item.notes, place=item.place, start_time=occurrence_time)
+    else:
+        copy = Task(name=item.name, notes=item.notes, due_date=occurrence_time, priority=item.priority)
+
+    copy.categories = list(item.categories or [])
+    session.add(copy)
+    session.add(RecurrenceException(recurrence_id=item.recurrence_id, occurrence_time=occurrence_time, item=copy))
+
+    return copy
+
+
+def delete_occurrence(session:Session, item:Union[Event_, Task], occurrence_time:datetime):
+    """
+    Deletes one generated occurrence of a series
+
+    Parameters:
+        session (Session): session to add the exception to
+        item (Event_ | Task): the series' template item
+        occurrence_time (datetime): generated time of the occurrence
+    """
+    session.add(RecurrenceException(recurrence_id=item.recurrence_id, occurrence_time=occurrence_time))
+
+
+def delete_item(session:Session, item:Item):
+    """
+    Deletes an item. If it's a one-off item that replaced an occurrence of a series, the occurrence stays deleted.
+    If it's a series' template, the whole series is deleted: its recurrence and exceptions too (occurrences that were
+    detached into their own items are kept, as one-off items)
+
+    Parameters:
+        session (Session): session to delete with
+        item (Item): the item to delete
+    """
+    for exception in session.scalars(select(RecurrenceException).where(RecurrenceException.item_id == item.id)):
+        exception.item = None
+
+    if item.recurrence_id is not None:
+        session.delete(item.recurrence) # also deletes its exceptions and the template
+    else:
+        session.delete(item)
+
+
+def update_series(session:Session, item:Union[Event_, Task], frequency:Optional[Frequency], times:Optional[int]):
+    """
+    Sets how an item repeats. A series is edited in place, and exceptions are only kept if its timing didn't change
+
+    Parameters:
+        session (Session): session to add to
+        item (Event_ | Task): the item (series template), with its new start time/due date already set
+        frequency (Frequency): how often to repeat, None to stop repeating
+        times (int): how many times to repeat (including the first), None to stop repeating
+    """
+    if not frequency or not times or Frequency.is_no_repeat(frequency):
+        recurrence = item.recurrence
+        if recurrence is not None:
+            item.recurrence = None
+            session.flush() # so deleting the recurrence doesn't cascade to the item
+            session.delete(recurrence) # also deletes its exceptions
+        return
+
+    if item.recurrence is None:
+        item.recurrence = Recurrence(frequency=frequency, times=times)
+        return
+
+    recurrence = item.recurrence
+    timing_changed = frequency != recurrence.frequency or item_time(item) != _series_start(session, item)
+    recurrence.frequency = frequency
+    recurrence.times = times
+
+    # edited occurrences stay as one-off items, but they no longer replace anything in the new series
+    if timing_changed:
+        recurrence.exceptions.clear()
+
+
+def _series_start(session:Session, item:Item) -> Optional[datetime]:
+    """Returns the start time/due date of an item as it's stored in the database (before pending changes)"""
+    column = Event_.start_time if isinstance(item, Event_) else Task.due_date
+    with session.no_autoflush:
+        return session.scalar(select(column).where(column.class_.id == item.id))
+
+
+def collapse_materialized_series(session:Session):
+    """
+    Converts series saved the old way, with one row per occurrence, to one template item per series.
+    Rows that match their generated occurrence are deleted, rows that were edited become exceptions,
+    and occurrences without a row (deleted ones) become deleted exceptions
+
+    Parameters:
+        session (Session): session to convert with (not committed)
+    """
+    for recurrence in session.scalars(select(Recurrence)).all():
+        items = [item for item in recurrence.items if item_time(item) is not None]
+        if len(items) == 0:
+            continue
+
+        items.sort(key=lambda item: (item_time(item), item.id))
+        template, rows = items[0], items[1:]
+
+        # rows by the time they were generated for
+        by_time = {}
+        for row in rows:
+            by_time.setdefault(item_time(row), row)
+
+        handled = set()
+        times = list(recurrence.occurrence_times(item_time(template)))
+        for time in times[1:]:
+            row = by_time.get(time)
+
+            if row is None: # occurrence was deleted
+                delete_occurrence(session, template, time)
+                continue
+
+            handled.add(row.id)
+            if _matches_template(row, template):
+                session.delete(row)
+            else: # occurrence was edited
+                row.recurrence = None
+                session.add(RecurrenceException(recurrence=recurrence, occurrence_time=time, item=row))
+
+        # rows whose time was edited are one-off items (the occurrence they were generated for is deleted above)
+        for row in rows:
+            if row.id not in handled:
+                row.recurrence = None
+
+        # a completed first task would otherwise show up as incomplete
+        if isinstance(template, Task) and template.complete:
+            detach_occurrence(session, template, item_time(template)).complete = True
+
+
+def _matches_template(row:Item, template:Item) -> bool:
+    """Returns whether a row of an old series is an unedited copy of the series' first row"""
+    same = row.name == template.name and row.notes == template.notes and set(row.categories or []) == set(template.categories or [])
+
+    if isinstance(row, Event_):
+        return same and row.place == template.place
+
+    return same and row.priority == template.priority and not row.complete
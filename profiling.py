@@ -0,0 +1,238 @@
+"""
+    Name: Action Profiling
+    Description: Profiles the app one user action at a time (switching screens, changing month, opening and saving
+                 modals, toggling the theme, ...). Each action is captured with cProfile and tracemalloc while it
+                 runs, and written to a numbered pair of files: <n>-<action>.prof (open with snakeviz or pstats) and
+                 <n>-<action>.json (wall and CPU time, memory, the slowest functions, and the biggest allocations).
+                 Work the action submits to the data executor is profiled on the worker thread as worker-<action>
+
+    Date Created: 10/18/2026
+    Revisions:
+        - 10/18/2026
+            The search modal's searches are profiled
+
+    Usage:
+        python main.py --profile [--profile-dir profiles]
+
+    Preconditions:
+        - Kivy must be installed to profile the app's actions (app_actions() imports the screens)
+    Postconditions:
+        - None
+    Errors/Exceptions:
+        - Errors raised by a profiled action are raised as usual, its profile is still written
+    Side Effects:
+        - install() replaces the profiled methods on their classes
+        - Creates the profile directory, and two files per action
+    Invariants:
+        - An action started while another one is being profiled on the same thread is part of that profile
+    Known Faults:
+        - tracemalloc slows the app down (it's left on once an action is profiled), so compare times between profiles,
+          not with normal runs. Its peak is process-wide, so it includes other threads' allocations
+        - On Python 3.12+, an action that starts while another thread's action is profiled only gets a .json
+"""
+
+
+# Imports
+import cProfile
+import functools
+import json
+import os
+import pstats
+import re
+import threading
+import tracemalloc
+from contextlib import contextmanager
+from datetime import datetime
+from itertools import count
+from time import perf_counter, process_time
+from typing import Callable, Iterator, Optional, Union
+from instrumentation import action, current_action
+
+
+PROFILE_DIR = "profiles" # where profiles are written by default
+TOP = 25 # number of functions and allocations in each .json summary
+
+
+class ActionProfiler:
+    """
+    Captures a cProfile and tracemalloc profile of each action, see module description
+
+    Attributes:
+        directory (str): where the profiles are written
+        top (int): number of functions and allocations in each .json summary
+    """
+    def __init__(self, directory:str=PROFILE_DIR, top:int=TOP):
+        self.directory = directory
+        self.top = top
+        self._numbers = count(1) # so profiles sort in the order the actions happened
+        self._local = threading.local() # whether this thread is capturing an action
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def capture(self, name:str) -> Iterator[None]:
+        """
+        Profile the "with" block as an action, its SQL is counted for the action too (see instrumentation.action())
+
+        Parameters:
+            name (str): the action, e.g. "CalendarView.change_month"
+        """
+        if getattr(self._local, "capturing", False):
+            yield # part of the action already being profiled
+            return
+
+        self._local.capturing = True
+        if not tracemalloc.is_tracing():
+            tracemalloc.start() # left on, actions on other threads may be using it
+        tracemalloc.reset_peak()
+        memory_before = tracemalloc.take_snapshot()
+        started, wall, cpu = datetime.now(), perf_counter(), process_time()
+
+        profile = cProfile.Profile()
+        try:
+            with action(current_action() or name):
+                try:
+                    profile.enable()
+                except ValueError: # Python 3.12+ only allows one profiler at a time (another thread's action)
+                    profile = None
+                try:
+                    yield
+                finally:
+                    if profile is not None:
+                        profile.disable()
+        finally:
+            wall_ms, cpu_ms = (perf_counter() - wall) * 1000, (process_time() - cpu) * 1000
+            memory_after = tracemalloc.take_snapshot()
+            current, peak = tracemalloc.get_traced_memory()
+            self._local.capturing = False
+
+            self._write(name, profile, {
+                "action": name,
+                "thread": threading.current_thread().name,
+                "started": started.isoformat(timespec="milliseconds"),
+                "wall_ms": round(wall_ms, 3),
+                "cpu_ms": round(cpu_ms, 3),
+                "peak_traced_kb": round(peak / 1024, 1),
+                "allocations": self._allocations(memory_before, memory_after),
+            })
+
+    def _allocations(self, before:tracemalloc.Snapshot, after:tracemalloc.Snapshot) -> list[dict]:
+        """The lines that allocated the most memory (still held at the end of the action)"""
+        differences = after.compare_to(before, "lineno")
+        return [
+            {"line": str(difference.traceback), "kb": round(difference.size_diff / 1024, 1), "blocks": difference.count_diff}
+            for difference in differences[:self.top] if difference.size_diff > 0
+        ]
+
+    def _functions(self, profile:cProfile.Profile) -> list[dict]:
+        """The functions with the most cumulative time"""
+        stats = pstats.Stats(profile).stats # (file, line, function) -> (primitive calls, calls, total, cumulative, callers)
+        slowest = sorted(stats.items(), key=lambda item: item[1][3], reverse=True)[:self.top]
+        return [
+            {"function": f"{file}:{line}({function})", "calls": calls, "total_ms": round(total * 1000, 3), "cumulative_ms": round(cumulative * 1000, 3)}
+            for (file, line, function), (primitive_calls, calls, total, cumulative, callers) in slowest
+        ]
+
+    def _write(self, name:str, profile:Optional[cProfile.Profile], summary:dict):
+        """Write the .prof and .json files of an action (only the .json if it couldn't be profiled)"""
+        with self._lock:
+            os.makedirs(self.directory, exist_ok=True)
+            path = os.path.join(self.directory, f"{next(self._numbers):04d}-{re.sub(r'[^A-Za-z0-9_.-]+', '_', name)}")
+
+        if profile is not None:
+            profile.dump_stats(path + ".prof")
+        summary["functions"] = self._functions(profile) if profile is not None else []
+        with open(path + ".json", "w") as file:
+            json.dump(summary, file, indent=2)
+
+    def wrap(self, cls:type, method_name:str, name:Optional[Union[str, Callable]]=None):
+        """
+        Replace a method so every call is profiled as an action
+
+        Parameters:
+            cls (type): the class the method is defined on
+            method_name (str): the method
+            name (str | function): the action, "<class>.<method>" by default. A function is called with the
+                                   method's arguments to name each call
+        """
+        method = getattr(cls, method_name)
+        if getattr(method, "__profiled__", False):
+            return
+
+        @functools.wraps(method)
+        def profiled(*args, **kwargs):
+            action_name = name(*args, **kwargs) if callable(name) else name or f"{cls.__name__}.{method_name}"
+            with self.capture(action_name):
+                return method(*args, **kwargs)
+
+        profiled.__profiled__ = True
+        setattr(cls, method_name, profiled)
+
+    def install(self, targets:list[tuple[type, str]]):
+        """Profile every call of the given (class, method name) pairs, see app_actions()"""
+        for cls, method_name in targets:
+            self.wrap(cls, method_name)
+
+        # the work actions submit to the data executor, named after the action that submitted it
+        from executor import Request
+        self.wrap(Request, "run", lambda request, session: f"worker-{current_action() or request.name}")
+
+
+def app_actions() -> list[tuple[type, str]]:
+    """The app's entry points for user actions, as (class, method name) pairs (imports the modals up front)"""
+    from busybee import BusyBeeApp
+    from screens.calendarview import CalendarView
+    from screens.dailyview import DailyView
+    from screens.todolistview import ToDoListView
+    from screens.addevent import AddEventModal
+    from screens.addtask import AddTaskModal
+    from screens.editEvent import EditEventModal
+    from screens.edittask import EditTaskModal
+    from screens.searchmodal import SearchModal
+
+    return [
+        (BusyBeeApp, "build"),
+        (BusyBeeApp, "switch_to_screen"),
+        (BusyBeeApp, "switch_to_daily_view_today"),
+        (BusyBeeApp, "toggle_theme"),
+        (BusyBeeApp, "open_add_event_modal"),
+        (BusyBeeApp, "open_add_task_modal"),
+        (BusyBeeApp, "open_edit_task_modal"),
+        (BusyBeeApp, "open_search_modal"),
+        (CalendarView, "change_month"),
+        (CalendarView, "open_edit_event_modal"),
+        (CalendarView, "open_daily_view"),
+        (DailyView, "navigate_previous_day"),
+        (DailyView, "navigate_next_day"),
+        (DailyView, "open_edit_event_modal"),
+        (ToDoListView, "sort_tasks"),
+        (ToDoListView, "filter_tasks"),
+        (ToDoListView, "toggle_complete"),
+        (AddEventModal, "save_event"),
+        (AddTaskModal, "save_task"),
+        (EditEventModal, "save_event"),
+        (EditEventModal, "delete_event"),
+        (EditTaskModal, "save_task"),
+        (EditTaskModal, "delete_task"),
+        (SearchModal, "run_search"),
+    ]
+
+
+# Profiler of the running app, created when first needed
+_profiler: Optional[ActionProfiler] = None
+
+
+def get_profiler(directory:str=PROFILE_DIR) -> ActionProfiler:
+    """
+    Returns the app's action profiler
+
+    Parameters:
+        directory (str): where profiles are written, only used when the profiler is created
+
+    Returns:
+        ActionProfiler: the profiler
+    """
+    global _profiler
+    if _profiler is None:
+        _profiler = ActionProfiler(directory)
+
+    return _profiler
@@ -0,0 +1,209 @@
+"""
+    Name: Queries
+    Description: Reusable queries for the calendar, daily view and to-do list, kept out of the screens so they can be
+                 used (and benchmarked) without Kivy
+
+    Date Created: 10/18/2026
+    Revisions:
+        - 10/18/2026
+            To-do list queries, which load each task's categories and recurrence in batches
+        - 10/18/2026
+            Month summary query: the first events of each day and the day's event count, as plain rows
+        - 10/18/2026
+            Added adjacent_months(), the months before and after a month (for prefetching)
+
+    Preconditions:
+        - SQLAlchemy must be installed and configured in the environment
+        - Models and Enums must be implemented
+    Postconditions:
+        - None
+    Errors/Exceptions:
+        - SQLAlchemyError for any SQLAlchemy-related errors
+    Side Effects:
+        - None
+    Invariants:
+        - Date filters are half-open ranges on the indexed date columns (start <= date < end), so SQLite can search
+          the index instead of scanning the table
+        - Task queries load categories and recurrences with one extra SELECT each, however many tasks there are
+    Known Faults:
+        - None
+"""
+
+
+# Imports
+from datetime import datetime, date, timedelta
+from typing import Optional
+from sqlalchemy import select, Select, case, func
+from sqlalchemy.orm import Session, selectinload
+from Models import Event_, Task, Category
+from Models.databaseEnums import Priority
+
+
+def month_bounds(year:int, month:int) -> tuple[datetime, datetime]:
+    """
+    Returns the start of the given month and the start of the next month
+
+    Parameters:
+        year (int): the year
+        month (int): the month (1-12)
+
+    Returns:
+        tuple[datetime, datetime]: (month start, next month start)
+    """
+    month_start = datetime(year, month, 1)
+    next_month_start = datetime(year + month // 12, month % 12 + 1, 1)
+
+    return month_start, next_month_start
+
+
+def adjacent_months(year:int, month:int) -> list[tuple[int, int]]:
+    """
+    Returns the months before and after the given month
+
+    Parameters:
+        year (int): the year
+        month (int): the month (1-12)
+
+    Returns:
+        list[tuple[int, int]]: [(year, previous month), (year, next month)]
+    """
+    previous = (year - 1, 12) if month == 1 else (year, month - 1)
+    following = (year + 1, 1) if month == 12 else (year, month + 1)
+
+    return [previous, following]
+
+
+def day_bounds(day:date) -> tuple[datetime, datetime]:
+    """
+    Returns the start of the given day and the start of the next day
+
+    Parameters:
+        day (date): the day (a datetime's time is ignored)
+
+    Returns:
+        tuple[datetime, datetime]: (day start, next day start)
+    """
+    day_start = datetime(day.year, day.month, day.day)
+
+    return day_start, day_start + timedelta(days=1)
+
+
+def events_between(start:datetime, end:datetime) -> Select:
+    """
+    Returns statement selecting events that start in [start, end), ordered by start time
+
+    Parameters:
+        start (datetime): start of the range (inclusive)
+        end (datetime): end of the range (exclusive)
+
+    Returns:
+        Select: the statement
+    """
+    return (
+        select(Event_)
+        .where(Event_.start_time >= start, Event_.start_time < end)
+        .order_by(Event_.start_time)
+    )
+
+
+def month_summary_rows(start:datetime, end:datetime, per_day:int=2) -> Select:
+    """
+    Returns statement selecting, for each day in [start, end), the first one-off events (by start time) and how many
+    one-off events the day has. Rows are plain tuples (id, name, start_time, place, day_count), not Event_ objects,
+    so a month with hundreds of events a day still only loads per_day rows a day
+
+    Parameters:
+        start (datetime): start of the range (inclusive)
+        end (datetime): end of the range (exclusive)
+        per_day (int): number of events to select for each day
+
+    Returns:
+        Select: the statement, ordered by start time
+    """
+    day = func.date(Event_.start_time)
+    ranked = (
+        select(
+            Event_.id,
+            Event_.name,
+            Event_.start_time,
+            Event_.place,
+            func.row_number().over(partition_by=day, order_by=(Event_.start_time, Event_.id)).label("day_rank"),
+            func.count().over(partition_by=day).label("day_count"),
+        )
+        .where(Event_.start_time >= start, Event_.start_time < end, Event_.recurrence_id.is_(None))
+        .subquery()
+    )
+
+    return (
+        select(ranked.c.id, ranked.c.name, ranked.c.start_time, ranked.c.place, ranked.c.day_count)
+        .where(ranked.c.day_rank <= per_day)
+        .order_by(ranked.c.start_time)
+    )
+
+
+def _with_task_details(stmt:Select) -> Select:
+    """Loads the categories and recurrence of all selected tasks in one SELECT each, instead of one per task"""
+    return stmt.options(selectinload(Task.categories), selectinload(Task.recurrence))
+
+
+def tasks_sorted_by(sort:str) -> Select:
+    """
+    Returns statement selecting all tasks for the to-do list, with their categories and recurrence
+
+    Parameters:
+        sort (str): "Priority" (high to low, no priority last), "Category" (by category name) or "Due Date" (default)
+
+    Returns:
+        Select: the statement, use .unique() on its results (sorting by category joins each task's categories)
+    """
+    if sort == "Priority":
+        # Define custom priority order: High (1), Medium (2), Low (3), None (-) as 4
+        priority_order = case(
+            (Task.priority == 'HIGH', 1),
+            (Task.priority == 'MEDIUM', 2),
+            (Task.priority == 'LOW', 3),
+            else_=4  # For tasks without a priority, assign the lowest order
+        )
+        stmt = select(Task).order_by(priority_order)
+    elif sort == "Category":
+        # Sort by the name of the first associated category
+        stmt = (
+            select(Task)
+            .outerjoin(Task.categories)  # Join tasks with categories
+            .order_by(func.coalesce(Category.name, "").asc())  # Order by category name, null-safe
+        )
+    else:
+        # Default to sorting by Due Date
+        stmt = select(Task).order_by(Task.due_date.asc())
+
+    return _with_task_details(stmt)
+
+
+def tasks_with_priority(priority:Optional[Priority]) -> Select:
+    """
+    Returns statement selecting the tasks with the given priority, with their categories and recurrence
+
+    Parameters:
+        priority (Priority): the priority, None for tasks without a priority
+
+    Returns:
+        Select: the statement
+    """
+    return _with_task_details(select(Task).where(Task.priority.is_(None) if priority is None else Task.priority == priority))
+
+
+def explain_query_plan(session:Session, stmt:Select) -> list[str]:
+    """
+    Returns SQLite's query plan for a statement, e.g. ["SEARCH Event_ USING INDEX ix_Event__start_time (start_time>? AND start_time<?)"]
+
+    Parameters:
+        session (Session): session to run EXPLAIN QUERY PLAN in
+        stmt (Select): the statement to explain
+
+    Returns:
+        list[str]: the detail column of each step of the plan
+    """
+    compiled = stmt.compile(session.get_bind(), compile_kwargs={"literal_binds": True})
+    rows = session.connection().exec_driver_sql(f"EXPLAIN QUERY PLAN {compiled.string}")
+
+    return [row[-1] for row in rows]
@@ -14,6 +14,10 @@
 #   - December 7, 2024: Fixed newly added events not being able to be edited - [Magaly Camacho, Manvir Kaur, Mariam Oraby] 
 #   - December 7, 2024: Implemented variables for ease of UI modification (Matthew McManness)
 #   - December 8, 2024: Theme toggling (Magaly Camacho)
+#   - October 18, 2026: Looked up the shared database with get_database() when a session is needed instead of at import time
+#   - October 18, 2026: Recurring events are saved as one event and its recurrence instead of one event per occurrence
+#   - October 18, 2026: Saving runs on the data executor's worker thread, the views are updated when it's saved
+#   - October 18, 2026: Saving an event only looks up the daily view when it's shown
 #   - [Insert Further Revisions]: [Brief description of changes] - [Your Name]
 # Preconditions:
 #   - The `DatePicker` class must be implemented and correctly imported from `screens.usefulwidgets`.
@@ -45,11 +49,11 @@ from kivy.uix.label import Label  # Label widget to display text.
 from kivy.uix.button import Button  # Button widget for user interaction.
 from screens.usefulwidgets import DatePicker, RepeatOptionsModal  # Custom date picker and repeat options modals
 from kivy.app import App  # Ensure App is imported
-from database import get_database  # to connect to database
+from executor import get_executor  # to save on the worker thread
 from datetime import datetime  # for date
-from sqlalchemy import select  # to query database
 from Models.databaseEnums import Frequency  # for event frequency
-from Models import Event_, Recurrence  # event model
+from Models import Event_  # event model
+from occurrences import update_series  # to make the event repeat
 from kivy.metrics import dp  # Import dp for density-independent pixel values
 from kivy.graphics import Color, RoundedRectangle  # For rounded rectangle shape
 
@@ -57,8 +61,6 @@ from kivy.graphics import Color, RoundedRectangle  # For rounded rectangle shape
 class UniformButton(Button):
     pass
 
-db = get_database()
-
 class AddEventModal(ModalView):
     """A modal for adding a new event with name, date, and time selection."""
 
@@ -188,81 +190,50 @@ class AddEventModal(ModalView):
             return
 
         # Extract and sanitize repeat information
-        repeat_info = self.repeat_button.text.split(" ")
-     
-        frequency = None if len(repeat_info) == 2 else Frequency.str2enum(repeat_info[1])
-        times = None if len(repeat_info) == 2 else int(repeat_info[2])
+        frequency, times = RepeatOptionsModal.parse_repeat_text(self.repeat_button.text)
 
         # Extract additional notes
         notes = self.notes_input.text.strip()
 
-        # Connect to the database and save the event
-        with db.get_session() as session:
+        def save(session):
+            # Connect to the database and save the event
             with session.begin():  # Transaction started that will auto commit before exiting
                 # Create and save the main event
                 new_event = Event_(name=event_name, notes=notes, start_time=start_time)
+                session.add(new_event)  # Save the main event
+
+                # Add recurrence details if specified, occurrences are generated when they're displayed
+                update_series(session, new_event, frequency, times)
+            return new_event.id, new_event.recurrence_id  # Get the ID of the newly saved event
+
+        def saved(ids):
+            event_id, recurrence_id = ids
+
+            # Update the CalendarView or DailyView with the new event(s)
+            app = App.get_running_app()
+            calendar_screen = app.screen_manager.get_screen('calendar')
 
-                # Add recurrence details if specified
-                if times and frequency:
-                    recurrence_id = self.save_recurrence(frequency, times)  # Save recurrence in DB
-                    new_event.recurrence_id = recurrence_id  # Link recurrence to the event
-
-                    # Generate additional events based on recurrence
-                    current_date = start_time
-                    for _ in range(times - 1):
-                        new_date = frequency.get_next_date(current_date, start_time)
-                        recurring_event = Event_(
-                            name=event_name,
-                            notes=notes,
-                            start_time=new_date,
-                            recurrence_id=recurrence_id
-                        )
-                        session.add(recurring_event)
-                        current_date = new_date  # Update the current date for the next recurrence
+            # Show recurring events by refreshing the views, they load the occurrences in their date range
+            if recurrence_id:
+                if app.screen_manager.current == 'daily':
+                    app.screen_manager.get_screen('daily').refresh_events()  # also refreshes the calendar
                 else:
-                    recurrence_id = None
+                    calendar_screen.refresh_calendar()
+            else:
+                # Add a single event to the calendar
+                calendar_screen.add_event(event_id, event_name, start_time)
 
-                session.add(new_event)  # Save the main event
-            event_id = new_event.id  # Get the ID of the newly saved event
+                # Add event to daily view
+                if app.screen_manager.current == 'daily':
+                    app.screen_manager.get_screen('daily').add_event(event_id, event_name, start_time)
 
-        # Update the CalendarView or DailyView with the new event(s)
-        app = App.get_running_app()
-        calendar_screen = app.screen_manager.get_screen('calendar')
-        daily_view_screen = app.screen_manager.get_screen('daily')
-
-        # Add recurring events to the calendar if applicable
-        if recurrence_id:
-            with db.get_session() as session:
-                stmt = select(Event_).where(Event_.recurrence_id == recurrence_id)
-                events = session.scalars(stmt)
-                for event in events:
-                    calendar_screen.add_event(
-                        event.id, event.name, event.start_time, frequency=frequency, times=times
-                    )
-
-                    # add events to daily view
-                    if app.screen_manager.current == 'daily':
-                        daily_view_screen.add_event(event.id, event.name, event.start_time)
-        else:
-            # Add a single event to the calendar
-            calendar_screen.add_event(event_id, event_name, start_time)
-
-            # Add event to daily view
-            if app.screen_manager.current == 'daily':
-                daily_view_screen.add_event(event_id, event_name, start_time)
-
-        # Log success and dismiss the modal
-        print(f"Event '{event_name}' scheduled for {event_date_label}, id={event_id}")
-        self.dismiss()  # Close the modal after saving
+            # Log success
+            print(f"Event '{event_name}' scheduled for {event_date_label}, id={event_id}")
 
+        # Save on the worker thread, the views are updated when it's saved
+        get_executor().submit(save, saved)
+        self.dismiss()  # Close the modal after saving
 
-    def save_recurrence(self, frequency: Frequency, times: int) -> int:
-        """Save recurrence details in the database and return the recurrence ID."""
-        with db.get_session() as session:
-            with session.begin():
-                recurrence = Recurrence(times=times, frequency=frequency)
-                session.add(recurrence)
-            return recurrence.id
 
     def update_background(self, *args):
         """Update the size and position of the background rectangle."""
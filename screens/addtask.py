@@ -14,6 +14,9 @@
 # - November 23, 2024: Updated the save_task function to handle recurrence (Matthew McManness)
 # - December 7, 2024: Implemented variables for ease of UI modification (Matthew McManness)
 # - December 8, 2024: Theme toggling (Magaly Camacho)
+# - October 18, 2026: Looked up the shared database with get_database() when a session is needed instead of at import time
+# - October 18, 2026: Recurring tasks are saved as one task and its recurrence, read from the repeat button (it was never applied before)
+# - October 18, 2026: Saving runs on the data executor's worker thread, the views are updated when it's saved
 #
 # Preconditions:
 # - Kivy framework must be installed and configured properly.
@@ -46,9 +49,10 @@ from kivy.app import App  # Ensure App is imported
 from Models import Task, Category # Task and Category classes
 from Models.databaseEnums import Priority, Frequency # for task priorities and frequency
 from database import get_database # to connect to database
+from executor import get_executor # to save on the worker thread
 from sqlalchemy import select # to query database
 from datetime import datetime # for Task.due_date
-from Models import Recurrence  # Import the Recurrence model
+from occurrences import update_series  # to make the task repeat
 from kivy.metrics import dp  # Import dp for density-independent pixel values
 from kivy.graphics import Color, RoundedRectangle  # For rounded rectangle shape
 
@@ -59,8 +63,6 @@ class UniformButton(Button):
 class UniformSpinner(Spinner):
     pass
 
-db = get_database() # get database
-
 class AddTaskModal(ModalView):
     """
     A modal for adding a new task to the To-Do List.
@@ -91,7 +93,7 @@ class AddTaskModal(ModalView):
         app = App.get_running_app()
 
         # Initialize categories and the selected category list
-        with db.get_session() as session, session.begin():
+        with get_database().get_session() as session, session.begin():
             stmt = select(Category).where(True) # sql statement
             results = session.scalars(stmt).all() # query the database for all categories
             self.categories = [result.name for result in results] # save the names of all categories in the database
@@ -212,7 +214,7 @@ class AddTaskModal(ModalView):
 
         Postconditions:
             - A new task is created and added to the database.
-            - Additional tasks are created based on the recurrence if specified.
+            - If a recurrence is specified, it's saved with the task (repeated tasks are generated when displayed).
             - Refreshes the to-do list view after saving the task.
         """
         if not self.title_input.text:
@@ -224,6 +226,10 @@ class AddTaskModal(ModalView):
         notes = self.notes_input.text
         due_date = self.deadline_label.text.split(" ", 1)[1] if "Deadline" in self.deadline_label.text else None
 
+        # Get how the task repeats from the repeat button, None if it doesn't repeat
+        frequency, times = RepeatOptionsModal.parse_repeat_text(self.repeat_button.text)
+        self.recurrence = {"frequency": frequency, "times": times} if frequency else None
+
         # Ensure a valid due_date is provided if recurrence is specified
         if self.recurrence and not due_date:
             print("Due date is required for recurring tasks.")  # Debugging message
@@ -233,14 +239,10 @@ class AddTaskModal(ModalView):
         due_date = datetime.strptime(due_date, "%Y-%m-%d %H:%M") if due_date else None
         priority = Priority.str2enum(self.priority_button.text) if "Pick Priority" != self.priority_button.text else None
 
-        # Ensure self.recurrence is None if "Does not Repeat" is selected or untouched
-        if self.recurrence is None or self.repeat_button.text == Frequency.frequency_options()[0]:
-            self.recurrence = None
-
         # Retrieve category instances
         selected_categories_ids = [cat_id for cat_id, cat in zip(self.categories_ids, self.categories) if cat in self.selected_categories]
 
-        with db.get_session() as session:
+        def save(session):
             # Create the main task
             task = Task(
                 name=name,
@@ -250,46 +252,27 @@ class AddTaskModal(ModalView):
             )
             task.categories = session.query(Category).filter(Category.id.in_(selected_categories_ids)).all()
             session.add(task)
-            session.flush()  # Get task ID immediately
 
-            # Add recurrence if specified
-            if self.recurrence:
-                recurrence = Recurrence(
-                    frequency=self.recurrence["frequency"],
-                    times=self.recurrence["times"]
-                )
-                session.add(recurrence)
-                session.flush()
-                task.recurrence_id = recurrence.id
-
-                # Create repeated tasks based on recurrence
-                next_date = due_date
-                for _ in range(self.recurrence["times"] - 1):  # Subtract 1 because the first task is already created
-                    next_date = recurrence.frequency.get_next_date(next_date, due_date)
-                    if not next_date:  # Debugging check for invalid dates
-                        print("Error: next_date calculation returned None.")
-                        break
-                    repeated_task = Task(
-                        name=name,
-                        notes=notes,
-                        due_date=next_date,
-                        priority=priority,
-                        recurrence_id=recurrence.id
-                    )
-                    repeated_task.categories = task.categories
-                    session.add(repeated_task)
+            # Add recurrence if specified, the repeated tasks are generated when the to-do list is shown
+            update_series(session, task, frequency, times)
+            session.flush()  # Get task ID immediately
 
              # Capture the task ID before the session is closed
             task_id = task.id
 
             # Commit all changes
             session.commit()
+            return task_id
+
+        def saved(task_id):
+            # Refresh the to-do list view if a callback is provided
+            if self.refresh_callback:
+                self.refresh_callback()
 
-        # Refresh the to-do list view if a callback is provided
-        if self.refresh_callback:
-            self.refresh_callback()
+            print(f"Task saved with ID: {task_id}")
 
-        print(f"Task saved with ID: {task_id}")
+        # Save on the worker thread, the to-do list is refreshed when it's saved
+        get_executor().submit(save, saved)
         self.dismiss()
 
     def update_background(self, *args):
@@ -19,6 +19,18 @@
 #   - December 7, 2024: Fixed setting date for dailyview - [Magaly Camacho, Mariam Oraby]
 #   - December 7, 2024: Removed EventBox class since it wasn't used - [Magaly Camacho]
 #   - December 8, 2024: Theme toggling (Magaly Camacho)
+#   - October 18, 2026: Looked up the shared database with get_database() when a session is needed instead of at import time
+#   - October 18, 2026: Replaced extract(year/month/day) filters with indexed start_time range queries
+#   - October 18, 2026: Shows occurrences of recurring events generated for the month instead of stored rows
+#   - October 18, 2026: The month grid keeps a pool of 42 day cells that are rebound to the days of the month on navigation, instead of creating new widgets
+#   - October 18, 2026: Day cells are looked up in a day -> cell index built once per month, and a month's events are grouped by day and placed in one pass
+#   - October 18, 2026: Month is loaded with the month summary (first two events and event count of each day) instead of every event
+#   - October 18, 2026: The month's events are loaded on the data executor's worker thread, a month paged past before it loaded isn't shown
+#   - October 18, 2026: Months already shown are served from the event window cache, committed event changes invalidate only the months they touch
+#   - October 18, 2026: Once the calendar is idle, the months before and after the one shown are prefetched into the event cache
+#   - October 18, 2026: Modals are imported when they're first opened instead of at startup
+#   - October 18, 2026: Day cells are recolored in place when the theme is toggled
+#   - October 18, 2026: Rebinding the day cells to the month's days is its own method, bind_day_cells()
 #
 # Preconditions:
 #   - The `.kv` file must define a `calendar_grid` widget ID to correctly render the calendar grid.
@@ -61,13 +73,13 @@ from kivy.app import App  # Main class to run the Kivy app.
 from kivy.clock import Clock  # Schedule functions after a delay.
 from calendar import monthcalendar  # Generate calendar layout for a given month.
 from datetime import datetime, timedelta  # Work with dates and times.
-from database import get_database # to connect to database
-from sqlalchemy import select, extract # to query database
+from executor import get_executor, Prefetcher # to query the database off the UI thread
+from queries import month_bounds, adjacent_months # to query database
+from eventcache import cached_month_summary # first events of each day, including occurrences of recurring events
 from Models import Event_ # task model class
 from kivy.uix.anchorlayout import AnchorLayout  # Import for anchoring widgets
 from kivy.graphics import Color, Rectangle, RoundedRectangle  # Import for rounded rectangle backgrounds
 import calendar  # Import calendar for setting first day of the week
-from screens.editEvent import EditEventModal  # Adjust the path if the file is located elsewhere
 from kivy.app import App  # Access the app instance for global styles
 
 
@@ -82,7 +94,152 @@ class EventButton(UniformButton):
 # Set the first day of the week to Sunday
 calendar.setfirstweekday(calendar.SUNDAY)
 
-db = get_database()  # Get database
+POOL_SIZE = 42  # day cells in the month grid, 6 weeks is the most a month can span
+CHAR_LIMIT = 9  # longest event name shown in a day cell
+
+
+def display_name(name):
+    """Truncate an event name that's too long for a day cell."""
+    return name if len(name) <= CHAR_LIMIT else f"{name[:CHAR_LIMIT]}..."
+
+
+class DayCell(RelativeLayout):
+    """
+    One day cell of the month grid, with its day button, day number, event buttons and "More..." label.
+    CalendarView keeps a pool of these and rebinds them to other days when the month changes, instead of
+    creating new widgets
+    """
+    max_events = 2  # events shown in a cell, more than this adds the "More..." label
+
+    def __init__(self, on_day_press, on_event_press, **kwargs):
+        """
+        Create the cell's widgets, which are reused for every day the cell shows.
+
+        Args:
+            on_day_press (function): called with the day number when the day is pressed
+            on_event_press (function): called with the event id and occurrence time when an event is pressed
+        """
+        super().__init__(size_hint=(1, None), height=dp(60), **kwargs)
+        self.day = None  # day of the month shown, None for a blank cell
+        self.on_day_press = on_day_press
+        self.on_event_press = on_event_press
+        self.events = []  # (event id, occurrence time) of the events shown
+        self.event_count = 0  # events on this day, including the ones not shown
+
+        # Create a button for the day, which responds to clicks.
+        self.day_button = Button(
+            background_normal="",
+            on_press=lambda instance: self.on_day_press(self.day),  # Open DailyView on press.
+            size_hint=(1, 1),  # Make the button fill the cell.
+            text=""  # No text on the button itself.
+        )
+
+        # Create a label to display the day number.
+        self.day_label = Label(
+            size_hint=(None, None),
+            size=(dp(20), dp(20)),
+            pos_hint={'right': 1, 'top': 1}
+        )
+        label_box = BoxLayout(orientation='vertical', spacing=-20)
+        label_box.add_widget(self.day_label)
+
+        # Layout the event buttons and "More..." label are added to when they're shown
+        anchor_layout = AnchorLayout(anchor_y='top', size_hint_y=None, height=dp(60))
+        self.events_layout = BoxLayout(orientation='vertical', size_hint_y=None, padding=(5, 5))
+        self.events_layout.bind(minimum_height=self.events_layout.setter('height'))
+        anchor_layout.add_widget(self.events_layout)
+
+        # event boxes to separate event buttons
+        self.event_boxes = []
+        for index in range(self.max_events):
+            event_button = EventButton(
+                size_hint_y=None,
+                height=dp(15),
+                background_normal="",
+                on_press=lambda instance, index=index: self.on_event_press(*self.events[index])
+            )
+            event_button.font_size = dp(12)
+            event_box = BoxLayout(orientation='vertical', size_hint_y=None, height=dp(18), padding=(0, 3))
+            event_box.add_widget(event_button)
+            event_box.button = event_button
+            self.event_boxes.append(event_box)
+
+        # "More..." label, shown when there are more events than event buttons
+        self.more_label_layout = AnchorLayout(anchor_y="bottom", size_hint_y=None, height=dp(15), padding=(0,0))
+        self.more_label = Label(
+            text="More...",
+            font_size=dp(12),
+            size_hint=(None, None),
+            height=dp(15)
+        )
+        self.more_label_layout.add_widget(self.more_label)
+
+        # Add the button, label and events to the cell.
+        self.add_widget(self.day_button)
+        self.add_widget(label_box)
+        self.add_widget(anchor_layout)
+        self.apply_theme()
+
+    def apply_theme(self, *args):
+        """Color the cell with the app's theme (the event buttons' kv rule follows the theme by itself)."""
+        app = App.get_running_app()
+        self.day_label.color = app.Text_Color
+        self.day_button.background_color = app.Event_Box
+        self.more_label.color = app.Event_More_Label  # Grey color for the "More..." label
+
+    def show_day(self, day):
+        """Show the given day of the month (None for a blank cell), without any events."""
+        self.day = day
+
+        # Blank cells (before the 1st and after the last day) don't show or respond to anything
+        self.day_label.text = str(day) if day else ""
+        self.day_button.opacity = 1 if day else 0
+        self.day_button.disabled = not day
+
+        self.clear_events()
+
+    def clear_events(self):
+        """Remove the shown events (their widgets are kept for the next events)."""
+        self.events_layout.clear_widgets()
+        self.events = []
+        self.event_count = 0
+
+    def show_events(self, events, count=None):
+        """
+        Show a day's events in one go: the first ones as buttons, then "More..." if needed.
+
+        Args:
+            events (list[EventOccurrence]): the day's (first) events, sorted by start time
+            count (int): how many events the day has, len(events) if not given
+        """
+        count = len(events) if count is None else count
+        for event in events[:self.max_events]:
+            self.add_event(event.id, display_name(event.name), event.occurrence_time)
+
+        # "More..." if the day has more events than buttons
+        if count > self.max_events:
+            self.show_more()
+        self.event_count = count
+
+    def add_event(self, event_id, display_name, occurrence_time=None):
+        """Show an event in the cell, or the "More..." label if it already shows as many events as it can."""
+        self.event_count += 1
+
+        # Add the event button only if fewer than 2 events are currently displayed
+        if self.event_count <= self.max_events:
+            event_box = self.event_boxes[self.event_count - 1]
+            event_box.button.text = display_name
+            self.events.append((event_id, occurrence_time))
+            self.events_layout.add_widget(event_box)
+
+        # Add "More..." label (only once) if there are more than 2 events
+        elif self.event_count == self.max_events + 1:
+            self.show_more()
+
+    def show_more(self):
+        """Show the "More..." label under the event buttons."""
+        self.events_layout.add_widget(self.more_label_layout)
+
         
 class CalendarView(Screen):
     """Displays a monthly calendar with navigational buttons and day selection."""
@@ -96,7 +253,11 @@ class CalendarView(Screen):
         now = datetime.now()  # Get the current date and time.
         self.current_year = now.year  # Store the current year.
         self.current_month = now.month  # Store the current month.
+        self.day_cells = []  # pool of day cells, created once and reused for every month
+        self.cells_by_day = {}  # day of the current month -> its day cell, rebuilt when the month is shown
+        self.prefetcher = Prefetcher("calendar-prefetch")  # loads the months next to the one shown
         self.update_month_year_text()  # Update the month-year text display.
+        App.get_running_app().bind(current_theme=self.apply_theme)  # recolor the day cells in place
 
     def on_kv_post(self, base_widget):
         """Populate the calendar after the KV file has loaded."""
@@ -106,6 +267,11 @@ class CalendarView(Screen):
         else:
             print("Error: 'calendar_grid' not found in ids.")  # Log error if grid not found.
 
+    def apply_theme(self, *args):
+        """Recolor the pooled day cells when the theme is toggled (kv rules follow the theme by themselves)."""
+        for cell in self.day_cells:
+            cell.apply_theme()
+
     def update_month_year_text(self):
         """Update the label to show the current month and year."""
         self.month_year_text = datetime(self.current_year, self.current_month, 1).strftime('%B %Y')
@@ -124,120 +290,51 @@ class CalendarView(Screen):
         self.populate_calendar()  # Repopulate the calendar grid.
 
     def populate_calendar(self):
-        """Generate the calendar grid with day buttons."""
+        """Show the current month in the calendar grid, rebinding the pooled day cells to its days."""
+        self.bind_day_cells()
+        self.populate()
+
+    def bind_day_cells(self):
+        """Rebind the pooled day cells to the days of the current month, without any events."""
         grid = self.ids['calendar_grid']  # Get the calendar grid from the KV file.
-        grid.clear_widgets()  # Clear any existing widgets from the grid.
+
+        # Create the pool of day cells the first time (or if the grid was rebuilt)
+        if not self.day_cells or self.day_cells[0].parent not in (grid, None):
+            self.day_cells = [DayCell(self.open_daily_view, self.open_edit_event_modal) for _ in range(POOL_SIZE)]
+            grid.clear_widgets()
 
         # Get the calendar layout for the current month.
         cal = monthcalendar(self.current_year, self.current_month)
-
-        # Populate the grid with days of the month.
-        for week in cal:
-            for day in week:
-                if day == 0:
-                    # Add an empty label for non-days (blank spaces).
-                    grid.add_widget(Label())
-                else:
-                    # Create a relative layout for each day cell.
-                    cell = BoxLayout(orientation='vertical', spacing=-20)
-                    container = RelativeLayout(size_hint=(1, None), height=dp(60))
-
-                    # Create a label to display the day number.
-                    day_label = Label(
-                        text=str(day),
-                        size_hint=(None, None),
-                        size=(dp(20), dp(20)),
-                        pos_hint={'right': 1, 'top': 1},
-                        color= App.get_running_app().Text_Color  
-                    )
-
-                    # Create a button for the day, which responds to clicks.
-                    day_button = Button(
-                        background_normal="",
-                        background_color=App.get_running_app().Event_Box, 
-                        on_press=lambda instance, day=day: self.open_daily_view(day),  # Open DailyView on press.
-                        size_hint=(1, 1),  # Make the button fill the cell.
-                        text=""  # No text on the button itself.
-                    )
-
-                    # Add the button and label to the cell.
-                    container.add_widget(day_button)
-                    cell.add_widget(day_label)
-                    container.add_widget(cell)
-
-                    # Add the cell to the calendar grid.
-                    grid.add_widget(container)
-        self.populate()
-
-    def add_event(self, event_id, name, start_time, frequency=None, times=None, place=None):
+        days = [day or None for week in cal for day in week]  # None for blank spaces
+
+        # Only the weeks of this month are in the grid (4 to 6), the other cells wait in the pool
+        self.cells_by_day = {}
+        for index, cell in enumerate(self.day_cells):
+            if index < len(days):
+                cell.show_day(days[index])
+                if days[index]:
+                    self.cells_by_day[days[index]] = cell
+                if cell.parent is None:
+                    grid.add_widget(cell)
+            elif cell.parent is not None:
+                grid.remove_widget(cell)
+
+    def add_event(self, event_id, name, start_time, frequency=None, times=None, place=None, occurrence_time=None):
         """
-        Add a new event to the calendar.
+        Add a new event to the calendar. occurrence_time is given for occurrences of recurring events.
         """
-        # Define a character limit for truncation
-        char_limit = 9  # Adjust this value as needed
-
         # Truncate the event name if it exceeds the character limit
-        display_name = name if len(name) <= char_limit else f"{name[:char_limit]}..."
+        name = display_name(name)
 
         # Ensure start_time is a datetime object
         if isinstance(start_time, str):
             start_time = datetime.strptime(start_time, '%Y-%m-%d %H:%M')
 
-        # Create the event button
-        event_button = EventButton(
-            text=display_name,
-            size_hint_y=None,
-            height=dp(15),
-            background_normal="",
-            on_press=lambda instance, event_id=event_id: self.open_edit_event_modal(event_id)  # Pass event ID to the method
-        )
-
-        # Set font_size explicitly after creation
-        event_button.font_size = dp(12)
-        event_button.height = dp(15)
-
-        # event box to separate event buttons
-        event_box = BoxLayout(orientation='vertical', size_hint_y=None, height=dp(18), padding=(0, 3))
-        event_box.add_widget(event_button)
-
-        # Retrieve the cell widget for the event's start date
+        # Retrieve the cell widget for the event's start date, and show the event in it
         cell = self.get_cell_widget(start_time)
         if cell:
-            # Ensure AnchorLayout for events exists
-            if not cell.children or not isinstance(cell.children[0], AnchorLayout):
-                anchor_layout = AnchorLayout(anchor_y='top', size_hint_y=None, height=dp(60))
-                events_layout = BoxLayout(orientation='vertical', size_hint_y=None, padding=(5, 5))
-                events_layout.bind(minimum_height=events_layout.setter('height'))
-                anchor_layout.add_widget(events_layout)
-                cell.add_widget(anchor_layout)
-            else:
-                events_layout = cell.children[0].children[0]
-
-            # Add the event button only if fewer than 2 events are currently displayed
-            displayed_events = [child for child in events_layout.children if isinstance(child, BoxLayout)]
-            if len(displayed_events) < 2:
-                events_layout.add_widget(event_box)
-
-            # Add "More..." label if there are more than 2 events
-            if len(displayed_events) == 2:
-                # Ensure the "More..." label exists only once
-                more_label_layout = next(
-                    (child for child in events_layout.children if isinstance(child, AnchorLayout) and child.anchor_y == "bottom"),
-                    None
-                )
-                if not more_label_layout:
-                    more_label_layout = AnchorLayout(anchor_y="bottom", size_hint_y=None, height=dp(15), padding=(0,0))
-                    more_label = Label(
-                        text="More...",
-                        font_size=dp(12),
-                        size_hint=(None, None),
-                        height=dp(15),
-                        color=App.get_running_app().Event_More_Label  # Grey color for the "More..." label
-                    )
-                    more_label_layout.add_widget(more_label)
-                    events_layout.add_widget(more_label_layout)
-
-            print(f"Added event: {event_id} - {display_name} on {start_time}")
+            cell.add_event(event_id, name, occurrence_time)
+            print(f"Added event: {event_id} - {name} on {start_time}")
 
     def get_cell_widget(self, date_obj):
         """Retrieve the widget for the specified date."""
@@ -254,48 +351,55 @@ class CalendarView(Screen):
             print("Error: The specified date is not in the current month or year.")
             return None
 
-        # Get the calendar layout for the current month
-        cal = monthcalendar(self.current_year, self.current_month)
-
-        # Locate the widget for the target day in calendar_grid
-        grid = self.ids['calendar_grid']
-        widget_index = 0
-        for week in cal:
-            for day in week:
-                if day == target_day:
-                    # Found the target day; retrieve the widget
-                    return grid.children[len(grid.children) - widget_index - 1]
-                widget_index += 1
+        # Look up the cell for the target day
+        cell = self.cells_by_day.get(target_day)
+        if cell is not None:
+            return cell
 
         print("Error: Day widget not found.")
         return None
     
     def refresh_calendar(self):
-        grid = self.ids['calendar_grid']  # Get the calendar grid from the KV file.
-        grid.clear_widgets()  # Clear any existing widgets from the grid.
+        """Show the current month again (e.g. after an event was edited), reusing the day cells."""
         self.populate_calendar()
 
     def populate(self):
-        """Retrieve and display events for the current month."""
-        session = db.get_session()
-        try:
-            stmt = select(Event_).where(
-                extract("year", Event_.start_time) == self.current_year,
-                extract("month", Event_.start_time) == self.current_month
-            )
-            events = session.scalars(stmt).all()
-            events.sort(key=lambda event: event.start_time)  # Sort events by start time
+        """Retrieve (on the data executor's thread) and display events for the current month."""
+        month = (self.current_year, self.current_month)
+        self.prefetcher.cancel()  # the months next to the last month shown aren't needed first
+
+        # First events and event count of each day this month (including occurrences of recurring events),
+        # a cell only shows two events, so that's all that's loaded. A month shown before is served from memory
+        get_executor().submit(
+            lambda session: cached_month_summary(session, *month_bounds(*month), per_day=DayCell.max_events),
+            lambda summaries: self.show_month_summary(month, summaries),
+            key="calendar-month"  # paging to another month cancels loading this one
+        )
+
+    def show_month_summary(self, month, summaries):
+        """Place each day's events in its cell in one pass, if the month is still shown."""
+        if month != (self.current_year, self.current_month):
+            return
+
+        for day, summary in summaries.items():
+            cell = self.cells_by_day.get(day.day)
+            if cell is not None:
+                cell.show_events(summary.events, summary.count)
+
+        print(f"Added {sum(summary.count for summary in summaries.values())} events to {self.month_year_text}")
+
+        # Once the calendar is idle, load the months before and after into the event cache, so flipping is instant
+        self.prefetcher.schedule([
+            lambda session, month=adjacent: cached_month_summary(session, *month_bounds(*month), per_day=DayCell.max_events, prefetch=True)
+            for adjacent in adjacent_months(*month)
+        ])
 
-            for event in events:
-                start_time = event.start_time if isinstance(event.start_time, datetime) else datetime.strptime(event.start_time, "%Y-%m-%d %H:%M")
-                self.add_event(event.id, event.name, start_time, event.place)
-        finally:
-            session.close()
+    def open_edit_event_modal(self, event_id, occurrence_time=None):
+        """Open the Edit Event modal for a specific event ID (and occurrence) and refresh calendar upon save."""
+        from screens.editEvent import EditEventModal  # Imported on first use, startup doesn't need it
 
-    def open_edit_event_modal(self, event_id):
-        """Open the Edit Event modal for a specific event ID and refresh calendar upon save."""
         self.modal_open = True
-        edit_event_modal = EditEventModal(event_id=event_id, refresh_callback=self.refresh_calendar)
+        edit_event_modal = EditEventModal(event_id=event_id, refresh_callback=self.refresh_calendar, occurrence_time=occurrence_time)
 
         # Reset modal_open when the modal is dismissed
         def reset_modal_open(*args):
@@ -10,6 +10,13 @@
 #   - December 7, 2024: Implemented variables for ease of UI modification - [Matthew McManness]
 #   - December 8, 2024: Removed example testing code that's unnecessary now - [Manvir Kaur]
 #   - December 8, 2024: Theme toggling (Magaly Camacho)
+#   - October 18, 2026: Looked up the shared database with get_database() when a session is needed instead of at import time
+#   - October 18, 2026: Replaced extract(year/month/day) filters with indexed start_time range queries
+#   - October 18, 2026: Shows occurrences of recurring events generated for the day instead of stored rows
+#   - October 18, 2026: The day's events are loaded on the data executor's worker thread
+#   - October 18, 2026: Days already shown are served from the event window cache
+#   - October 18, 2026: Once the view is idle, the days before and after the one shown are prefetched into the event cache
+#   - October 18, 2026: Shown events are recolored in place when the theme is toggled
 
 from datetime import datetime, timedelta
 from kivy.uix.screenmanager import Screen
@@ -20,8 +27,9 @@ from kivy.uix.button import Button
 from kivy.properties import ObjectProperty
 from kivy.metrics import dp
 from kivy.app import App
-from database import get_database
-from sqlalchemy import select, extract
+from executor import get_executor, Prefetcher  # to query the database off the UI thread
+from queries import day_bounds
+from eventcache import cached_event_occurrences  # a day shown before is served from memory
 from Models import Event_
 from kivy.lang import Builder
 from kivy.clock import Clock
@@ -29,8 +37,6 @@ from kivy.graphics import Color, Rectangle, RoundedRectangle
 from screens.calendarview import CalendarView
 from Models.databaseEnums import Frequency
 
-db = get_database()
-
 class UniformButton(Button):
     pass
 class EditButton(UniformButton):
@@ -46,12 +52,20 @@ class EventBox(BoxLayout):
         app = App.get_running_app()
         # Initialize size of EventBox and make its background color white
         with self.canvas.before:
-            Color(*app.Event_Box)
+            self.background = Color(*app.Event_Box)  # kept to change the color in place when the theme is toggled
             self.rect = Rectangle(size=self.size, pos=self.pos)
 
         # When EventBox is updated, make sure size is correct
         self.bind(size=self.update_rect, pos=self.update_rect)
 
+    def apply_theme(self):
+        """Color the box and its labels with the app's theme (the edit button's kv rule follows the theme by itself)."""
+        app = App.get_running_app()
+        self.background.rgba = app.Event_Box
+        for widget in self.children:
+            if isinstance(widget, Label) and not isinstance(widget, EditButton):
+                widget.color = app.Text_Color
+
     def update_rect(self, *args):
         """Update rectangle to match the size and position of the EventBox"""
         self.rect.pos = self.pos
@@ -63,9 +77,19 @@ class DailyView(Screen):  # Change inheritance to Screen
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         self.current_date = datetime.now()
+        self.prefetcher = Prefetcher("daily-prefetch")  # loads the days next to the one shown
         Clock.schedule_once(lambda dt: self.update_date_label())  # Delay update
         Clock.schedule_once(lambda dt: self.populate_events())
         self.app = App.get_running_app()
+        self.app.bind(current_theme=self.apply_theme)  # recolor the shown events in place
+
+    def apply_theme(self, *args):
+        """Recolor the shown events when the theme is toggled (kv rules follow the theme by themselves)."""
+        for widget in self.ids['event_list'].children:
+            if isinstance(widget, EventBox):
+                widget.apply_theme()
+            elif isinstance(widget, Label):  # "No events for this day."
+                widget.color = self.app.Text_Color
 
     def update_date_label(self):
         """Updates the date label to show the current date."""
@@ -115,22 +139,30 @@ class DailyView(Screen):  # Change inheritance to Screen
             print("Error: No date selected.")
             return
 
-        try:
-            # Query events for the selected date
-            session = db.get_session()
-            start_of_day = datetime.combine(self.selected_date, datetime.min.time())
-            end_of_day = datetime.combine(self.selected_date, datetime.max.time())
+        # Query events for the selected date (on the data executor's thread)
+        selected_date = self.selected_date
+        self.prefetcher.cancel()  # the days next to the last day shown aren't needed first
+        get_executor().submit(
+            lambda session: cached_event_occurrences(session, *day_bounds(selected_date)),
+            lambda events: self.show_day(selected_date, events),
+            on_error=print,
+            key="daily-events"  # navigating to another day cancels loading this one
+        )
+
+    def show_day(self, selected_date, events):
+        """Display the day's events if the day is still selected, then prefetch the days around it."""
+        if selected_date != self.selected_date:
+            return
 
-            stmt = select(Event_).where(
-                Event_.start_time >= start_of_day,
-                Event_.start_time <= end_of_day
-            )
+        self.display_events(events)
+        self.prefetch_adjacent_days(selected_date)
 
-            events = session.scalars(stmt).all()
-            self.display_events(events)
-            session.close()
-        except Exception as e:
-            print(e)
+    def prefetch_adjacent_days(self, day):
+        """Once the view is idle, load the days before and after into the event cache, so navigating is instant."""
+        self.prefetcher.schedule([
+            lambda session, day=adjacent: cached_event_occurrences(session, *day_bounds(day), prefetch=True)
+            for adjacent in (day - timedelta(days=1), day + timedelta(days=1))
+        ])
 
     def display_events(self, events):
         """
@@ -145,11 +177,11 @@ class DailyView(Screen):  # Change inheritance to Screen
             return
 
         for event in events:
-            self.add_event(event.id, event.name, event.start_time)
+            self.add_event(event.id, event.name, event.start_time, occurrence_time=event.occurrence_time)
 
-    def add_event(self, event_id:int, name:str, start_time:datetime, frequency=None, times=None, place=None):
+    def add_event(self, event_id:int, name:str, start_time:datetime, frequency=None, times=None, place=None, occurrence_time=None):
         """
-        Add a single event to the container.
+        Add a single event to the container. occurrence_time is given for occurrences of recurring events.
         """
         app = App.get_running_app()
         # if event isn't on current/selected day, don't add it
@@ -178,7 +210,7 @@ class DailyView(Screen):  # Change inheritance to Screen
 
         edit_button = EditButton(
             text="Edit",
-            on_press=lambda instance, event_id=event_id: self.open_edit_event_modal(event_id)
+            on_press=lambda instance, event_id=event_id: self.open_edit_event_modal(event_id, occurrence_time)
         )
         
         # Add widgets to the event box
@@ -190,30 +222,24 @@ class DailyView(Screen):  # Change inheritance to Screen
         container = self.ids['event_list']
         container.add_widget(event_box)
 
-    def open_edit_event_modal(self, event_id):
+    def open_edit_event_modal(self, event_id, occurrence_time=None):
         """
-        Open the Edit Event modal for the selected event.
+        Open the Edit Event modal for the selected event (and occurrence).
         """
         from screens.editEvent import EditEventModal  # Import here to avoid circular imports
 
-        edit_modal = EditEventModal(event_id=event_id, refresh_callback=self.refresh_events)
+        edit_modal = EditEventModal(event_id=event_id, refresh_callback=self.refresh_events, occurrence_time=occurrence_time)
         edit_modal.open()
 
     def populate_daily_events(self):
         """Retrieve and display events for the selected day."""
-        try:
-            session = db.get_session()
-            
-            # Query events for the selected day
-            stmt = select(Event_).where(
-                extract("year", Event_.start_time) == self.selected_date.year,
-                extract("month", Event_.start_time) == self.selected_date.month,
-                extract("day", Event_.start_time) == self.selected_date.day
-            )
-            events = session.scalars(stmt).all()
-
-            # Sort events by start time
-            events.sort(key=lambda event: event.start_time)
+        selected_date = self.selected_date
+        self.prefetcher.cancel()
+
+        def show_events(events):
+            """Show the day's events, if the day is still selected"""
+            if selected_date != self.selected_date:
+                return
 
             # Clear the current event list
             events_list = self.ids['event_list']
@@ -224,8 +250,13 @@ class DailyView(Screen):  # Change inheritance to Screen
                 event_box = EventBox()
                 event_box.add_widget(Label(text=f"{event.start_time.strftime('%H:%M')} - {event.name}"))
                 events_list.add_widget(event_box)
-            
-            session.close()
-        
-        except Exception as e:
-            print(e)
+
+            self.prefetch_adjacent_days(selected_date)
+
+        # Query events (and occurrences of recurring events) for the selected day, sorted by start time
+        get_executor().submit(
+            lambda session: cached_event_occurrences(session, *day_bounds(selected_date)),
+            show_events,
+            on_error=print,
+            key="daily-events"
+        )
@@ -10,6 +10,10 @@
 # - November 20, 2024: Implemented recurrence and fixed some bugs (Magaly Camacho)
 # - December 7, 2024: Implemented variables for ease of UI modification (Matthew McManness)
 # - December 8, 2024: Theme toggling (Magaly Camacho)
+# - October 18, 2026: Looked up the shared database with get_database() when a session is needed instead of at import time
+# - October 18, 2026: Recurring events are edited and deleted per occurrence (or as a whole series when how they repeat changes) without writing a row per occurrence
+# - October 18, 2026: Saving and deleting run on the data executor's worker thread, the views are refreshed when it's done
+# - October 18, 2026: Loads with the shared database instead of turning on SQL echo for everyone, its statements are counted by instrumentation.py
 #
 # Preconditions:
 # - Kivy framework must be installed and configured properly.
@@ -37,8 +41,10 @@ from kivy.uix.label import Label  # Label widget for displaying text
 from Models import Event_, Recurrence  # Event class
 from Models.databaseEnums import Frequency  # For event frequency
 from database import get_database  # To connect to the database
+from executor import get_executor  # To save on the worker thread
+from instrumentation import action  # To count the SQL of loading an event
 from sqlalchemy import select  # To query the database
-from sqlalchemy.orm import Session  # for typing
+from occurrences import detach_occurrence, delete_occurrence, delete_item, update_series  # for recurring events
 from datetime import datetime  # For event date and time
 from screens.usefulwidgets import DatePicker, RepeatOptionsModal  # Additional modals
 from kivy.metrics import dp  # For consistent spacing and sizing
@@ -49,13 +55,13 @@ from kivy.graphics import Color, RoundedRectangle  # For rounded rectangle shape
 class UniformButton(Button):
     pass
 
-db = get_database(debug=True)  # Get the database connection
-
 
 class EditEventModal(ModalView):
-    def __init__(self, event_id=None, refresh_callback=None, **kwargs):
+    def __init__(self, event_id=None, refresh_callback=None, occurrence_time=None, **kwargs):
         super().__init__(**kwargs)
         self.event_id = event_id  # Store the event ID for loading
+        self.occurrence_time = occurrence_time  # Which occurrence of a recurring event is being edited
+        self.recurrence = (None, None)  # The event's (frequency, times) when it was loaded
         self.size_hint = (0.95, 0.5)
         self.auto_dismiss = False
         self.refresh_callback = refresh_callback  # Store the refresh callback
@@ -147,24 +153,30 @@ class EditEventModal(ModalView):
 
     def load_event(self, event_id):
         """Load event data into fields for editing."""
-        with db.get_session() as session, session.begin():
+        with action("EditEventModal.load_event"), get_database().get_session() as session, session.begin():
             event = session.query(Event_).filter_by(id=event_id).first()
             if event:
                 # Populate the title and notes fields
                 self.title_input.text = event.name
                 self.notes_input.text = event.notes
-                # Format and display the event start time
-                self.event_date_label.text = f"Event Date: {event.start_time.strftime('%Y-%m-%d %H:%M')}" if event.start_time else "Pick a date & time"
+                # Format and display the start time of the event (or of the occurrence being edited)
+                start_time = self.occurrence_time or event.start_time
+                self.event_date_label.text = f"Event Date: {start_time.strftime('%Y-%m-%d %H:%M')}" if start_time else "Pick a date & time"
 
                 # Get recurrence info
                 if event.recurrence_id:
                     recurrence: Recurrence = event.recurrence
-                    self.repeat_button.text = Frequency.enum2str(recurrence.frequency)
+                    self.recurrence = (recurrence.frequency, recurrence.times)
+                    self.repeat_button.text = RepeatOptionsModal.repeat_text(recurrence.frequency, recurrence.times)
+                else:
+                    self.occurrence_time = None  # one-off events don't have occurrences
 
-                    if not Frequency.is_no_repeat(recurrence.frequency):
-                        self.repeat_button.text += f" ({recurrence.times} times)"
     def save_event(self, *args):
-        """Save the event, updating if it exists or creating a new one."""
+        """
+        Save the event, updating if it exists or creating a new one.
+        Editing an occurrence of a recurring event only changes that occurrence, unless how it repeats was changed,
+        then the whole series is changed (and moved by as much as this occurrence was moved).
+        """
         if not self.title_input.text:
             print("Event Title is required.")
             return
@@ -174,82 +186,75 @@ class EditEventModal(ModalView):
         notes = self.notes_input.text
         start_time = (" ").join(self.event_date_label.text.split(" ")[2:]) if "Event Date:" in self.event_date_label.text else None # remove "Event Date:"
         start_time = datetime.strptime(start_time, "%Y-%m-%d %H:%M") if start_time else None
-        repeat_info = self.repeat_button.text.split(" ")
-        frequency = None if len(repeat_info) == 2 else Frequency.str2enum(repeat_info[1]) # None if "Doesn't Repeat"
-        times = None if len(repeat_info) == 2 else int(repeat_info[2]) # None if "Doesn't repeat"
-
-        with db.get_session() as session, session.begin():
-            if self.event_id:
-                event = session.scalar(select(Event_).where(Event_.id == self.event_id)) # get event from database
-                # Update existing event
-                if event:
-                    event.name = name
-                    event.notes = notes
-                    event.start_time = start_time
-
-                    make_new_recurrence = False # assume new recurrence isn't needed
-
-                    # New recurrence might be needed if times and frequency was given
-                    if times and frequency:
-                        # if event has recurrence, new recurrence is need if it doesn't match existing one
-                        if event.recurrence_id: 
-                            recurrence = event.recurrence
-                            if times != recurrence.times or frequency != recurrence.frequency:
-                                make_new_recurrence = True
-                    
-                        else: # if event doesn't have recurrence and recurrence info was given, make new recurrence
-                            make_new_recurrence = True
-                    
-                    # Make new recurrence if needed
-                    if make_new_recurrence:
-                        new_recurrence_id = self.save_recurrence(frequency, times, session=session)
-                        event.recurrence_id = new_recurrence_id
-
-                        # create other events
-                        current_date = start_time
-                        for _ in range(times - 1):
-                            new_date = frequency.get_next_date(current_date, start_time)
-
-                            # create event with same info as edited event
-                            event_i = Event_(
-                                name=name,
-                                notes=notes,
-                                start_time=new_date,
-                                recurrence_id=new_recurrence_id
-                            )
-                            print(event_i)
-
-                            current_date = new_date # save date to calculate next one
-                            session.add(event_i)
-
+        frequency, times = RepeatOptionsModal.parse_repeat_text(self.repeat_button.text) # None if "Never Repeats"
+
+        event_id, occurrence_time, recurrence = self.event_id, self.occurrence_time, self.recurrence
+
+        def save(session):
+            with session.begin():
+                if event_id:
+                    event = session.scalar(select(Event_).where(Event_.id == event_id)) # get event from database
+                    # Update existing event
+                    if event:
+                        if occurrence_time and (frequency, times) == recurrence:
+                            # only this occurrence changes, it becomes a one-off event
+                            event = detach_occurrence(session, event, occurrence_time)
+                            event.name = name
+                            event.notes = notes
+                            event.start_time = start_time
+                        else:
+                            # the whole series changes, move it by as much as this occurrence was moved
+                            series_start = start_time
+                            if occurrence_time and start_time:
+                                series_start = event.start_time + (start_time - occurrence_time)
+
+                            event.name = name
+                            event.notes = notes
+                            event.start_time = series_start
+
+                            # Make the event repeat, update how it repeats, or stop it from repeating
+                            update_series(session, event, frequency, times)
+
+                    else:
+                        print(f"No event found with ID {event_id}.")
                 else:
-                    print(f"No event found with ID {self.event_id}.")
-            else:
-                # Create a new event only if no event_id was provided
-                event = Event_(name=name, notes=notes, start_time=start_time)
-                session.add(event)
-                session.commit()
-
-        # Refresh the calendar after saving if callback is provided
-        if self.refresh_callback:
-            print("Refreshing")
-            self.refresh_callback()
+                    # Create a new event only if no event_id was provided
+                    event = Event_(name=name, notes=notes, start_time=start_time)
+                    session.add(event)
+                    update_series(session, event, frequency, times)
+
+        def saved(result):
+            # Refresh the calendar after saving if callback is provided
+            if self.refresh_callback:
+                print("Refreshing")
+                self.refresh_callback()
 
+        # Save on the worker thread, the views are refreshed when it's saved
+        get_executor().submit(save, saved)
         self.cancel_and_close()
 
     def delete_event(self, *args):
-        """Delete the event from the database."""
+        """Delete the event (or, for a recurring event, the occurrence being edited) from the database."""
         if self.event_id:
-            with db.get_session() as session, session.begin():
-                event = session.query(Event_).filter_by(id=self.event_id).first()
-                if event:
-                    session.delete(event)
-            print(f"Event with ID {self.event_id} deleted.")
+            event_id, occurrence_time = self.event_id, self.occurrence_time
 
-            # Call the refresh callback to update the event list after deletion
-            if self.refresh_callback:
-                self.refresh_callback()
+            def delete(session):
+                with session.begin():
+                    event = session.query(Event_).filter_by(id=event_id).first()
+                    if event and occurrence_time:
+                        delete_occurrence(session, event, occurrence_time)
+                    elif event:
+                        delete_item(session, event)
+
+            def deleted(result):
+                print(f"Event with ID {event_id} deleted.")
+
+                # Call the refresh callback to update the event list after deletion
+                if self.refresh_callback:
+                    self.refresh_callback()
 
+            # Delete on the worker thread, the views are refreshed when it's deleted
+            get_executor().submit(delete, deleted)
             self.cancel_and_close()
 
     def open_date_picker(self, instance):
@@ -260,24 +265,6 @@ class EditEventModal(ModalView):
         """Open the RepeatOptionsModal to choose a repeat option."""
         RepeatOptionsModal(self).open()
 
-    def save_recurrence(self, frequency:Frequency, times:int, session:Session) -> int:
-        """
-        Adds the given recurrence to the given session and returns its id
-        
-        Parameters:
-            frequency (Frequency): the frequency of the recurrence (daily, weekly, monthly, yearly)
-            times (int): the number of times to repeat the event 
-            session (Session): the session to add the recurrence to
-
-        Returns:
-            int: the id of the new recurrence
-        """
-        recurrence = Recurrence(times=times, frequency=frequency)
-        session.add(recurrence) 
-        session.flush() # assigns id without needing to commiting (in case of a rollback)
-        
-        return recurrence.id
-    
     def update_background(self, *args):
         """Update the size and position of the background rectangle."""
         self.bg_rect.pos = self.pos
@@ -11,6 +11,9 @@
 # - November 23, 2024: Modified the initilization, the load_task and save_task functions to handle recurrence (Matthew McManness)
 # - December 7, 2024: Implemented variables for ease of UI modification (Matthew McManness)
 # - December 8, 2024: Theme toggling (Magaly Camacho)
+# - October 18, 2026: Looked up the shared database with get_database() when a session is needed instead of at import time
+# - October 18, 2026: Recurring tasks are edited and deleted per occurrence (or as a whole series when how they repeat changes), how a task repeats is read from the repeat button
+# - October 18, 2026: Saving and deleting run on the data executor's worker thread, the views are refreshed when it's done
 #
 # Preconditions:
 # - Kivy framework must be installed and configured properly.
@@ -41,11 +44,12 @@ from screens.usefulwidgets import RepeatOptionsModal, PriorityOptionsModal, Cate
 from kivy.uix.label import Label  # Label widget for displaying text
 from kivy.app import App  # Ensure App is imported
 from Models import Task, Category # Task and Category classes
-from Models.databaseEnums import Priority # for tasl priorities
+from Models.databaseEnums import Priority, Frequency # for task priorities and frequency
 from database import get_database # to connect to database
+from executor import get_executor # to save on the worker thread
 from sqlalchemy import select # to query database
 from datetime import datetime # for Task.due_date
-from Models import Recurrence  # Import the Recurrence model
+from occurrences import detach_occurrence, delete_occurrence, delete_item, update_series  # for recurring tasks
 from kivy.metrics import dp  # Import dp for density-independent pixel values
 from kivy.graphics import Color, RoundedRectangle  # For rounded rectangle shape
 
@@ -56,16 +60,15 @@ class UniformButton(Button):
 class UniformSpinner(Spinner):
     pass
 
-db = get_database() # get database
-
 class EditTaskModal(ModalView):
-    def __init__(self, task_id=None, refresh_callback=None, **kwargs):
+    def __init__(self, task_id=None, refresh_callback=None, occurrence_time=None, **kwargs):
         """
         Initializes the EditTaskModal.
 
         Args:
             task_id (int): The ID of the task being edited (optional).
             refresh_callback (function): A callback function to refresh the ToDoListView.
+            occurrence_time (datetime): Which occurrence of a recurring task is being edited (optional).
             **kwargs: Additional arguments passed to the superclass.
 
         Preconditions:
@@ -78,6 +81,7 @@ class EditTaskModal(ModalView):
         """
         super().__init__(**kwargs)
         self.task_id = task_id  # Store task ID for editing
+        self.occurrence_time = occurrence_time  # Store which occurrence of a recurring task is edited
         self.size_hint = (0.99, 0.9)
         self.auto_dismiss = False
         self.refresh_callback = refresh_callback  # Store the refresh callback
@@ -88,7 +92,7 @@ class EditTaskModal(ModalView):
         app = App.get_running_app()
 
         # Load categories
-        with db.get_session() as session, session.begin():
+        with get_database().get_session() as session, session.begin():
             stmt = select(Category).where(True)
             results = session.scalars(stmt).all()
             self.categories = [result.name for result in results]
@@ -128,7 +132,7 @@ class EditTaskModal(ModalView):
         layout.add_widget(deadline_layout)
 
         # Repeat button
-        self.repeat_button = UniformButton(text="Does not repeat", on_release=self.open_repeat_window)
+        self.repeat_button = UniformButton(text=Frequency.frequency_options()[0], on_release=self.open_repeat_window)
         layout.add_widget(self.repeat_button)
         
         # Button to open the Priority Options modal
@@ -179,12 +183,13 @@ class EditTaskModal(ModalView):
             - The task's details are pre-filled in the modal fields.
             - If the task has recurrence, the recurrence details are loaded.
         """
-        with db.get_session() as session, session.begin():
+        with get_database().get_session() as session, session.begin():
             task = session.query(Task).filter_by(id=task_id).first()
             if task:
                 self.title_input.text = task.name
                 self.notes_input.text = task.notes
-                self.deadline_label.text = f"Deadline: {task.due_date.strftime('%Y-%m-%d %H:%M')}" if task.due_date else "Pick a deadline"
+                due_date = self.occurrence_time or task.due_date  # due date of the occurrence being edited
+                self.deadline_label.text = f"Deadline: {due_date.strftime('%Y-%m-%d %H:%M')}" if due_date else "Pick a deadline"
                 self.priority_button.text = Priority.get_str_and_color(task.priority)[0] if task.priority else "Pick Priority"
                 self.selected_categories = [category.name for category in task.categories]
                 self.update_applied_categories()
@@ -195,9 +200,10 @@ class EditTaskModal(ModalView):
                         "frequency": task.recurrence.frequency,
                         "times": task.recurrence.times
                     }
-                    self.repeat_button.text = f"{task.recurrence.frequency.name.capitalize()} ({task.recurrence.times} times)"
+                    self.repeat_button.text = RepeatOptionsModal.repeat_text(task.recurrence.frequency, task.recurrence.times)
                 else:
                     self.recurrence = None
+                    self.occurrence_time = None  # one-off tasks don't have occurrences
 
     def save_task(self, *args):
         """
@@ -205,7 +211,8 @@ class EditTaskModal(ModalView):
 
         Postconditions:
             - Updates an existing task or creates a new one in the database.
-            - If recurrence is specified, updates or creates the recurrence details.
+            - For an occurrence of a recurring task, only that occurrence is updated, unless how it repeats
+              was changed, then the whole series is updated (and moved by as much as this occurrence was moved).
             - Refreshes the to-do list view.
         """
         if not self.title_input.text:
@@ -218,34 +225,38 @@ class EditTaskModal(ModalView):
         due_date = self.deadline_label.text.split(" ", 1)[1] if "Deadline" in self.deadline_label.text else None
         due_date = datetime.strptime(due_date, "%Y-%m-%d %H:%M") if due_date else None
         priority = Priority.str2enum(self.priority_button.text) if "Pick Priority" != self.priority_button.text else None
+        frequency, times = RepeatOptionsModal.parse_repeat_text(self.repeat_button.text) # None if it doesn't repeat
+        old_frequency, old_times = (self.recurrence["frequency"], self.recurrence["times"]) if self.recurrence else (None, None)
 
         # Retrieve category instances
         selected_categories_ids = [cat_id for cat_id, cat in zip(self.categories_ids, self.categories) if cat in self.selected_categories]
 
-        with db.get_session() as session:
-            if self.task_id:
-                task = session.query(Task).filter_by(id=self.task_id).first()
+        task_id, occurrence_time = self.task_id, self.occurrence_time
+
+        def save(session):
+            new_due_date = due_date
+            if task_id:
+                task = session.query(Task).filter_by(id=task_id).first()
+
+                if occurrence_time and (frequency, times) == (old_frequency, old_times):
+                    # only this occurrence changes, it becomes a one-off task
+                    task = detach_occurrence(session, task, occurrence_time)
+                    repeat = False
+                else:
+                    # the whole series changes, move it by as much as this occurrence was moved
+                    if occurrence_time and due_date:
+                        new_due_date = task.due_date + (due_date - occurrence_time)
+                    repeat = True
+
                 task.name = name
                 task.notes = notes
-                task.due_date = due_date
+                task.due_date = new_due_date
                 task.priority = priority
                 task.categories = session.query(Category).filter(Category.id.in_(selected_categories_ids)).all()
 
-                # Update recurrence if it exists
-                if self.recurrence:
-                    if task.recurrence:
-                        task.recurrence.frequency = self.recurrence["frequency"]
-                        task.recurrence.times = self.recurrence["times"]
-                    else:
-                        recurrence = Recurrence(
-                            frequency=self.recurrence["frequency"],
-                            times=self.recurrence["times"]
-                        )
-                        session.add(recurrence)
-                        session.flush()  # Get recurrence ID
-                        task.recurrence_id = recurrence.id
-                else:
-                    task.recurrence = None  # Clear recurrence if none is selected
+                # Make the task repeat, update how it repeats, or stop it from repeating
+                if repeat:
+                    update_series(session, task, frequency, times if new_due_date else None)
             else:
                 task = Task(
                     name=name,
@@ -255,25 +266,22 @@ class EditTaskModal(ModalView):
                 )
                 task.categories = session.query(Category).filter(Category.id.in_(selected_categories_ids)).all()
                 session.add(task)
-                session.flush()  # Get task ID immediately
 
                 # Add recurrence if specified
-                if self.recurrence:
-                    recurrence = Recurrence(
-                        frequency=self.recurrence["frequency"],
-                        times=self.recurrence["times"]
-                    )
-                    session.add(recurrence)
-                    session.flush()
-                    task.recurrence_id = recurrence.id
+                update_series(session, task, frequency, times if due_date else None)
+                session.flush()  # Get task ID immediately
 
             # Commit the session
             session.commit()
 
-        if self.refresh_callback:
-            self.refresh_callback()
+            print(f"Task {'updated' if task_id else 'saved'} with ID: {task.id}")
 
-        print(f"Task {'updated' if self.task_id else 'saved'} with ID: {self.task_id or task.id}")
+        def saved(result):
+            if self.refresh_callback:
+                self.refresh_callback()
+
+        # Save on the worker thread, the to-do list is refreshed when it's saved
+        get_executor().submit(save, saved)
         self.dismiss()
 
     def open_repeat_window(self, instance):
@@ -290,18 +298,27 @@ class EditTaskModal(ModalView):
 
 
     def delete_task(self, *args):
-        """Delete the task from the database."""
+        """Delete the task (or, for a recurring task, the occurrence being edited) from the database."""
         if self.task_id:
-            with db.get_session() as session, session.begin():
-                task = session.query(Task).filter_by(id=self.task_id).first()
-                if task:
-                    session.delete(task)
-            print(f"Task with ID {self.task_id} deleted.")
+            task_id, occurrence_time = self.task_id, self.occurrence_time
 
-            # Call the refresh callback to update the ToDoListView after deletion
-            if self.refresh_callback:
-                self.refresh_callback()
+            def delete(session):
+                with session.begin():
+                    task = session.query(Task).filter_by(id=task_id).first()
+                    if task and occurrence_time:
+                        delete_occurrence(session, task, occurrence_time)
+                    elif task:
+                        delete_item(session, task)
+
+            def deleted(result):
+                print(f"Task with ID {task_id} deleted.")
+
+                # Call the refresh callback to update the ToDoListView after deletion
+                if self.refresh_callback:
+                    self.refresh_callback()
 
+            # Delete on the worker thread, the to-do list is refreshed when it's deleted
+            get_executor().submit(delete, deleted)
             self.dismiss()
 
     def open_date_picker(self, instance):
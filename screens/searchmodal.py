@@ -0,0 +1,188 @@
+# -----------------------------------------------------------------------------
+# Name: searchmodal.py
+# Description: This module defines the SearchModal class, a search-as-you-type
+#              modal that finds events and tasks by name, notes, place, and
+#              category names, and opens the one picked in its edit modal.
+# Date Created: October 18, 2026
+# Revision History:
+# - None
+#
+# Preconditions:
+# - Kivy framework must be installed and configured properly.
+# - The database must have the search index (see search.py, it's created with
+#   the schema).
+#
+# Postconditions:
+# - Picking a result dismisses the modal and opens the event's or task's edit
+#   modal.
+#
+# Error Handling:
+# - Errors raised by a search are printed to the console, the results shown
+#   don't change.
+#
+# Side Effects:
+# - Searches run on the data executor's worker thread, SEARCH_DELAY after the
+#   user stops typing.
+#
+# Known Faults:
+# - Results aren't updated when an item is edited from the modal, type again to
+#   search again.
+# -----------------------------------------------------------------------------
+
+# Import necessary Kivy modules and custom widgets
+from kivy.uix.modalview import ModalView  # Modal for searching
+from kivy.uix.boxlayout import BoxLayout  # Layout for organizing widgets
+from kivy.uix.gridlayout import GridLayout  # List of results
+from kivy.uix.scrollview import ScrollView  # To scroll through the results
+from kivy.uix.textinput import TextInput  # Input field for the search text
+from kivy.uix.label import Label  # Label widget for displaying text
+from kivy.app import App  # To access app-wide styles and modals
+from kivy.clock import Clock  # To search once the user stops typing
+from kivy.metrics import dp  # Import dp for density-independent pixel values
+from kivy.graphics import Color, RoundedRectangle  # For rounded rectangle shape
+from screens.usefulwidgets import UniformButton  # Styled button
+from Models.databaseEnums import ItemType  # To tell events and tasks apart
+from executor import get_executor  # To search on the worker thread
+from search import search_items  # Full-text search of events and tasks
+
+
+SEARCH_DELAY = 0.15 # seconds without typing before searching
+
+
+class SearchModal(ModalView):
+    """A modal to search events and tasks as you type."""
+
+    def __init__(self, **kwargs):
+        """
+        Initializes the SearchModal.
+
+        Args:
+            **kwargs: Additional keyword arguments passed to the superclass.
+
+        Postconditions:
+            - A modal with a search field and an (empty) list of results is displayed.
+        """
+        super().__init__(**kwargs)
+        self.size_hint = (0.9, 0.9)
+        self.searched_text = None  # Text of the results shown (or being searched for)
+        self.result_buttons = []  # Buttons of the results, reused by each search
+
+        # Access app-wide styles
+        app = App.get_running_app()
+
+        # Create the main layout for the modal
+        layout = BoxLayout(orientation='vertical', padding=10, spacing=10)
+
+        # Add a custom background color with rounded corners
+        with layout.canvas.before:
+            Color(rgba=app.Background_Color)  # Use the app's background color
+            self.bg_rect = RoundedRectangle(
+                pos=layout.pos,
+                size=layout.size,
+                radius=[dp(20)]
+            )
+
+        # Bind the position and size of the layout to update the background rectangle dynamically
+        layout.bind(pos=self.update_background, size=self.update_background)
+
+        # Search field, searches once the user stops typing
+        self.search_trigger = Clock.create_trigger(self.run_search, SEARCH_DELAY)
+        self.search_input = TextInput(hint_text="Search events and tasks", multiline=False, size_hint_y=None, height=dp(40))
+        self.search_input.bind(text=lambda *args: self.search_trigger())
+        layout.add_widget(self.search_input)
+
+        # What was found (or why nothing is shown)
+        self.status_label = Label(
+            text="Type at least 2 letters",
+            color=app.Text_Color,
+            font_size=app.button_font_size,
+            size_hint_y=None,
+            height=dp(30)
+        )
+        layout.add_widget(self.status_label)
+
+        # List of results
+        self.result_list = GridLayout(cols=1, spacing=dp(5), size_hint_y=None)
+        self.result_list.bind(minimum_height=self.result_list.setter('height'))
+        scroll_view = ScrollView()
+        scroll_view.add_widget(self.result_list)
+        layout.add_widget(scroll_view)
+
+        # Close button
+        layout.add_widget(UniformButton(text="CLOSE", on_release=self.dismiss, size_hint_y=None, height=dp(40)))
+
+        self.add_widget(layout)  # Add the layout to the modal
+        self.bind(on_open=lambda *args: setattr(self.search_input, 'focus', True))
+
+    def run_search(self, *args):
+        """Search for the text typed (on the data executor's thread), the last search typed replaces any pending one."""
+        search_text = self.search_input.text.strip()
+        if search_text == self.searched_text:
+            return
+
+        self.searched_text = search_text
+        get_executor().submit(
+            lambda session: search_items(session, search_text),
+            lambda results: self.show_results(search_text, results),
+            on_error=print,
+            key="search"  # typing more cancels searching for what was typed before
+        )
+
+    def show_results(self, search_text, results):
+        """
+        Display the results of a search if its text is still the one searched for.
+
+        Args:
+            search_text (str): the text searched for.
+            results (list[SearchResult]): what was found, best match first.
+        """
+        if search_text != self.searched_text:
+            return
+
+        if results:
+            self.status_label.text = f"{len(results)} found"
+        elif len(search_text) < 2:
+            self.status_label.text = "Type at least 2 letters"
+        else:
+            self.status_label.text = "Nothing found"
+
+        # Reuse the buttons of the last results, add any more needed
+        while len(self.result_buttons) < len(results):
+            button = UniformButton(size_hint_y=None, height=dp(40), halign='left', shorten=True, shorten_from='right')
+            button.bind(size=lambda button, size: setattr(button, 'text_size', (size[0] - dp(20), None)))
+            button.bind(on_release=self.open_result)
+            self.result_buttons.append(button)
+
+        self.result_list.clear_widgets()
+        for button, result in zip(self.result_buttons, results):
+            button.result = result
+            button.text = self.result_text(result)
+            self.result_list.add_widget(button)
+
+    def result_text(self, result):
+        """The text of a result's button, e.g. "Event: Lab report - 2024-12-09 10:00 @ Eaton 2" """
+        text = f"{'Event' if result.type == ItemType.EVENT else 'Task'}: {result.name}"
+        if result.time is not None:
+            text += result.time.strftime(" - %Y-%m-%d %H:%M")
+        if result.recurring:
+            text += " (repeats)"
+        if result.place:
+            text += f" @ {result.place}"
+
+        return text
+
+    def open_result(self, button):
+        """Close the search and open the picked event or task in its edit modal."""
+        result = button.result
+        app = App.get_running_app()
+        self.dismiss()
+
+        if result.type == ItemType.EVENT:
+            app.screen_manager.get_screen("calendar").open_edit_event_modal(result.id)
+        else:
+            app.open_edit_task_modal(result.id)
+
+    def update_background(self, *args):
+        """Update the size and position of the background rectangle."""
+        self.bg_rect.pos = self.pos
+        self.bg_rect.size = self.size
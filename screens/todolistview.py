@@ -20,6 +20,15 @@
 #   - December 07, 2024: Implemented variables for ease of UI modification - [Matthew McManness]
 #   - December 08, 2024: Removed update_task_order since we do not need that based on our requirements - [Manvir Kaur]
 #   - December 08, 2024: Theme toggling (Magaly Camacho)
+#   - October 18, 2026: Looked up the shared database with get_database() when a session is needed instead of at import time
+#   - October 18, 2026: Recurring tasks are expanded into their occurrences, checking or editing one occurrence only changes that occurrence
+#   - October 18, 2026: Task queries moved to queries.py, categories and recurrences are loaded in batches instead of one query per task
+#   - October 18, 2026: TaskBox widgets are kept by task and only created, updated, moved or removed when their task changed, instead of rebuilding the whole list
+#   - October 18, 2026: The task list is a RecycleView fed by TaskListAdapter, only the rows on screen have TaskBox widgets
+#   - October 18, 2026: Loading, sorting, filtering and checking off tasks run on the data executor's worker thread, results are shown on the UI thread
+#   - October 18, 2026: Task boxes are recolored in place when the theme is toggled
+#   - October 18, 2026: The tasks the list shows are loaded with occurrences.todo_list_tasks(), so benchmarks time the same code
+#   - October 18, 2026: Task list rows are matched by (task id, occurrence time) again, only the rows of tasks that changed are replaced in the RecycleView's data
 #  - [Insert Further Revisions]: [Brief description of changes] - [Your Name]
 # Preconditions:
 #   - This class should be part of a ScreenManager in the Kivy application to function correctly.
@@ -43,40 +52,52 @@
 # Imports
 from kivy.uix.screenmanager import Screen  # to manage screen
 from kivy.uix.boxlayout import BoxLayout  # base class for a task's box
+from kivy.uix.recycleview.views import RecycleDataViewBehavior  # so RecycleView can reuse a task's box for another task
 from kivy.uix.checkbox import CheckBox  # checkbox widget (to mark complete/incomplete)
 from kivy.uix.label import Label  # label widget to display text
 from kivy.graphics import Color, Rectangle  # to control color and size of task background
 from kivy.properties import ObjectProperty
-from database import get_database  # to connect to database
-from sqlalchemy import select  # to query database
+from executor import get_executor  # to query the database on the worker thread
 from Models import Task  # task model class
 from Models.databaseEnums import Priority  # for Task.priority
 from kivy.app import App
 from kivy.uix.dropdown import DropDown
-from sqlalchemy.orm import aliased
-from sqlalchemy.sql import func
-from Models import Category  # Ensure the Category model is imported
-from sqlalchemy.sql import case
+from queries import tasks_with_priority  # to-do list queries
 from kivy.uix.button import Button
-
-db = get_database()  # get database
+from occurrences import task_occurrences, todo_list_tasks, detach_occurrence  # to show and check off occurrences of recurring tasks
 
 class UniformButton(Button):
     pass
 class EditButton(UniformButton):
     pass
 
-class TaskBox(BoxLayout):
-    """A BoxLayout to hold task details"""
+class TaskBox(RecycleDataViewBehavior, BoxLayout):
+    """
+    A BoxLayout to hold task details. The task list is a RecycleView, so there's only a TaskBox for each row on
+    screen, and RecycleView reuses them for whichever tasks scroll into view (see refresh_view_attrs)
+    """
     task_id = ObjectProperty(None)
+    occurrence_time = ObjectProperty(None)  # which occurrence of a recurring task, None for a one-off task
     categories = ObjectProperty(None)
 
-    def __init__(self, on_click_callback, edit_callback, **kwargs):
-        """Initialize the TaskBox with a callback for clicks."""
+    def __init__(self, **kwargs):
+        """Initialize the TaskBox with its checkbox, labels and edit button, the task is set by refresh_view_attrs."""
+        kwargs.setdefault("padding", "15dp")
+        kwargs.setdefault("spacing", "5dp")
         super().__init__(**kwargs)
-        self.on_click_callback = on_click_callback  # Set the callback attribute
+        self.index = None  # index of the task in the RecycleView's data
+        self.recycleview = None  # the RecycleView showing this box
+        self.on_click_callback = None  # Set from the task's data
         self.check_box = None  # Placeholder for checkbox reference
-        self.edit_callback = edit_callback  # Callback for editing task
+        self.edit_callback = None  # Callback for editing task, set from the task's data
+        self.toggle_callback = None  # Callback for checking the task off, set from the task's data
+        self.shown = None  # What the box currently shows, so it isn't updated if the same task is shown again
+
+        # Task info, set from the task's data
+        self.name = ""
+        self.priority = None
+        self.due_date = "-"
+        self.complete = False
 
         # Attributes for drag-and-drop
         self.is_dragging = False
@@ -85,12 +106,74 @@ class TaskBox(BoxLayout):
         # Initialize the size and background color of the TaskBox
         with self.canvas.before:
             app = App.get_running_app()
-            Color(*app.Task_Box)
+            self.background = Color(*app.Task_Box)  # kept to change the color (e.g. greyed out) in place
             self.rect = Rectangle(size=self.size, pos=self.pos)
 
         # Update the rectangle size and position when TaskBox is resized
         self.bind(size=self.update_rect, pos=self.update_rect)
 
+        # Add checkbox for Task.complete and bind it to the task's toggle callback
+        self.add_checkbox(lambda instance: self.toggle_callback(instance, self.task_id, self))
+
+        # Add widgets to display task info
+        self.name_label = Label(size_hint_x=0.5, color=app.Text_Color)
+        self.due_date_label = Label(size_hint_x=0.3, color=app.Text_Color)
+        self.priority_label = Label(size_hint_x=0.1)
+        self.priority_label.id = "priority"
+        self.categories_label = Label(size_hint_x=0.5, color=app.Text_Color)
+        self.add_widget(self.name_label)
+        self.add_widget(self.due_date_label)
+        self.add_widget(self.priority_label)
+        self.add_widget(self.categories_label)
+
+        self.add_edit_button()
+        app.bind(current_theme=self.apply_theme)  # recolor the box in place when the theme is toggled
+
+    def apply_theme(self, *args):
+        """Color the box with the app's theme (show_task() checks the theme, so the labels and background are redone)."""
+        self.check_box.color = App.get_running_app().Checkbox_Color
+        self.show_task()
+
+    def refresh_view_attrs(self, rv, index, data):
+        """Show the task at the given index of the RecycleView's data (called by RecycleView when the box is reused)."""
+        self.index = index
+        self.recycleview = rv
+        super().refresh_view_attrs(rv, index, data)  # sets task_id, name, ... from the data
+        self.show_task()
+
+    def show_task(self):
+        """Update the labels, checkbox and colors to the current task, if anything changed (the theme counts, since it changes the colors)."""
+        app = App.get_running_app()
+        shown = (self.name, self.priority, self.due_date, self.categories, self.complete, app.current_theme)
+        if self.shown == shown:
+            return
+        self.shown = shown
+
+        # Check/update info to display None if needed
+        priority = self.priority
+        if priority is None:
+            priority = "-"
+            priority_color = app.Text_Color
+
+        # Get priority text and color
+        else:
+            priority, priority_color = Priority.get_str_and_color(priority)
+            priority_color = app.Priority_Colors[priority]
+
+        self.name_label.text = self.name
+        self.due_date_label.text = self.due_date or "-"
+        self.priority_label.text = priority
+        self.priority_label.color = priority_color
+        self.categories_label.text = self.categories or "-"
+
+        self.check_box.active = self.complete  # Set checkbox state
+
+        # Grey out task if complete
+        if self.complete:
+            self.grey_out()
+        else:
+            self.reset_appearance()
+
     def add_checkbox(self, callback):
         """Add a checkbox to the task box and bind it to a callback."""
         self.check_box = CheckBox(size_hint_x=0.1, color=App.get_running_app().Checkbox_Color)
@@ -101,11 +184,43 @@ class TaskBox(BoxLayout):
         """Adds an edit button for opening the edit modal."""
         edit_button = EditButton(
             text="Edit", 
-            on_release=lambda instance: self.edit_callback(self.task_id)
+            on_release=lambda instance: self.edit_callback(self.task_id, self.occurrence_time)
         )
         self.add_widget(edit_button)
         self.edit_button = edit_button
 
+    def grey_out(self):
+        """Grey out the task's appearance."""
+        app = App.get_running_app() # for theme settings
+        # Change text color to grey
+        for widget in self.children:
+            if isinstance(widget, EditButton):
+                continue
+
+            if isinstance(widget, Label):
+                widget.color = app.Box_Greyed_Out_Text #(0.5, 0.5, 0.5, 1)  # Grey color
+
+        # Change background color to a lighter grey
+        self.background.rgba = app.Box_Greyed_Out
+
+    def reset_appearance(self):
+        """Reset the task's appearance to its original color."""
+        app = App.get_running_app() # get app for theme config
+
+        # Reset text color 
+        for widget in self.children:
+            if isinstance(widget, EditButton):
+                continue
+
+            if isinstance(widget, Label):
+                if hasattr(widget, "id") and widget.id == "priority":
+                    widget.color = app.Priority_Colors.get(widget.text, app.Text_Color)  # "-" (no priority) uses the text color
+                else:
+                    widget.color = app.Text_Color  # Original black color
+
+        # Reset background color
+        self.background.rgba = app.Task_Box
+
     def update_rect(self, *args):
         """Update rectangle to match the size and position of the TaskBox."""
         self.rect.pos = self.pos
@@ -139,22 +254,105 @@ class TaskBox(BoxLayout):
         if self.is_dragging:
             self.is_dragging = False
 
-            # Check where the task was dropped
-            task_list = self.parent
-            siblings = [child for child in task_list.children if isinstance(child, TaskBox)]
+            # Check where the task was dropped (the index of the row under the box's center)
+            layout = self.recycleview.layout_manager
+            new_index = layout.get_view_index_at(self.center)
 
-            # Find the new position based on Y coordinates
-            siblings.sort(key=lambda child: child.center_y, reverse=True)
-
-            # Reorder the tasks in the UI
-            task_list.clear_widgets()
-            for sibling in siblings:
-                task_list.add_widget(sibling)
+            # Move the task in the data, RecycleView lays the rows out again
+            TaskListAdapter(self.recycleview).move(self.index, new_index)
 
             return True
         return super().on_touch_up(touch)
-        
-            
+
+
+class TaskListAdapter:
+    """
+    Adapter between the tasks and the task list RecycleView's data: one dict per row, with the attributes TaskBox
+    shows. Changing the data is all it takes to change the list, RecycleView updates the rows on screen
+    """
+    def __init__(self, recycleview, list_view=None):
+        """
+        Args:
+            recycleview (RecycleView): the task list (anything with a data list works, e.g. for benchmarks)
+            list_view (ToDoListView): the screen handling clicks, edits and checkboxes (optional)
+        """
+        self.recycleview = recycleview
+        self.list_view = list_view
+
+    def row(self, task_id, name, priority=None, due_date=None, categories=None, complete=False, occurrence_time=None):
+        """Returns the data of one row"""
+        return {
+            "task_id": task_id,
+            "occurrence_time": occurrence_time,
+            "name": name,
+            "priority": priority,
+            "due_date": due_date if due_date is not None else "-",
+            "categories": categories if categories is not None else "-",
+            "complete": complete,
+            "on_click_callback": self.list_view.on_task_click if self.list_view else None,
+            "edit_callback": self.list_view.on_edit_task_click if self.list_view else None,
+            "toggle_callback": self.list_view.toggle_complete if self.list_view else None,
+        }
+
+    def task_row(self, task):
+        """Returns the data of the row of a TaskOccurrence"""
+        # Format due date as a string, or set to "-" if None
+        due_date = task.due_date.strftime("%Y-%m-%d %H:%M") if task.due_date else "-"
+
+        # Format categories as a comma-separated string, or set to "-" if none exist
+        categories = ", ".join(task.categories) if task.categories else "-"
+
+        return self.row(task.id, task.name, task.priority, due_date, categories, task.complete, task.occurrence_time)
+
+    @staticmethod
+    def key(row):
+        """Returns what identifies a row: its task id and occurrence time (None for a one-off task)"""
+        return row["task_id"], row["occurrence_time"]
+
+    def set_tasks(self, tasks):
+        """
+        Show the given TaskOccurrences, in order. Rows are matched to the shown ones by key: if the list shows the
+        same tasks in the same order (e.g. after a task was checked off or edited), only the rows whose data changed
+        are replaced, so RecycleView only refreshes those. Otherwise (tasks added, removed or sorted) the data is
+        replaced
+        """
+        rows = [self.task_row(task) for task in tasks]
+        data = self.recycleview.data
+
+        if [self.key(row) for row in data] != [self.key(row) for row in rows]:
+            self.recycleview.data = rows
+            return
+
+        for index, row in enumerate(rows):
+            if data[index] != row:
+                data[index] = row
+
+    def append(self, row):
+        """Show one more row at the bottom of the list"""
+        self.recycleview.data.append(row)
+
+    def update(self, index, **changes):
+        """Change the data of a row (it's shown the next time a box is refreshed with it)"""
+        self.recycleview.data[index].update(changes)
+
+    def find(self, task_id, occurrence_time=None):
+        """Returns the index of a task's row, None if it's not in the list"""
+        for index, row in enumerate(self.recycleview.data):
+            if row["task_id"] == task_id and row["occurrence_time"] == occurrence_time:
+                return index
+
+    def move(self, index, new_index):
+        """Move a row to a new index (clamped to the list), or just lay the list out again if it didn't move"""
+        data = self.recycleview.data
+        new_index = min(max(new_index or 0, 0), len(data) - 1)
+
+        if index is None or new_index == index:
+            self.recycleview.refresh_from_layout()  # put the row back in place
+            return
+
+        data.insert(new_index, data.pop(index))
+
+
 class ToDoListView(Screen):
     """A screen for displaying the To-Do List."""
 
@@ -165,107 +363,51 @@ class ToDoListView(Screen):
         self.current_sort = "Due Date"  # Default sorting criterion
 
 
-    def add_task(self, task_id, name, priority=None, due_date=None, categories=None, complete=False):
+    def add_task(self, task_id, name, priority=None, due_date=None, categories=None, complete=False, occurrence_time=None):
         """Add a new task to the to-do list."""
-        app = App.get_running_app()
-        # Create a TaskBox and pass `on_task_click` as the click callback
-        task_box = TaskBox(on_click_callback=self.on_task_click, edit_callback=self.on_edit_task_click, padding="15dp", spacing="5dp", size_hint_y=None, height="60dp", size_hint_x=1)
-        task_box.task_id = task_id
-
-        # Add checkbox for Task.complete and bind it to toggle_complete
-        task_box.add_checkbox(lambda instance: self.toggle_complete(instance, task_id, task_box))
-        task_box.check_box.active = complete  # Set initial checkbox state
-
-        # Check/update info to display None if needed
-        if due_date is None:
-            due_date = "-" 
-        if categories is None:
-            categories = "-" 
-        if priority is None:
-            priority = "-"
-            priority_color = app.Text_Color
-
-        # Get priority text and color
-        else:
-            priority, priority_color = Priority.get_str_and_color(priority)
-            priority_color = app.Priority_Colors[priority]
-
-        priority_label = Label(text=priority, size_hint_x=0.1, color=priority_color)
-        priority_label.id = "priority"
-
-        # Add widgets to display task info
-        task_box.add_widget(Label(text=name, size_hint_x=0.5, color=app.Text_Color))
-        task_box.add_widget(Label(text=due_date, size_hint_x=0.3, color=app.Text_Color))
-        task_box.add_widget(priority_label)
-        task_box.add_widget(Label(text=categories, size_hint_x=0.5, color=app.Text_Color))
-        
-        task_box.add_edit_button()
+        adapter = TaskListAdapter(self.ids.task_list, self)
+        adapter.append(adapter.row(task_id, name, priority, due_date, categories, complete, occurrence_time))
 
-        # Grey out task if already complete
-        if complete:
-            self.grey_out_task(task_box)
+        print(f"Added task: {task_id}")  # Log the task addition
 
-        # Add task box to task list layout
-        self.ids.task_list.add_widget(task_box)
+    def show_tasks(self, tasks):
+        """
+        Show the given tasks in order. The task list is a RecycleView, so this only sets its data (only the rows of
+        tasks that changed, see TaskListAdapter.set_tasks), and only the rows on screen have widgets (TaskBoxes that
+        are reused as the list is scrolled).
 
-        print(f"Added task: {task_id}")  # Log the task addition
+        Args:
+            tasks (list[TaskOccurrence]): the tasks to show, in order
+        """
+        TaskListAdapter(self.ids.task_list, self).set_tasks(tasks)
 
     def populate(self):
         """
         Populate the ToDoListView with tasks from the database, sorted based on the current_sort attribute.
         
         Postconditions:
-            - Retrieves all tasks, including those created through recurrence.
+            - Retrieves all tasks, with recurring tasks expanded into their occurrences.
             - Tasks are displayed in the to-do list, ordered by due date.
         """
-        with db.get_session() as session:
-            stmt = None  # Initialize stmt to avoid UnboundLocalError
-
-            # Determine sorting order based on the selected option
-            if self.current_sort == "Priority":
-                # Define custom priority order: High (1), Medium (2), Low (3), None (-) as 4
-                priority_order = case(
-                    (Task.priority == 'HIGH', 1),
-                    (Task.priority == 'MEDIUM', 2),
-                    (Task.priority == 'LOW', 3),
-                    else_=4  # For tasks without a priority, assign the lowest order
-                )
-                stmt = select(Task).order_by(priority_order)
-            elif self.current_sort == "Due Date":
-                stmt = select(Task).order_by(Task.due_date.asc())
-            elif self.current_sort == "Category":
-                # Sort by the name of the first associated category
-                stmt = (
-                    select(Task)
-                    .outerjoin(Task.categories)  # Join tasks with categories
-                    .order_by(func.coalesce(Category.name, "").asc())  # Order by category name, null-safe
-                )
-            else:
-                # Default to sorting by Due Date
-                stmt = select(Task).order_by(Task.due_date.asc())
-
-            # Fetch tasks from the database
-            tasks = session.scalars(stmt).all()
+        sort = self.current_sort
 
+        def load(session):
+            # Fetch tasks sorted by the selected option, with recurring tasks expanded into their occurrences
+            return todo_list_tasks(session, sort)
+
+        def show(tasks):
             # Debugging: Print fetched tasks and their sort order
-            print(f"Sorting by: {self.current_sort}")
+            print(f"Sorting by: {sort}")
             for task in tasks:
-                category_names = [cat.name for cat in task.categories] if task.categories else "-"
+                category_names = task.categories or "-"
                 print(f"Task: {task.name}, Priority: {task.priority}, Due Date: {task.due_date}, Categories: {category_names}")
 
-            # Clear the current task list
-            self.ids.task_list.clear_widgets()
+            # Replace the rows of tasks that changed (or all the data, if tasks were added, removed or moved),
+            # TaskBox.refresh_view_attrs skips the rows on screen whose shown tuple didn't change
+            self.show_tasks(tasks)
 
-            # Add each task to the list view
-            for task in tasks:
-                # Format due date as a string, or set to "-" if None
-                due_date = task.due_date.strftime("%Y-%m-%d %H:%M") if task.due_date else "-"
-
-                # Format categories as a comma-separated string, or set to "-" if none exist
-                categories = ", ".join([cat.name for cat in task.categories]) if task.categories else "-"
-
-                # Add the task to the view
-                self.add_task(task.id, task.name, task.priority, due_date, categories, complete=task.complete)
+        # Load on the worker thread, a newer load (sort or filter) replaces this one
+        get_executor().submit(load, show, key="todo-tasks")
 
     def on_task_click(self, task_id):
         """Open the EditTaskModal for the clicked task."""
@@ -275,20 +417,44 @@ class ToDoListView(Screen):
     
     def refresh_tasks(self):
         """Refresh the list of tasks by reloading from the database."""
-        self.ids.task_list.clear_widgets()  # Clear the current list
-        self.populate()  # Re-populate with updated data from the database
+        self.populate()  # Re-populate with updated data from the database (only changed tasks are redrawn)
 
     def toggle_complete(self, checkbox, task_id, task_box):
-        """Toggle the completion status of a task."""
+        """Toggle the completion status of a task (an occurrence of a recurring task becomes a one-off task)."""
         complete = checkbox.active  # True if checked, False if unchecked
 
-        # Update the task in the database
-        with db.get_session() as session:
+        adapter = TaskListAdapter(self.ids.task_list, self)
+        occurrence_time = task_box.occurrence_time
+
+        def save(session):
             task = session.query(Task).filter_by(id=task_id).first()
-            if task:
+            if task and occurrence_time:
+                task = detach_occurrence(session, task, occurrence_time)
+                task.complete = complete
+                session.commit()
+                return task.id
+            elif task:
                 task.complete = complete  # Assume `complete` is a field in the Task model
                 session.commit()
 
+        def detached(new_id):
+            # the row now shows the one-off task (if the row is still in the list)
+            if new_id is None:
+                return
+            index = adapter.find(task_id, occurrence_time)
+            if index is not None:
+                adapter.update(index, task_id=new_id, occurrence_time=None)
+            if task_box.task_id == task_id and task_box.occurrence_time == occurrence_time:
+                task_box.task_id = new_id
+                task_box.occurrence_time = None
+
+        # Update the task in the database on the worker thread, the row is updated right away
+        get_executor().submit(save, detached)
+
+        # Keep the row's data in sync, the box is reused for other tasks when the list scrolls
+        task_box.complete = complete
+        adapter.update(task_box.index, complete=complete)
+
         # Update the visual appearance of the task
         if complete:
             # Set text and background color to greyed-out
@@ -299,46 +465,11 @@ class ToDoListView(Screen):
 
     def grey_out_task(self, task_box):
         """Grey out the task's appearance."""
-        app = App.get_running_app() # for theme settings
-        # Change text color to grey
-        for widget in task_box.children:
-            if isinstance(widget, EditButton):
-                continue
-
-            if isinstance(widget, Label):
-                widget.color = app.Box_Greyed_Out_Text #(0.5, 0.5, 0.5, 1)  # Grey color
-
-        # Change background color to a lighter grey
-        with task_box.canvas.before:
-            Color(*app.Box_Greyed_Out)
-            task_box.rect = Rectangle(size=task_box.size, pos=task_box.pos)
-
-        # Bind update_rect on task_box to keep the grey background consistent
-        task_box.bind(size=task_box.update_rect, pos=task_box.update_rect)
-
+        task_box.grey_out()
 
     def reset_task_appearance(self, task_box):
         """Reset the task's appearance to its original color."""
-        app = App.get_running_app() # get app for theme config
-
-        # Reset text color 
-        for widget in task_box.children:
-            if isinstance(widget, EditButton):
-                continue
-
-            if isinstance(widget, Label):
-                if hasattr(widget, "id") and widget.id == "priority":
-                    widget.color = app.Priority_Colors[widget.text]
-                else:
-                    widget.color = app.Text_Color  # Original black color
-
-        # Reset background color
-        with task_box.canvas.before:
-            Color(*app.Task_Box)
-            task_box.rect = Rectangle(size=task_box.size, pos=task_box.pos)
-
-        # Bind update_rect on task_box to maintain the white background
-        task_box.bind(size=task_box.update_rect, pos=task_box.update_rect)
+        task_box.reset_appearance()
 
     def sort_tasks(self, sort_option):
         """
@@ -366,21 +497,7 @@ class ToDoListView(Screen):
         # Handle the "-" option to display tasks with no priority
         if priority_filter == "-":
             print("Displaying tasks with no priority.")
-            with db.get_session() as session:
-                tasks = session.query(Task).filter(Task.priority == None).all()  # Fetch tasks with NULL priority
-
-                # Debugging: Log tasks with no priority
-                print(f"Tasks with no priority:")
-                for task in tasks:
-                    print(f"Task: {task.name}, Priority: {task.priority}")
-
-                # Clear the current task list and add filtered tasks
-                self.ids.task_list.clear_widgets()
-                for task in tasks:
-                    due_date = task.due_date.strftime("%Y-%m-%d %H:%M") if task.due_date else "-"
-                    categories = ", ".join([cat.name for cat in task.categories]) if task.categories else "-"
-                    self.add_task(task.id, task.name, task.priority, due_date, categories, complete=task.complete)
-
+            self.show_filtered_tasks(None, "Tasks with no priority:")
             return  # Exit the method after handling "-"
 
         try:
@@ -391,23 +508,34 @@ class ToDoListView(Screen):
             return
 
         # Query tasks filtered by the selected priority
-        with db.get_session() as session:
-            tasks = session.query(Task).filter_by(priority=priority_enum).all()
+        self.show_filtered_tasks(priority_enum, f"Filtering tasks by priority: {priority_filter}")
+
+    def show_filtered_tasks(self, priority, message):
+        """
+        Load the tasks with a priority on the worker thread, then show them.
+
+        Args:
+            priority (Priority): the priority to show, None for tasks with no priority
+            message (str): logged before the tasks
+        """
+        def load(session):
+            tasks = session.scalars(tasks_with_priority(priority)).all()
+            return task_occurrences(session, tasks)
 
+        def show(tasks):
             # Debugging: Log tasks for the selected priority
-            print(f"Filtering tasks by priority: {priority_filter}")
+            print(message)
             for task in tasks:
                 print(f"Task: {task.name}, Priority: {task.priority}")
 
-            # Clear the current task list and add filtered tasks
-            self.ids.task_list.clear_widgets()
-            for task in tasks:
-                due_date = task.due_date.strftime("%Y-%m-%d %H:%M") if task.due_date else "-"
-                categories = ", ".join([cat.name for cat in task.categories]) if task.categories else "-"
-                self.add_task(task.id, task.name, task.priority, due_date, categories, complete=task.complete)
+            # Show the filtered tasks
+            self.show_tasks(tasks)
+
+        # a newer load (sort or filter) replaces this one
+        get_executor().submit(load, show, key="todo-tasks")
 
-    def on_edit_task_click(self, task_id):
+    def on_edit_task_click(self, task_id, occurrence_time=None):
         """Opens the edit modal when the edit button is clicked."""
         print(f"Edit button clicked for task with ID: {task_id}")
         app = App.get_running_app()
-        app.open_edit_task_modal(task_id)
+        app.open_edit_task_modal(task_id, occurrence_time)
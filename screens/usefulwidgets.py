@@ -16,6 +16,8 @@
 # - December 5, 2024: Updated the logic and UI for the RepeatOptionsModal to match what the group decided (Matthew McManness)
 # - December 7, 2024: Implemented variables for ease of UI modification (Matthew McManness)
 # - December 8, 2024: Theme toggling (Magaly Camacho)
+# - October 18, 2026: Looked up the shared database with get_database() when a session is needed instead of at import time
+# - October 18, 2026: Added repeat_text() and parse_repeat_text() to RepeatOptionsModal so modals agree on the repeat button format
 #
 # Preconditions:
 # - Kivy framework must be installed and functional.
@@ -64,8 +66,6 @@ class UniformSpinner(Spinner):
 # Set the first day of the week to Sunday
 calendar.setfirstweekday(calendar.SUNDAY)
 
-db = get_database() # get database
-
 
 
 
@@ -463,6 +463,34 @@ class RepeatOptionsModal(ModalView):
         if current_value > 1:
             self.times_input.text = str(current_value - 1)
 
+    @staticmethod
+    def repeat_text(frequency, times):
+        """
+        Returns the repeat button text for a recurrence, in the format save() uses.
+
+        Args:
+            frequency (Frequency): How often it repeats (None if it doesn't).
+            times (int): How many times it repeats.
+        """
+        if frequency is None or Frequency.is_no_repeat(frequency):
+            return Frequency.frequency_options()[0]
+
+        return f"Repeats {Frequency.enum2str(frequency)} {times} times"
+
+    @staticmethod
+    def parse_repeat_text(text):
+        """
+        Returns (frequency, times) from the repeat button text, or (None, None) if it doesn't repeat.
+
+        Args:
+            text (str): The repeat button text, e.g. "Repeats Daily 3 times" or "Never Repeats".
+        """
+        repeat_info = text.split(" ")
+        if len(repeat_info) != 4:
+            return None, None
+
+        return Frequency.str2enum(repeat_info[1]), int(repeat_info[2])
+
     def save(self, instance):
         """Save the repeat settings and update the parent modal."""
         repeat_text = self.repeats_spinner.text
@@ -615,7 +643,7 @@ class CategoryModal(ModalView):
             category_object = Category(name=new_category) # make a category object
 
             # save new category
-            with db.get_session() as session: # connect to database with a session
+            with get_database().get_session() as session: # connect to database with a session
                 with session.begin(): # start transaction (auto commits)
                     session.add(category_object) # insert new category
                 
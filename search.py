@@ -0,0 +1,209 @@
+"""
+    Name: Search
+    Description: Full-text search of events and tasks by name, notes, place, and category names. The Item_Search FTS5
+                 table has one row per item (its rowid is the item's id), kept in sync with Item, Event_, Category, and
+                 Item_Category by triggers, so ORM writes, bulk inserts, and migrations all keep it up to date.
+                 Searches match every word of the text as a prefix ("lab rep" finds "Lab report"). Matches are ranked
+                 in SQL by where they match: names starting with the first word, then names with every word, then
+                 every word in the name or category names, then also the place, then anywhere (notes too). Each rank
+                 is its own FTS5 query limited after ranking, so the best matches are found however old they are.
+                 bm25() isn't used, it scores every match of each word before the limit (about 90 ms for a word half
+                 of 100k items have, the budget is 10 ms)
+
+    Date Created: 10/18/2026
+    Revisions:
+        - None
+
+    Usage:
+        with get_database().get_session() as session:
+            results = search_items(session, "lab rep")
+
+    Preconditions:
+        - SQLAlchemy must be installed and configured in the environment
+        - SQLite must have the FTS5 extension (Python's bundled SQLite does)
+        - Models and Enums must be implemented
+    Postconditions:
+        - None
+    Errors/Exceptions:
+        - OperationalError if SQLite doesn't have FTS5 (when the search index is created)
+    Side Effects:
+        - create_search_index() creates the table and triggers if they don't exist
+    Invariants:
+        - Item_Search has exactly one row per item, with the item's current name, notes, place, and category names
+    Known Faults:
+        - Matches of the same rank are shown newest first, so when more of them than the limit match (e.g. "meeting"
+          in the names of most items), the older ones of that rank aren't shown, more words narrow it down
+        - Words are split by SQLite's unicode61 tokenizer, so text inside words (e.g. "port" in "report") isn't found
+"""
+
+
+# Imports
+import re
+from datetime import datetime
+from typing import NamedTuple, Optional
+from sqlalchemy import select, text
+from sqlalchemy.engine import Connection
+from sqlalchemy.orm import Session
+from Models import Event_, Task
+from Models.item import Item
+from Models.databaseEnums import ItemType
+
+
+SEARCH_TABLE = "Item_Search" # FTS5 table of the search index (with prefix indexes, so typed prefixes of up to 10
+                              # letters are looked up instead of merging every word they start)
+MIN_PREFIX = 2 # shortest word searched for, a single letter matches most items
+MAX_RESULTS = 50 # results returned by default
+RANKS = ( # FTS5 queries of each rank of matches, best first, for the query of every word (each includes the ones before)
+    "name : (^ {query})", # the name starts with the first word (and has the others)
+    "name : ({query})", # every word is in the name
+    "{{name categories}} : ({query})", # ... or the category names
+    "{{name categories place}} : ({query})", # ... or the place
+    "{query}", # ... or the notes
+)
+
+# Rows of the search index for the items matching a condition on i (Item)
+_ITEM_ROWS = f"""
+    INSERT INTO {SEARCH_TABLE} (rowid, name, notes, place, categories)
+    SELECT i.id, i.name, i.notes, e.place,
+           (SELECT group_concat(c.name, ' ') FROM Item_Category ic JOIN Category c ON c.id = ic.category_id WHERE ic.item_id = i.id)
+    FROM Item i LEFT JOIN Event_ e ON e.id = i.id
+    WHERE {{condition}};
+"""
+
+def _reindex(condition:str) -> str:
+    """Statements that replace the index rows of the items matching condition (on i.id / rowid)"""
+    return f"DELETE FROM {SEARCH_TABLE} WHERE rowid IN (SELECT i.id FROM Item i WHERE {condition});" + _ITEM_ROWS.format(condition=condition)
+
+
+SEARCH_SCHEMA = [
+    f"""CREATE VIRTUAL TABLE IF NOT EXISTS {SEARCH_TABLE} USING fts5(
+        name, notes, place, categories,
+        tokenize = 'unicode61 remove_diacritics 2',
+        prefix = '2 3 4 5 6 7 8 9 10'
+    )""",
+
+    # item added (its row is indexed once its event's or task's row is added, right after it) or changed
+    f"""CREATE TRIGGER IF NOT EXISTS Item_Search_event_insert AFTER INSERT ON Event_ BEGIN
+        {_ITEM_ROWS.format(condition="i.id = NEW.id")}
+    END""",
+    f"""CREATE TRIGGER IF NOT EXISTS Item_Search_task_insert AFTER INSERT ON Task BEGIN
+        {_ITEM_ROWS.format(condition="i.id = NEW.id")}
+    END""",
+    f"""CREATE TRIGGER IF NOT EXISTS Item_Search_item_update AFTER UPDATE OF name, notes ON Item BEGIN
+        {_reindex("i.id = NEW.id")}
+    END""",
+    f"""CREATE TRIGGER IF NOT EXISTS Item_Search_event_update AFTER UPDATE OF place ON Event_ BEGIN
+        {_reindex("i.id = NEW.id")}
+    END""",
+    f"""CREATE TRIGGER IF NOT EXISTS Item_Search_item_delete AFTER DELETE ON Item BEGIN
+        DELETE FROM {SEARCH_TABLE} WHERE rowid = OLD.id;
+    END""",
+
+    # item's categories (links added before its event's or task's row, like bulk inserts do, are indexed with it),
+    # and category names
+    f"""CREATE TRIGGER IF NOT EXISTS Item_Search_item_category_insert AFTER INSERT ON Item_Category
+    WHEN EXISTS (SELECT 1 FROM {SEARCH_TABLE} WHERE rowid = NEW.item_id) BEGIN
+        {_reindex("i.id = NEW.item_id")}
+    END""",
+    f"""CREATE TRIGGER IF NOT EXISTS Item_Search_item_category_delete AFTER DELETE ON Item_Category BEGIN
+        {_reindex("i.id = OLD.item_id")}
+    END""",
+    f"""CREATE TRIGGER IF NOT EXISTS Item_Search_category_update AFTER UPDATE OF name ON Category BEGIN
+        {_reindex("i.id IN (SELECT item_id FROM Item_Category WHERE category_id = NEW.id)")}
+    END""",
+]
+
+
+class SearchResult(NamedTuple):
+    """An item found by search_items(), best match first"""
+    id: int
+    type: ItemType
+    name: str
+    time: Optional[datetime] # event's start time or task's due date (the first occurrence of a series)
+    place: Optional[str] # events only
+    recurring: bool
+
+
+def create_search_index(connection:Connection, rebuild:bool=False):
+    """
+    Create the search index and its triggers if they don't exist
+
+    Parameters:
+        connection (Connection): connection to create them with (in its transaction)
+        rebuild (bool): whether to index every item again, e.g. items written before the index existed
+    """
+    for statement in SEARCH_SCHEMA:
+        connection.exec_driver_sql(statement)
+
+    if rebuild:
+        connection.exec_driver_sql(f"DELETE FROM {SEARCH_TABLE}")
+        connection.exec_driver_sql(_ITEM_ROWS.format(condition="1"))
+
+
+def match_query(search_text:str) -> Optional[str]:
+    """
+    The FTS5 query for what the user typed: every word, as a prefix. Words shorter than MIN_PREFIX are left out
+    unless they're followed by more text, so a first letter alone doesn't match most items
+
+    Parameters:
+        search_text (str): what the user typed, e.g. "Lab rep"
+
+    Returns:
+        str: the query, e.g. '"lab"* "rep"*', None if there's nothing to search for
+    """
+    words = re.findall(r"\w+", search_text.lower())
+    if not words or (len(words) == 1 and len(words[0]) < MIN_PREFIX):
+        return None
+
+    return " ".join(f'"{word}"*' for word in words)
+
+
+def search_items(session:Session, search_text:str, limit:int=MAX_RESULTS) -> list[SearchResult]:
+    """
+    Searches events and tasks by name, notes, place, and category names
+
+    Parameters:
+        session (Session): session to search with
+        search_text (str): what the user typed, every word must match the start of a word
+        limit (int): most results returned
+
+    Returns:
+        list[SearchResult]: the best matches first (then the newest), empty if there's nothing to search for
+    """
+    query = match_query(search_text)
+    if query is None:
+        return []
+
+    def matches(rank:str) -> list[int]:
+        """The newest limit items of a rank"""
+        return session.execute(text(
+            f"SELECT rowid FROM {SEARCH_TABLE} WHERE {SEARCH_TABLE} MATCH :match ORDER BY rowid DESC LIMIT :limit"
+        ), {"match": rank.format(query=query), "limit": limit}).scalars().all()
+
+    # the best ranks first, newest first in a rank. A rank's matches include the ones before, so each query asks for
+    # limit rows, enough for the ones still needed after skipping those already found. Names starting with the first
+    # word are the slowest to find (every match of the word is read), they aren't looked for if no name matches
+    names = matches(RANKS[1])
+    ids = list(dict.fromkeys((matches(RANKS[0]) if names else []) + names))
+    for rank in RANKS[2:]:
+        if len(ids) >= limit:
+            break
+        found = set(ids)
+        ids.extend(item_id for item_id in matches(rank) if item_id not in found)
+    ids = ids[:limit]
+    if not ids:
+        return []
+
+    # their details
+    item, event, task = Item.__table__, Event_.__table__, Task.__table__
+    rows = session.execute(
+        select(item.c.id, item.c.type, item.c.name, event.c.start_time, task.c.due_date, event.c.place, item.c.recurrence_id)
+        .select_from(item.outerjoin(event, event.c.id == item.c.id).outerjoin(task, task.c.id == item.c.id))
+        .where(item.c.id.in_(ids))
+    ).all()
+
+    results = {
+        row.id: SearchResult(row.id, row.type, row.name, row.start_time or row.due_date, row.place, row.recurrence_id is not None)
+        for row in rows
+    }
+    return [results[item_id] for item_id in ids if item_id in results]